@@ -1,8 +1,8 @@
 import bernstein_matrix as bm
 import bernstein_matrix_determinant
 import bernstein_matrix_inverse
-import bernstein_poly_ab
 import bernstein_poly_ab_approx
+import bernstein_poly_ab_approx_2d
 import math
 import numpy as np
 import matplotlib.pyplot as plt
@@ -23,7 +23,7 @@ def one_variable(input_n):
         ydata[i] = np.cos(2 * np.pi * xdata[i])
     nval = 501
     xval = np.linspace(lower_bound, upper_bound, nval)
-    yval = bernstein_poly_ab_approx.bernstein_poly_ab_approx(input_n, lower_bound, upper_bound, ydata, nval, xval)
+    yval = bernstein_poly_ab_approx.bernstein_poly_ab_approx(input_n, lower_bound, upper_bound, ydata, nval, xval, cache=True)
     error_max = max(abs(yval-(np.cos(2 * np.pi * xval))))
     print('%4d %14.6g' % (input_n, error_max))
     ax.plot(xval, yval,'-')
@@ -50,22 +50,11 @@ def two_variables(input_n):
     nval = 251
     xval = np.linspace(lower_bound, upper_bound, nval)
     yval = np.linspace(lower_bound, upper_bound, nval)
-    zval = np.zeros((nval, nval))
-    bvec = np.zeros((input_n + 1, input_n + 1))
-    for i in range (0, nval):
-        b1vec = bernstein_poly_ab.bernstein_poly_ab(input_n, lower_bound, upper_bound, xval[i])
-        for j in range(0, nval):
-            b2vec = bernstein_poly_ab.bernstein_poly_ab(input_n, lower_bound, upper_bound, yval[j])
-            for k in range(0, input_n + 1):
-                for l in range(0, input_n + 1):
-                    bvec[k, l] = b1vec[k] * b2vec[l]
-
-    error_max_1 = np.zeros(nval)
-    error_max_2 = np.zeros(nval)
-    for i in range(0, nval):
-        error_max_1[i] = max(abs(zval[i, :] - ((1 + xval * yval) / (1 + (pow(xval, 2) * pow(yval, 2) * np.sin(pow(xval, 2) * pow(yval, 2)))))))
-        error_max_2[i] = max(abs(zval[:, i] - ((1 + xval * yval) / (1 + (pow(xval, 2) * pow(yval, 2) * np.sin(pow(xval, 2) * pow(yval, 2)))))))   
-    ax.contour3D(xval, yval, zval, 50, cmap='binary')
+    zval = bernstein_poly_ab_approx_2d.bernstein_poly_ab_approx_2d(input_n, input_n, lower_bound, upper_bound, lower_bound, upper_bound, zdata, nval, xval, nval, yval)
+    xgrid, ygrid = np.meshgrid(xval, yval, indexing='ij')
+    error_max = np.max(abs(zval - ((1 + xgrid * ygrid) / (1 + (pow(xgrid, 2) * pow(ygrid, 2) * np.sin(pow(xgrid, 2) * pow(ygrid, 2)))))))
+    print('%4d %14.6g' % (input_n, error_max))
+    ax.contour3D(xgrid, ygrid, zval, 50, cmap='binary')
 
 num_of_variables = int(input("Write 1 for Bernstein polynomials of one variable, or 2 for two variables: "))
 if(num_of_variables == 1):
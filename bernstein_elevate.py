@@ -0,0 +1,135 @@
+#! /usr/bin/env python
+#
+def bernstein_elevate ( ydata, r = 1 ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_ELEVATE raises the degree of a Bernstein polynomial.
+#
+#  Discussion:
+#
+#    A polynomial of degree N, with Bernstein coefficients Y(0:N), has
+#    the Bernstein coefficients of degree N+1
+#
+#      Z(I) = I/(N+1) * Y(I-1) + ( 1 - I/(N+1) ) * Y(I),  0 <= I <= N+1
+#
+#    where the terms involving Y(-1) and Y(N+1) are omitted.  This step
+#    costs O(N), and is repeated R times.  The interval on which the
+#    polynomial is based does not matter.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Reference:
+#
+#    Gerald Farin,
+#    Curves and Surfaces for Computer Aided Geometric Design,
+#    Academic Press, 1997,
+#    ISBN: 0-12-249054-1.
+#
+#  Parameters:
+#
+#    Input, real YDATA(N+1), the Bernstein coefficients, or an array of
+#    shape (K,N+1), each row of which holds a separate polynomial.
+#
+#    Input, integer R, the number of degrees to add.  R must be at least 0.
+#
+#    Output, real ZDATA(N+R+1), or ZDATA(K,N+R+1), the Bernstein
+#    coefficients of degree N+R of the same polynomial.
+#
+  import numpy as np
+  from sys import exit
+
+  if ( r < 0 ):
+    print ( '' )
+    print ( 'BERNSTEIN_ELEVATE - Fatal error!' )
+    print ( '  R = %d < 0.' % ( r ) )
+    exit ( 'BERNSTEIN_ELEVATE - Fatal error!' )
+
+  zdata = np.array ( ydata, dtype = np.float64 )
+
+  for step in range ( 0, r ):
+
+    n = zdata.shape[-1] - 1
+    t = np.arange ( 1, n + 1 ) / ( n + 1 )
+
+    z = np.zeros ( zdata.shape[0:-1] + ( n + 2, ) )
+    z[...,0] = zdata[...,0]
+    z[...,1:n+1] = t * zdata[...,0:n] + ( 1.0 - t ) * zdata[...,1:n+1]
+    z[...,n+1] = zdata[...,n]
+
+    zdata = z
+
+  return zdata
+
+def bernstein_elevate_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_ELEVATE_TEST tests BERNSTEIN_ELEVATE.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  from bernstein_poly_ab_approx import bernstein_poly_ab_approx
+
+  print ( '' )
+  print ( 'BERNSTEIN_ELEVATE_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_ELEVATE raises the degree of a Bernstein polynomial.' )
+#
+#  X^2 on [0,1] has the coefficients 0, 0, 1 of degree 2.
+#
+  ydata = np.array ( [ 0.0, 0.0, 1.0 ] )
+
+  print ( '' )
+  print ( '  X^2 on [0,1]:' )
+  print ( '' )
+  for r in range ( 0, 4 ):
+    zdata = bernstein_elevate ( ydata, r )
+    print ( '  Degree %d:' % ( 2 + r ), zdata )
+#
+#  Several polynomials at once.
+#
+  a = -1.0
+  b = 2.0
+  n = 10
+  ydata = np.random.default_rng ( 123456789 ).standard_normal ( ( 3, n + 1 ) )
+  nval = 101
+  xval = np.linspace ( a, b, nval )
+  yval = bernstein_poly_ab_approx ( n, a, b, ydata, nval, xval )
+
+  print ( '' )
+  print ( '  Three random polynomials of degree 10 on [-1,2]:' )
+  print ( '' )
+  print ( '     R    Max Difference in values' )
+  print ( '' )
+  for r in [ 1, 5, 30 ]:
+    zdata = bernstein_elevate ( ydata, r )
+    zval = bernstein_poly_ab_approx ( n + r, a, b, zdata, nval, xval )
+    print ( '  %4d  %14.6g' % ( r, np.max ( np.abs ( zval - yval ) ) ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_ELEVATE_TEST:' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_elevate_test ( )
+  timestamp ( )
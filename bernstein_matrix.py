@@ -17,6 +17,16 @@ def bernstein_matrix ( n ):
 #    The N power basis vectors are ordered as (1,X,X^2,...X^(N-1)) and the N 
 #    Bernstein basis vectors as ((1-X)^(N-1), X*(1-X)^(N-2),...,X^(N-1)).
 #
+#    The entries are
+#
+#      A(I,J) = (-1)^(J-I) * C(N-1-I,J-I) * C(N-1,I),  I <= J
+#
+#    and are assembled all at once from the table of binomial coefficients
+#    returned by R8_CHOOSE_TABLE.
+#
+#    Some entries exceed the real range for N >= 654.  They are then returned
+#    as infinite or NaN, and a warning is printed.
+#
 #  Example:
 #
 #    N = 5
@@ -33,7 +43,7 @@ def bernstein_matrix ( n ):
 #
 #  Modified:
 #
-#    15 March 2015
+#    17 October 2026
 #
 #  Author:
 #
@@ -46,15 +56,24 @@ def bernstein_matrix ( n ):
 #    Output, real A(N,N), the Bernstein matrix.
 #
   import numpy as np
-  from r8_choose import r8_choose
-  from r8_mop import r8_mop
+  from r8_choose_table import r8_choose_table
 
-  a = np.zeros ( ( n, n ) )
+  if ( n <= 0 ):
+    return np.zeros ( ( 0, 0 ) )
 
-  for j in range ( 0, n ):
-    for i in range ( 0, j + 1 ):
-      a[i,j] = r8_mop ( j - i ) * r8_choose ( n - 1 - i, j - i ) \
-        * r8_choose ( n - 1, i )
+  c = r8_choose_table ( n - 1 )
+  i = np.arange ( n )[:,np.newaxis]
+  j = np.arange ( n )[np.newaxis,:]
+  d = np.maximum ( j - i, 0 )
+
+  with np.errstate ( over = 'ignore', invalid = 'ignore' ):
+    a = np.where ( i <= j, ( 1 - 2 * ( d % 2 ) ) * c[n-1-i,d] * c[n-1,i], 0.0 )
+
+  if ( not np.all ( np.isfinite ( a ) ) ):
+    print ( '' )
+    print ( 'BERNSTEIN_MATRIX - Warning!' )
+    print ( '  Some entries of the matrix exceed the real range for N = %d.' \
+      % ( n ) )
 
   return a
 
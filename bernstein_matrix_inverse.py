@@ -18,6 +18,10 @@ def bernstein_matrix_inverse ( n ):
 #    The N power basis vectors are ordered as (1,X,X^2,...X^(N-1)) and the N 
 #    Bernstein basis vectors as ((1-X)^(N-1), X*(1-X)^(N-2),...,X^(N-1)).
 #
+#    The entries are A(I,J) = C(J,I) / C(N-1,I), which lie between 0 and 1.
+#    They are assembled all at once by R8_CHOOSE_QUOTIENT, without forming
+#    the binomial coefficients, which overflow for N > 1030.
+#
 #  Example:
 #
 #    N = 5
@@ -34,7 +38,7 @@ def bernstein_matrix_inverse ( n ):
 #
 #  Modified:
 #
-#    03 December 2015
+#    17 October 2026
 #
 #  Author:
 #
@@ -47,13 +51,12 @@ def bernstein_matrix_inverse ( n ):
 #    Output, real A(N,N), the inverse Bernstein matrix.
 #
   import numpy as np
-  from r8_choose import r8_choose
+  from r8_choose_table import r8_choose_quotient
 
-  a = np.zeros ( ( n, n ) )
+  if ( n <= 0 ):
+    return np.zeros ( ( 0, 0 ) )
 
-  for j in range ( 0, n ):
-    for i in range ( 0, j + 1 ):
-      a[i,j] = r8_choose ( j, i ) / r8_choose ( n - 1, i )
+  a = r8_choose_quotient ( n - 1 )
 
   return a
 
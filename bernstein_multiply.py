@@ -0,0 +1,280 @@
+#! /usr/bin/env python
+#
+def bernstein_multiply ( ydata1, ydata2, threshold = 64 ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_MULTIPLY multiplies two polynomials in Bernstein form.
+#
+#  Discussion:
+#
+#    If P1 has the Bernstein coefficients Y1(0:N) and P2 has Y2(0:M), on
+#    the same interval, then the product P1*P2 has the Bernstein
+#    coefficients of degree N+M
+#
+#      Z(K) = sum ( I + J = K ) C(N,I) * C(M,J) / C(N+M,K) * Y1(I) * Y2(J)
+#
+#    So Z is obtained by scaling Y1 and Y2 by binomial coefficients,
+#    convolving them, and dividing by binomial coefficients.
+#
+#    When either degree is below THRESHOLD, the sum is formed directly, in
+#    O(N*M) operations, with weights C(N,I)*C(M,J)/C(N+M,K) between 0 and 1.
+#
+#    Otherwise, the convolution uses the fast Fourier transform.  Its error
+#    is about EPS times the largest term, while the binomial coefficients
+#    vary over hundreds of orders of magnitude, so the scaled coefficients
+#    are also multiplied by T^I and T^J, which makes the terms of a range
+#    of entries Z(K) the largest.  Enough values of T are used that each
+#    entry is computed accurately by one of them, about 0.7*sqrt(N+M) in
+#    all, so this costs O((N+M)^1.5*log(N+M)) operations.
+#
+#    In either case, the error in Z is a small multiple of (N+M)*EPS times
+#    the largest of |Y1|*|Y2|.  The binomial coefficients are held as
+#    mantissas and exponents, so that there is no limit on the degrees.
+#
+#    Y1 and Y2 may hold stacks of polynomials, which are broadcast against
+#    each other.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, real YDATA1(N+1), YDATA2(M+1), the Bernstein coefficients of
+#    the factors, or arrays of shape S1+(N+1) and S2+(M+1).
+#
+#    Input, integer THRESHOLD, the degree from which the FFT is used.
+#
+#    Output, real ZDATA(N+M+1), the Bernstein coefficients of the product,
+#    with the broadcast shape of S1 and S2, followed by N+M+1.
+#
+  import numpy as np
+
+  ydata1 = np.asarray ( ydata1, dtype = np.float64 )
+  ydata2 = np.asarray ( ydata2, dtype = np.float64 )
+  n = ydata1.shape[-1] - 1
+  m = ydata2.shape[-1] - 1
+  nm = n + m
+
+  shape = np.broadcast_shapes ( ydata1.shape[0:-1], ydata2.shape[0:-1] )
+
+  def choose_row ( k ):
+#
+#  C(K,0:K) = CM * 2^CE, from the ratios of successive entries.  The
+#  mantissas are renormalized every 256 entries.  Entries below 2^53
+#  are rounded to the exact integers.
+#
+    i = np.arange ( 1, k + 1 )
+    fm, fe = np.frexp ( ( k - i + 1 ) / i )
+    cm = np.full ( k + 1, 0.5 )
+    ce = np.ones ( k + 1, dtype = int )
+    for s in range ( 0, k, 256 ):
+      pm, pe = np.frexp ( cm[s] * np.cumprod ( fm[s:s+256] ) )
+      cm[s+1:s+257] = pm
+      ce[s+1:s+257] = ce[s] + np.cumsum ( fe[s:s+256] ) + pe
+    small = ( ce <= 53 )
+    cm[small], ce[small] = np.frexp ( np.rint ( np.ldexp ( cm[small], ce[small] ) ) )
+    return cm, ce
+
+  mn, en = choose_row ( n )
+  mm, em = choose_row ( m )
+  mnm, enm = choose_row ( nm )
+
+  if ( min ( n, m ) < max ( threshold, 1 ) ):
+#
+#  Direct sum, over the shorter factor.
+#
+    if ( m < n ):
+      ydata1, ydata2 = ydata2, ydata1
+      mn, mm = mm, mn
+      en, em = em, en
+      n, m = m, n
+
+    zdata = np.zeros ( shape + ( nm + 1, ) )
+    with np.errstate ( under = 'ignore' ):
+      for i in range ( 0, n + 1 ):
+        h = np.ldexp ( mn[i] * mm / mnm[i:i+m+1], en[i] + em - enm[i:i+m+1] )
+        zdata[...,i:i+m+1] = zdata[...,i:i+m+1] \
+          + ydata1[...,i:i+1] * ( h * ydata2 )
+
+    return zdata
+#
+#  FFT convolution.  For a tilt T, with centers I0 and J0, the factors are
+#  scaled by C(N,I)*T^(I-I0)/2^SU and C(M,J)*T^(J-J0)/2^SV, which are at
+#  most 1.  Entry K of the convolution is then C(N+M,K)*Z(K) divided by
+#  2^Q(K), and it is accurate if Q(K) is at most QMAX.
+#
+  qmax = 4.0
+  ln = np.log2 ( mn ) + en
+  lm = np.log2 ( mm ) + em
+  lnm = np.log2 ( mnm ) + enm
+  i = np.arange ( n + 1 )
+  j = np.arange ( m + 1 )
+  k = np.arange ( nm + 1 )
+
+  def tilt ( c ):
+    el = np.log2 ( ( c + 0.5 ) / ( nm - c + 0.5 ) )
+    i0 = int ( round ( c * n / nm ) )
+    j0 = int ( round ( c ) ) - i0
+    su = int ( np.ceil ( np.max ( ln + ( i - i0 ) * el ) ) )
+    sv = int ( np.ceil ( np.max ( lm + ( j - j0 ) * el ) ) )
+    q = su + sv - ( k - i0 - j0 ) * el - lnm
+    return ( el, i0, j0, su, sv ), q
+
+  tilts = [ ]
+  best = np.full ( nm + 1, np.inf )
+  which = np.zeros ( nm + 1, dtype = int )
+  kk = 0
+
+  while ( kk <= nm ):
+#
+#  Center the next tilt where it should just cover entry KK, the first one
+#  not yet covered, or else at KK itself.
+#
+    h = np.sqrt ( 2.0 * np.log ( 2.0 ) * qmax * ( kk + 1 ) * ( nm - kk + 1 ) \
+      / ( nm + 2 ) )
+    t, q = tilt ( min ( kk + 0.8 * h, nm ) )
+    if ( qmax < q[kk] ):
+      t, q = tilt ( kk )
+
+    better = ( q < best )
+    which[better] = len ( tilts )
+    best[better] = q[better]
+    tilts.append ( t )
+
+    kk = kk + 1
+    while ( kk <= nm and best[kk] <= qmax ):
+      kk = kk + 1
+
+  nt = len ( tilts )
+  fu = np.zeros ( ( nt, n + 1 ) )
+  fv = np.zeros ( ( nt, m + 1 ) )
+  fw = np.zeros ( nm + 1 )
+
+  with np.errstate ( under = 'ignore' ):
+    for l, ( el, i0, j0, su, sv ) in enumerate ( tilts ):
+      fu[l] = mn * np.exp2 ( ( i - i0 ) * el + en - su )
+      fv[l] = mm * np.exp2 ( ( j - j0 ) * el + em - sv )
+      use = ( which == l )
+      fw[use] = np.exp2 ( su + sv - ( k[use] - i0 - j0 ) * el - enm[use] ) \
+        / mnm[use]
+
+  lead = ( 1, ) * len ( shape )
+  u = ydata1 * np.reshape ( fu, ( nt, ) + lead + ( n + 1, ) )
+  v = ydata2 * np.reshape ( fv, ( nt, ) + lead + ( m + 1, ) )
+
+  nfft = 1
+  while ( nfft < nm + 1 ):
+    nfft = 2 * nfft
+
+  w = np.fft.irfft ( np.fft.rfft ( u, nfft, axis = -1 ) \
+    * np.fft.rfft ( v, nfft, axis = -1 ), nfft, axis = -1 )[...,0:nm+1]
+  w = np.broadcast_to ( w, ( nt, ) + shape + ( nm + 1, ) )
+
+  zdata = np.moveaxis ( w, 0, -2 )[...,which,k] * fw
+
+  return zdata
+
+def bernstein_multiply_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_MULTIPLY_TEST tests BERNSTEIN_MULTIPLY.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  import time
+  from bernstein_poly_ab_approx import bernstein_poly_ab_approx
+
+  print ( '' )
+  print ( 'BERNSTEIN_MULTIPLY_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_MULTIPLY multiplies polynomials in Bernstein form.' )
+#
+#  X * (1-X) on [0,1].
+#
+  zdata = bernstein_multiply ( [ 0.0, 1.0 ], [ 1.0, 0.0 ] )
+  print ( '' )
+  print ( '  X * (1-X) =', zdata )
+#
+#  Compare the values of the product with the products of the values,
+#  using direct and FFT convolution.
+#
+  rng = np.random.default_rng ( 123456789 )
+  a = -1.0
+  b = 2.0
+  nval = 1001
+  xval = np.linspace ( a, b, nval )
+
+  print ( '' )
+  print ( '     N     M  Method  Max Relative Difference   Time' )
+  print ( '' )
+
+  for n, m in [ ( 3, 4 ), ( 20, 30 ), ( 60, 70 ), ( 200, 300 ), \
+    ( 500, 500 ) ]:
+
+    ydata1 = 1.0 + rng.random ( ( 5, n + 1 ) )
+    ydata2 = 1.0 + rng.random ( ( 5, m + 1 ) )
+
+    yval1 = bernstein_poly_ab_approx ( n, a, b, ydata1, nval, xval )
+    yval2 = bernstein_poly_ab_approx ( m, a, b, ydata2, nval, xval )
+
+    for threshold, method in [ ( n + m + 1, 'direct' ), ( 0, 'FFT' ) ]:
+
+      t = time.time ( )
+      zdata = bernstein_multiply ( ydata1, ydata2, threshold )
+      t = time.time ( ) - t
+
+      zval = bernstein_poly_ab_approx ( n + m, a, b, zdata, nval, xval )
+      diff = np.max ( np.abs ( zval - yval1 * yval2 ) / ( yval1 * yval2 ) )
+
+      print ( '  %4d  %4d  %6s  %14.6g  %14.4f' % ( n, m, method, diff, t ) )
+#
+#  Large degrees, where the values cannot be checked so easily: compare the
+#  two methods.
+#
+  print ( '' )
+  print ( '     N     M  Max Difference   Time direct     Time FFT' )
+  print ( '' )
+
+  for n, m in [ ( 1000, 1000 ), ( 2000, 3000 ) ]:
+
+    ydata1 = rng.standard_normal ( ( 5, n + 1 ) )
+    ydata2 = rng.standard_normal ( ( 5, m + 1 ) )
+
+    t1 = time.time ( )
+    zdata1 = bernstein_multiply ( ydata1, ydata2, n + m + 1 )
+    t1 = time.time ( ) - t1
+
+    t2 = time.time ( )
+    zdata2 = bernstein_multiply ( ydata1, ydata2 )
+    t2 = time.time ( ) - t2
+
+    print ( '  %4d  %4d  %14.6g  %12.4f  %12.4f' \
+      % ( n, m, np.max ( np.abs ( zdata1 - zdata2 ) ), t1, t2 ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_MULTIPLY_TEST:' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_multiply_test ( )
+  timestamp ( )
@@ -1,6 +1,6 @@
 #! /usr/bin/env python
 #
-def bernstein_poly_01 ( n, x ):
+def bernstein_poly_01 ( n, x, workers = None ):
 
 #*****************************************************************************80
 #
@@ -10,6 +10,12 @@ def bernstein_poly_01 ( n, x ):
 #
 #    The Bernstein polynomials are assumed to be based on [0,1].
 #
+#    X may be an array of points.  The triangular recurrence is then
+#    carried out one degree level at a time for all the points together,
+#    using only whole-array NumPy operations.  Because these release the
+#    interpreter lock, the points may also be divided among WORKERS threads,
+#    each sweeping its own contiguous part of the array.
+#
 #  Formula:
 #
 #    B(N,I)(X) = [N!/(I!*(N-I)!)] * (1-X)^(N-I) * X^I
@@ -54,7 +60,7 @@ def bernstein_poly_01 ( n, x ):
 #
 #  Modified:
 #
-#    03 December 2015
+#    17 October 2026
 #
 #  Author:
 #
@@ -66,28 +72,48 @@ def bernstein_poly_01 ( n, x ):
 #    used.  For any N, there is a set of N+1 Bernstein polynomials,
 #    each of degree N, which form a basis for polynomials on [0,1].
 #
-#    Input, real X, the evaluation point.
+#    Input, real X, the evaluation point, or an array of points.
+#
+#    Input, integer WORKERS, the number of threads to use.
+#    By default, the calling thread does all the work.
 #
 #    Output, real B(1:N+1), the values of the N+1 Bernstein polynomials at X.
+#    If X is an array of shape S, then B has shape S+(N+1).
 #
   import numpy as np
+  from thread_block_map import thread_block_map
 
-  b = np.zeros ( n + 1 )
+  x = np.asarray ( x, dtype = np.float64 )
+#
+#  Row I of the work array holds polynomial I at every entry of X.
+#
+  b = np.zeros ( ( n + 1, ) + x.shape )
 
   if ( n == 0 ):
  
     b[0] = 1.0
  
   elif ( 0 < n ):
+
+    xf = np.reshape ( x, -1 )
+    bf = np.reshape ( b, ( n + 1, -1 ) )
+
+    def sweep ( lo, hi ):
+
+      xb = xf[lo:hi]
+      bb = bf[:,lo:hi]
  
-    b[0] = 1.0 - x
-    b[1] = x
+      bb[0] = 1.0 - xb
+      bb[1] = xb
  
-    for i in range ( 2, n + 1 ):
-      b[i] = x * b[i-1]
-      for j in range ( i - 1, 0, -1 ):
-        b[j] = x * b[j-1] + ( 1.0 - x ) * b[j]
-      b[0] = ( 1.0 - x ) * b[0]
+      for i in range ( 2, n + 1 ):
+        bb[i] = xb * bb[i-1]
+        bb[1:i] = xb * bb[0:i-1] + ( 1.0 - xb ) * bb[1:i]
+        bb[0] = ( 1.0 - xb ) * bb[0]
+
+    thread_block_map ( xf.size, workers, sweep )
+
+  b = np.moveaxis ( b, 0, -1 )
 
   return b
 
@@ -192,9 +218,68 @@ def bernstein_poly_01_test2 ( ):
   print ( '  Normal end of execution.' )
   return
 
+def bernstein_poly_01_test3 ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_01_TEST3 evaluates at many points, using threads.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license. 
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  import time
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_01_TEST3:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_01 evaluates the Bernstein polynomials' )
+  print ( '  at an array of points, optionally using several threads.' )
+
+  n = 20
+  m = 500000
+  x = np.linspace ( 0.0, 1.0, m )
+
+  t = time.time ( )
+  b1 = bernstein_poly_01 ( n, x )
+  t1 = time.time ( ) - t
+
+  diff = 0.0
+  for i in range ( 0, m, m // 10 ):
+    diff = max ( diff, np.max ( np.abs ( b1[i,:] - bernstein_poly_01 ( n, x[i] ) ) ) )
+
+  print ( '' )
+  print ( '  N = %d, M = %d, B has shape %s' % ( n, m, str ( b1.shape ) ) )
+  print ( '  Maximum difference from pointwise evaluation = %g' % ( diff ) )
+  print ( '' )
+  print ( '  Workers        Time    Max Difference' )
+  print ( '' )
+  print ( '     None  %10.4f' % ( t1 ) )
+
+  for workers in [ 1, 2, 4 ]:
+    t = time.time ( )
+    b2 = bernstein_poly_01 ( n, x, workers = workers )
+    t2 = time.time ( ) - t
+    print ( '  %7d  %10.4f  %14.6g' \
+      % ( workers, t2, np.max ( np.abs ( b2 - b1 ) ) ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_01_TEST3:' )
+  print ( '  Normal end of execution.' )
+  return
+
 if ( __name__ == '__main__' ):
   from timestamp import timestamp
   timestamp ( )
   bernstein_poly_01_test ( )
   bernstein_poly_01_test2 ( )
+  bernstein_poly_01_test3 ( )
   timestamp ( )
@@ -0,0 +1,183 @@
+#! /usr/bin/env python
+#
+def bernstein_poly_01_band ( n, x, tol = 1.0E-15 ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_01_BAND evaluates the significant Bernstein polynomials on [0,1].
+#
+#  Discussion:
+#
+#    For large N, the values B(N,K)(X) form a binomial distribution in K,
+#    concentrated around K = N*X.  By Hoeffding's inequality, the total of
+#    the values with |K-N*X| >= T is at most 2*exp(-2*T^2/N).  Choosing
+#
+#      T = sqrt ( N * log ( 2 / TOL ) / 2 )
+#
+#    makes this at most TOL, so every value outside the band of about 2*T
+#    indices around N*X is smaller than TOL, and so is their sum.
+#
+#    This function returns, for each point, the index START of the first
+#    polynomial in the band, and the values of the W polynomials
+#    START <= K < START+W.  W is the same for all the points, and is
+#    O(sqrt(N)), so the cost per point is O(sqrt(N)) rather than O(N).
+#
+#    The largest value, at K = floor((N+1)*X), is computed directly, as in
+#    BERNSTEIN_POLY_01_SINGLE, and the others from it by the ratio
+#    recurrence, as in BERNSTEIN_POLY_01_RATIO.  Because the logarithm of
+#    the binomial coefficient is found as a difference of log-gamma values,
+#    the relative accuracy of the values is about N*log(N) times the
+#    machine epsilon.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the Bernstein polynomials to be used.
+#
+#    Input, real X, the evaluation point, or an array of points.
+#    Every point must lie in [0,1].
+#
+#    Input, real TOL, the size below which values may be left out.
+#    0 < TOL < 1.
+#
+#    Output, integer START, the index of the first polynomial in the band
+#    for each point, with the shape of X.
+#
+#    Output, real BAND(W), the values of polynomials START through
+#    START+W-1 at X.  If X is an array of shape S, then BAND has shape S+(W).
+#
+  import numpy as np
+  from sys import exit
+  from r8_gamma_log import r8_gamma_log
+
+  x = np.asarray ( x, dtype = np.float64 )
+
+  if ( np.any ( x < 0.0 ) or np.any ( 1.0 < x ) ):
+    print ( '' )
+    print ( 'BERNSTEIN_POLY_01_BAND - Fatal error!' )
+    print ( '  Every X must lie in [0,1].' )
+    exit ( 'BERNSTEIN_POLY_01_BAND - Fatal error!' )
+
+  if ( not ( 0.0 < tol and tol < 1.0 ) ):
+    print ( '' )
+    print ( 'BERNSTEIN_POLY_01_BAND - Fatal error!' )
+    print ( '  TOL = %g is not between 0 and 1.' % ( tol ) )
+    exit ( 'BERNSTEIN_POLY_01_BAND - Fatal error!' )
+
+  h = int ( np.ceil ( np.sqrt ( n * np.log ( 2.0 / tol ) / 2.0 ) ) ) + 1
+  w = min ( n + 1, 2 * h + 1 )
+
+  xf = np.reshape ( x, -1 )
+
+  start = np.clip ( np.floor ( n * xf ).astype ( int ) - h, 0, n + 1 - w )
+#
+#  Row J of the work array holds polynomial START+J at every point.
+#
+  band = np.zeros ( ( w, xf.size ) )
+#
+#  The largest value, at K = M.
+#
+  m = np.clip ( np.floor ( ( n + 1 ) * xf ).astype ( int ), 0, n )
+
+  mu, inverse = np.unique ( m, return_inverse = True )
+  logc = np.array ( [ r8_gamma_log ( float ( n + 1 ) ) \
+    - r8_gamma_log ( float ( k + 1 ) ) - r8_gamma_log ( float ( n - k + 1 ) ) \
+    for k in mu ] )
+  logc = np.reshape ( logc[inverse], -1 )
+
+  with np.errstate ( divide = 'ignore', invalid = 'ignore' ):
+
+    logv = logc \
+      + np.where ( 0 < m, m * np.log ( xf ), 0.0 ) \
+      + np.where ( m < n, ( n - m ) * np.log1p ( - xf ), 0.0 )
+
+    up = np.where ( xf < 1.0, xf / ( 1.0 - xf ), 0.0 )
+    down = np.where ( 0.0 < xf, ( 1.0 - xf ) / xf, 0.0 )
+
+  jm = m - start
+  np.put_along_axis ( band, jm[np.newaxis,:], \
+    np.exp ( logv )[np.newaxis,:], axis = 0 )
+#
+#  Sweep down and up from the largest value.
+#
+  for j in range ( w - 1, 0, -1 ):
+    k = start + j
+    band[j-1] = np.where ( j <= jm, band[j] * ( k / ( n - k + 1 ) ) * down, \
+      band[j-1] )
+
+  for j in range ( 0, w - 1 ):
+    k = start + j
+    band[j+1] = np.where ( jm <= j, band[j] * ( ( n - k ) / ( k + 1 ) ) * up, \
+      band[j+1] )
+
+  start = np.reshape ( start, x.shape )
+  band = np.reshape ( np.moveaxis ( band, 0, -1 ), x.shape + ( w, ) )
+
+  return start, band
+
+def bernstein_poly_01_band_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_01_BAND_TEST tests BERNSTEIN_POLY_01_BAND.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  from bernstein_poly_01_ratio import bernstein_poly_01_ratio
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_01_BAND_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_01_BAND evaluates the Bernstein polynomials' )
+  print ( '  whose values exceed a tolerance.' )
+  print ( '' )
+  print ( '         N       TOL      W    Max Difference   Max Value' )
+  print ( '                                in band          outside band' )
+  print ( '' )
+
+  x = np.linspace ( 0.0, 1.0, 501 )
+
+  for n in [ 5, 100, 1000, 10000 ]:
+    for tol in [ 1.0E-06, 1.0E-15 ]:
+
+      start, band = bernstein_poly_01_band ( n, x, tol )
+      w = band.shape[-1]
+
+      b = bernstein_poly_01_ratio ( n, x )
+      index = start[:,np.newaxis] + np.arange ( w )
+      diff = np.max ( np.abs ( np.take_along_axis ( b, index, axis = 1 ) \
+        - band ) )
+
+      np.put_along_axis ( b, index, 0.0, axis = 1 )
+      outside = np.max ( b )
+
+      print ( '  %8d  %8.1e  %5d  %14.6g  %14.6g' \
+        % ( n, tol, w, diff, outside ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_01_BAND_TEST:' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_poly_01_band_test ( )
+  timestamp ( )
@@ -1,6 +1,7 @@
 #! /usr/bin/env python
 #
-def bernstein_poly_01_matrix ( m, n, x ):
+def bernstein_poly_01_matrix ( m, n, x, dtype = None, out = None, \
+  workers = None ):
 
 #*****************************************************************************80
 #
@@ -10,6 +11,17 @@ def bernstein_poly_01_matrix ( m, n, x ):
 #
 #    The Bernstein polynomials are assumed to be based on [0,1].
 #
+#    The matrix is built one column at a time.  Each step of the recurrence
+#    updates a whole column, that is, one polynomial at a block of points,
+#    using in-place array operations and two small scratch vectors, so that
+#    no temporary as large as the matrix is ever formed.  Unless OUT is
+#    supplied, the result is stored in column-major order, so that each
+#    column is contiguous in memory.
+#
+#    The rows may be divided among WORKERS threads, each of which sweeps
+#    its own contiguous range of rows.  The sweeps consist only of NumPy
+#    ufunc calls, which release the interpreter lock.
+#
 #  Formula:
 #
 #    B(N,I)(X) = [N!/(I!*(N-I)!)] * (1-X)^(N-I) * X^I
@@ -54,7 +66,7 @@ def bernstein_poly_01_matrix ( m, n, x ):
 #
 #  Modified:
 #
-#    27 January 2016
+#    17 October 2026
 #
 #  Author:
 #
@@ -70,29 +82,83 @@ def bernstein_poly_01_matrix ( m, n, x ):
 #
 #    Input, real X[M], the evaluation points.
 #
+#    Input, dtype DTYPE, the floating point type of the result.
+#    If omitted, the type of OUT is used, or else float64.
+#
+#    Input/output, real OUT[M,N+1], an optional array in which the
+#    result is to be stored.
+#
+#    Input, integer WORKERS, the number of threads to use.
+#    By default, the calling thread does all the work.
+#
 #    Output, real B[M,N+1], the values of the N+1 Bernstein polynomials
-#    at the evaluation points.
+#    at the evaluation points.  If OUT was supplied, B is OUT.
 #
   import numpy as np
+  from sys import exit
+  from thread_block_map import thread_block_map
+
+  if ( out is None ):
+    if ( dtype is None ):
+      dtype = np.float64
+    b = np.empty ( [ m, n + 1 ], dtype = dtype, order = 'F' )
+  else:
+    if ( out.shape != ( m, n + 1 ) ):
+      print ( '' )
+      print ( 'BERNSTEIN_POLY_01_MATRIX - Fatal error!' )
+      print ( '  OUT has shape %s, but (%d,%d) is required.' \
+        % ( str ( out.shape ), m, n + 1 ) )
+      exit ( 'BERNSTEIN_POLY_01_MATRIX - Fatal error!' )
+    if ( dtype is not None and np.dtype ( dtype ) != out.dtype ):
+      print ( '' )
+      print ( 'BERNSTEIN_POLY_01_MATRIX - Fatal error!' )
+      print ( '  OUT has type %s, but DTYPE is %s.' \
+        % ( out.dtype, np.dtype ( dtype ) ) )
+      exit ( 'BERNSTEIN_POLY_01_MATRIX - Fatal error!' )
+    b = out
 
-  b = np.zeros ( [ m, n + 1 ] )
+  if ( n < 0 ):
 
-  for i in range ( 0, m ):
+    return b
+
+  elif ( n == 0 ):
+
+    b[:,0] = 1.0
+
+    return b
+
+  x = np.asarray ( x, dtype = b.dtype )[0:m]
+#
+#  Rows are processed in blocks small enough for the columns of a block
+#  to stay in cache while the whole triangle is swept.
+#
+  def sweep ( rlo, rhi ):
+
+    mb = max ( 1, min ( rhi - rlo, 8192 ) )
+    omx = np.empty ( mb, dtype = b.dtype )
+    t = np.empty ( mb, dtype = b.dtype )
+
+    for lo in range ( rlo, rhi, mb ):
+
+      hi = min ( lo + mb, rhi )
+      xb = x[lo:hi]
+      ob = omx[0:hi-lo]
+      tb = t[0:hi-lo]
+      bb = b[lo:hi,:]
+
+      np.subtract ( 1.0, xb, out = ob )
+      bb[:,0] = ob
+      bb[:,1] = xb
 
-    if ( n == 0 ):
- 
-      b[i,0] = 1.0
- 
-    elif ( 0 < n ):
- 
-      b[i,0] = 1.0 - x[i]
-      b[i,1] = x[i]
- 
       for j in range ( 2, n + 1 ):
-        b[i,j] = x[i] * b[i,j-1]
+        np.multiply ( xb, bb[:,j-1], out = bb[:,j] )
         for k in range ( j - 1, 0, -1 ):
-          b[i,k] = x[i] * b[i,k-1] + ( 1.0 - x[i] ) * b[i,k]
-        b[i,0] = ( 1.0 - x[i] ) * b[i,0]
+          np.multiply ( xb, bb[:,k-1], out = tb )
+          bb[:,k] *= ob
+          bb[:,k] += tb
+        bb[:,0] *= ob
+
+  thread_block_map ( m, workers, sweep )
 
   return b
 
@@ -157,8 +223,60 @@ def bernstein_poly_01_matrix_test ( ):
   print ( '  Normal end of execution.' )
   return
 
+def bernstein_poly_01_matrix_test2 ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_01_MATRIX_TEST2 tests the DTYPE and OUT arguments.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    16 October 2026
+#
+  import numpy as np
+  import platform
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_01_MATRIX_TEST2' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_01_MATRIX can compute in single precision,' )
+  print ( '  can store its result in a given array, and can use threads.' )
+  print ( '' )
+  print ( '         M     N  Type        max |Sum(B(I,*))-1|' )
+  print ( '' )
+
+  m = 100000
+  x = np.linspace ( 0.0, 1.0, m )
+
+  for n in [ 5, 20, 64 ]:
+
+    b = bernstein_poly_01_matrix ( m, n, x, dtype = np.float32 )
+    e = np.max ( np.abs ( np.sum ( b, axis = 1, dtype = np.float64 ) - 1.0 ) )
+    print ( '  %8d  %4d  %-10s  %14.6g' % ( m, n, b.dtype, e ) )
+
+    out = np.zeros ( [ m, n + 1 ] )
+    b = bernstein_poly_01_matrix ( m, n, x, out = out )
+    e = np.max ( np.abs ( np.sum ( out, axis = 1 ) - 1.0 ) )
+    print ( '  %8d  %4d  %-10s  %14.6g' % ( m, n, out.dtype, e ) )
+
+    b = bernstein_poly_01_matrix ( m, n, x, workers = 3 )
+    e = np.max ( np.abs ( b - out ) )
+    print ( '  %8d  %4d  3 threads   %14.6g (difference)' % ( m, n, e ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_01_MATRIX_TEST2:' )
+  print ( '  Normal end of execution.' )
+  return
+
 if ( __name__ == '__main__' ):
   from timestamp import timestamp
   timestamp ( )
   bernstein_poly_01_matrix_test ( )
+  bernstein_poly_01_matrix_test2 ( )
   timestamp ( )
@@ -0,0 +1,199 @@
+#! /usr/bin/env python
+#
+def bernstein_poly_01_ratio ( n, x, workers = None ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_01_RATIO evaluates the Bernstein polynomials on [0,1] in O(N).
+#
+#  Discussion:
+#
+#    This function returns the same values as BERNSTEIN_POLY_01, but the
+#    triangular recurrence, which costs O(N^2) per point, is replaced by the
+#    ratio recurrence between neighboring polynomials of the same degree:
+#
+#      B(N,K+1)(X) = B(N,K)(X) * (N-K)/(K+1) * X/(1-X)
+#      B(N,K-1)(X) = B(N,K)(X) * K/(N-K+1) * (1-X)/X
+#
+#    which costs O(N) per point.
+#
+#    For X in (0,1), the sweeps start from the largest polynomial, whose
+#    index is M = floor((N+1)*X), with a provisional value of 1, and go
+#    down to K = 0 and up to K = N.  The values then only decrease away
+#    from the start, so nothing can overflow, and small values underflow
+#    harmlessly to zero.  The ratio factors are at most N in size on the
+#    side on which they are used.  Finally, the values are divided by
+#    their sum, since the polynomials add up to 1.
+#
+#    For X <= 0, the sweep starts from B(N,0)(X) = (1-X)^N, and for
+#    X >= 1, from B(N,N)(X) = X^N.  At X = 0 and X = 1, the values are
+#    exact.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the Bernstein polynomials to be used.
+#
+#    Input, real X, the evaluation point, or an array of points.
+#
+#    Input, integer WORKERS, the number of threads to use.
+#    By default, the calling thread does all the work.
+#
+#    Output, real B(1:N+1), the values of the N+1 Bernstein polynomials at X.
+#    If X is an array of shape S, then B has shape S+(N+1).
+#
+  import numpy as np
+  from thread_block_map import thread_block_map
+
+  x = np.asarray ( x, dtype = np.float64 )
+#
+#  Row K of the work array holds polynomial K at every entry of X.
+#
+  b = np.zeros ( ( n + 1, ) + x.shape )
+
+  if ( n == 0 ):
+
+    b[0] = 1.0
+
+  elif ( 0 < n ):
+
+    xf = np.reshape ( x, -1 )
+    bf = np.reshape ( b, ( n + 1, -1 ) )
+
+    def sweep ( lo, hi ):
+
+      xb = xf[lo:hi]
+      bb = bf[:,lo:hi]
+
+      inside = ( 0.0 < xb ) & ( xb < 1.0 )
+#
+#  Ratio factors, set to zero where they would not be used anyway.
+#
+      with np.errstate ( divide = 'ignore', invalid = 'ignore' ):
+        up = np.where ( xb < 1.0, xb / ( 1.0 - xb ), 0.0 )
+        down = np.where ( 0.0 < xb, ( 1.0 - xb ) / xb, 0.0 )
+#
+#  Starting index and value.
+#
+      m = np.floor ( ( n + 1 ) * xb )
+      m = np.where ( xb <= 0.0, 0, np.where ( 1.0 <= xb, n, m ) )
+      m = np.clip ( m, 0, n ).astype ( int )
+
+      start = np.where ( xb <= 0.0, ( 1.0 - xb ) ** n, 1.0 )
+      start = np.where ( 1.0 <= xb, xb ** n, start )
+
+      np.put_along_axis ( bb, m[np.newaxis,:], start[np.newaxis,:], axis = 0 )
+
+      for k in range ( n, 0, -1 ):
+        bb[k-1] = np.where ( k <= m, bb[k] * ( k / ( n - k + 1 ) ) * down, \
+          bb[k-1] )
+
+      for k in range ( 0, n ):
+        bb[k+1] = np.where ( m <= k, bb[k] * ( ( n - k ) / ( k + 1 ) ) * up, \
+          bb[k+1] )
+#
+#  Inside (0,1), scale the values so that they add up to 1.
+#
+      total = np.sum ( bb, axis = 0 )
+      bb[:,inside] = bb[:,inside] / total[inside]
+
+    thread_block_map ( xf.size, workers, sweep )
+
+  b = np.moveaxis ( b, 0, -1 )
+
+  return b
+
+def bernstein_poly_01_ratio_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_01_RATIO_TEST tests BERNSTEIN_POLY_01_RATIO.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  import time
+  from bernstein_poly_01 import bernstein_poly_01
+  from bernstein_poly_01_values import bernstein_poly_01_values
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_01_RATIO_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_01_RATIO evaluates Bernstein polynomials' )
+  print ( '  using the ratio recurrence.' )
+  print ( '' )
+  print ( '       N       K             X                 F                          F' )
+  print ( '                                               tabulated                  computed' )
+  print ( '' )
+
+  n_data = 0
+
+  while ( True ):
+
+    n_data, n, k, x, f1 = bernstein_poly_01_values ( n_data )
+
+    if ( n_data == 0 ):
+      break
+
+    f = bernstein_poly_01_ratio ( n, x )
+    f2 = f[k]
+
+    print ( '  %6d  %6d  %12f  %24.16g  %24.16g' % ( n, k, x, f1, f2 ) )
+#
+#  Compare with the triangular recurrence, inside and outside [0,1].
+#
+  print ( '' )
+  print ( '  Comparison with BERNSTEIN_POLY_01:' )
+  print ( '' )
+  print ( '       N    Max Error     Max Error    Time       Time' )
+  print ( '            on [0,1]      outside      triangle   ratio' )
+  print ( '' )
+
+  x = np.linspace ( 0.0, 1.0, 2001 )
+  y = np.concatenate ( ( np.linspace ( -0.5, 0.0, 101 ), \
+    np.linspace ( 1.0, 1.5, 101 ) ) )
+
+  for n in [ 1, 2, 5, 10, 50, 100, 500 ]:
+
+    t = time.time ( )
+    f1 = bernstein_poly_01 ( n, x )
+    t1 = time.time ( ) - t
+
+    t = time.time ( )
+    f2 = bernstein_poly_01_ratio ( n, x )
+    t2 = time.time ( ) - t
+
+    g1 = bernstein_poly_01 ( n, y )
+    g2 = bernstein_poly_01_ratio ( n, y )
+    gmax = np.max ( np.abs ( g1 ), axis = -1, keepdims = True )
+
+    print ( '  %6d  %11.3g  %11.3g  %9.4f  %9.4f' % ( n, \
+      np.max ( np.abs ( f1 - f2 ) ), np.max ( np.abs ( g1 - g2 ) / gmax ), \
+      t1, t2 ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_01_RATIO_TEST:' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_poly_01_ratio_test ( )
+  timestamp ( )
@@ -0,0 +1,171 @@
+#! /usr/bin/env python
+#
+def bernstein_poly_01_single ( n, k, x ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_01_SINGLE evaluates one Bernstein polynomial defined on [0,1].
+#
+#  Discussion:
+#
+#    BERNSTEIN_POLY_01 computes all N+1 polynomials of degree N, at a cost
+#    of O(N^2) per point.  When only the single polynomial B(N,K) is
+#    wanted, it can instead be evaluated directly from the formula, at a
+#    cost which does not depend on N.
+#
+#    To avoid overflow and underflow for large N, the formula is used in
+#    logarithmic form:
+#
+#      log B(N,K)(X) = log C(N,K) + K * log(X) + (N-K) * log(1-X)
+#
+#    where log C(N,K) is computed once, from R8_GAMMA_LOG.
+#
+#    The endpoint values, B(N,K)(0) and B(N,K)(1), are returned exactly.
+#    X may lie outside [0,1], in which case the sign of the result is
+#    determined separately.
+#
+#  Formula:
+#
+#    B(N,K)(X) = [N!/(K!*(N-K)!)] * (1-X)^(N-K) * X^K
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the Bernstein polynomial.
+#
+#    Input, integer K, the index of the Bernstein polynomial.
+#    If K < 0 or N < K, the polynomial is zero.
+#
+#    Input, real X, the evaluation point, or an array of points.
+#
+#    Output, real VALUE, the value of B(N,K) at X, with the shape of X.
+#
+  import numpy as np
+  from r8_gamma_log import r8_gamma_log
+
+  x = np.asarray ( x, dtype = np.float64 )
+
+  if ( k < 0 or n < k ):
+    return np.zeros ( x.shape )
+
+  if ( n == 0 ):
+    return np.ones ( x.shape )
+
+  logc = r8_gamma_log ( float ( n + 1 ) ) - r8_gamma_log ( float ( k + 1 ) ) \
+    - r8_gamma_log ( float ( n - k + 1 ) )
+
+  with np.errstate ( divide = 'ignore', invalid = 'ignore' ):
+
+    logv = logc
+    if ( 0 < k ):
+      logv = logv + k * np.log ( np.abs ( x ) )
+    if ( k < n ):
+      logv = logv + ( n - k ) * np.log ( np.abs ( 1.0 - x ) )
+
+    value = np.exp ( logv )
+#
+#  Odd powers of negative factors change the sign.
+#
+  if ( ( k % 2 ) == 1 ):
+    value = np.where ( x < 0.0, - value, value )
+  if ( ( ( n - k ) % 2 ) == 1 ):
+    value = np.where ( 1.0 < x, - value, value )
+#
+#  The endpoint values are known exactly.
+#
+  value = np.where ( x == 0.0, 1.0 if ( k == 0 ) else 0.0, value )
+  value = np.where ( x == 1.0, 1.0 if ( k == n ) else 0.0, value )
+
+  return value
+
+def bernstein_poly_01_single_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_01_SINGLE_TEST tests BERNSTEIN_POLY_01_SINGLE.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  from bernstein_poly_01 import bernstein_poly_01
+  from bernstein_poly_01_values import bernstein_poly_01_values
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_01_SINGLE_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_01_SINGLE evaluates a single Bernstein polynomial.' )
+  print ( '' )
+  print ( '       N       K             X                 F                          F' )
+  print ( '                                               tabulated                  computed' )
+  print ( '' )
+
+  n_data = 0
+
+  while ( True ):
+
+    n_data, n, k, x, f1 = bernstein_poly_01_values ( n_data )
+
+    if ( n_data == 0 ):
+      break
+
+    f2 = bernstein_poly_01_single ( n, k, x )
+
+    print ( '  %6d  %6d  %12f  %24.16g  %24.16g' % ( n, k, x, f1, f2 ) )
+#
+#  Compare with BERNSTEIN_POLY_01 at many points, including the endpoints
+#  and points outside [0,1].
+#
+  x = np.linspace ( -0.5, 1.5, 2001 )
+
+  print ( '' )
+  print ( '  Comparison with BERNSTEIN_POLY_01 on [-0.5,1.5]:' )
+  print ( '' )
+  print ( '       N       K    Max Relative Difference' )
+  print ( '' )
+
+  for n, k in [ ( 1, 0 ), ( 5, 2 ), ( 10, 0 ), ( 10, 7 ), ( 30, 15 ), \
+    ( 30, 30 ) ]:
+    f1 = bernstein_poly_01 ( n, x )[:,k]
+    f2 = bernstein_poly_01_single ( n, k, x )
+    diff = np.max ( np.abs ( f1 - f2 ) / np.maximum ( np.abs ( f1 ), 1.0E-300 ) \
+      * ( f1 != 0.0 ) )
+    print ( '  %6d  %6d  %14.6g' % ( n, k, diff ) )
+#
+#  Very large degrees are no problem.
+#
+  n = 1000000
+  k = 300000
+  x = np.array ( [ 0.0, 0.29, 0.3, 0.31, 1.0 ] )
+  f = bernstein_poly_01_single ( n, k, x )
+  print ( '' )
+  print ( '  N = %d, K = %d:' % ( n, k ) )
+  print ( '' )
+  for i in range ( 0, x.size ):
+    print ( '  %12f  %24.16g' % ( x[i], f[i] ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_01_SINGLE_TEST:' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_poly_01_single_test ( )
+  timestamp ( )
@@ -1,6 +1,6 @@
 #! /usr/bin/env python
 #
-def bernstein_poly_ab ( n, a, b, x ):
+def bernstein_poly_ab ( n, a, b, x, workers = None ):
 
 #*****************************************************************************80
 #
@@ -32,13 +32,21 @@ def bernstein_poly_ab ( n, a, b, x ):
 #    B(4,3)(X) = ( 4 * (B-X)    * (X-A)^3  ) / (B-A)^4 
 #    B(4,4)(X) = (                (X-A)^4  ) / (B-A)^4 
 #
+#  Discussion:
+#
+#    The triangular recurrence is carried out one degree level at a time,
+#    simultaneously for all the entries of X, so that each level costs
+#    only a few whole-array operations.  Because these release the
+#    interpreter lock, the points may also be divided among WORKERS threads,
+#    each sweeping its own contiguous part of the array.
+#
 #  Licensing:
 #
 #    This code is distributed under the GNU LGPL license.
 #
 #  Modified:
 #
-#    03 December 2015
+#    17 October 2026
 #
 #  Author:
 #
@@ -54,11 +62,18 @@ def bernstein_poly_ab ( n, a, b, x ):
 #    polynomials are to be based.  A and B should not be equal.
 #
 #    Input, real X, the point at which the polynomials are to be evaluated.
+#    X may also be an array of any shape.
+#
+#    Input, integer WORKERS, the number of threads to use.
+#    By default, the calling thread does all the work.
 #
 #    Output, real P(N+1), the values of the N+1 Bernstein polynomials at X.
+#    If X is an array of shape S, then P has shape S+(N+1), and P[...,K]
+#    is the K-th polynomial evaluated at each entry of X.
 #
   import numpy as np
   from sys import exit
+  from thread_block_map import thread_block_map
 
   if ( b == a ):
     print ( '' )
@@ -66,22 +81,38 @@ def bernstein_poly_ab ( n, a, b, x ):
     print ( '  A = B = %g' % ( a ) )
     exit ( 'BERNSTEIN_POLY_AB - Fatal error!' )
 
-  p = np.zeros ( n + 1 )
+  x = np.asarray ( x, dtype = np.float64 )
+#
+#  Row K of the work array holds polynomial K at every entry of X.
+#
+  p = np.zeros ( ( n + 1, ) + x.shape )
 
   if ( n == 0 ):
  
     p[0] = 1.0
  
   elif ( 0 < n ):
+
+    xf = np.reshape ( x, -1 )
+    pf = np.reshape ( p, ( n + 1, -1 ) )
+
+    def sweep ( lo, hi ):
+
+      bx = ( b - xf[lo:hi] ) / ( b - a ) # (1-x)
+      xa = ( xf[lo:hi] - a ) / ( b - a ) # (x)
+      pb = pf[:,lo:hi]
  
-    p[0] = ( b - x ) / ( b - a ) # (1-x)
-    p[1] = ( x - a ) / ( b - a ) # (x)
+      pb[0] = bx
+      pb[1] = xa
  
-    for i in range ( 2, n + 1 ):
-      p[i] = ( x - a ) * p[i-1] / ( b - a )
-      for j in range ( i - 1, 0, -1 ):
-        p[j] = ( ( b - x ) * p[j] + ( x - a ) * p[j-1] ) / ( b - a )
-      p[0] = ( b - x ) * p[0] / ( b - a )
+      for i in range ( 2, n + 1 ):
+        pb[i] = xa * pb[i-1]
+        pb[1:i] = bx * pb[1:i] + xa * pb[0:i-1]
+        pb[0] = bx * pb[0]
+
+    thread_block_map ( xf.size, workers, sweep )
+
+  p = np.moveaxis ( p, 0, -1 )
  
   return p
 
@@ -158,8 +189,77 @@ def bernstein_poly_ab_test ( ):
   print ( '  Normal end of execution.' )
   return
 
+def bernstein_poly_ab_test2 ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_TEST2 tests BERNSTEIN_POLY_AB with an array argument.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license. 
+#
+#  Modified:
+#
+#    16 October 2026
+#
+  import numpy as np
+  import platform
+  from r8mat_print import r8mat_print
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_TEST2' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_AB can evaluate the Bernstein polynomials' )
+  print ( '  at an array of points in a single call.' )
+
+  n = 4
+  a = 1.0
+  b = 3.0
+  m = 5
+  x = np.linspace ( a, b, m )
+
+  p = bernstein_poly_ab ( n, a, b, x )
+
+  r8mat_print ( m, n + 1, p, '  P(I,K) = BPAB(N,K,A,B)(X(I)):' )
+#
+#  Compare with one call per point.
+#
+  diff = 0.0
+  for i in range ( 0, m ):
+    p2 = bernstein_poly_ab ( n, a, b, x[i] )
+    diff = max ( diff, np.max ( np.abs ( p[i,:] - p2 ) ) )
+
+  print ( '' )
+  print ( '  Maximum difference from pointwise evaluation = %g' % ( diff ) )
+#
+#  A two dimensional array of points gives a three dimensional result.
+#
+  x = np.reshape ( np.linspace ( a, b, 6 ), ( 2, 3 ) )
+  p = bernstein_poly_ab ( n, a, b, x )
+  print ( '' )
+  print ( '  X has shape (%d,%d), P has shape (%d,%d,%d).' \
+    % ( x.shape + p.shape ) )
+#
+#  Several threads may share the work.
+#
+  x = np.linspace ( a, b, 100001 )
+  p = bernstein_poly_ab ( n, a, b, x )
+  p2 = bernstein_poly_ab ( n, a, b, x, workers = 4 )
+  print ( '' )
+  print ( '  With 4 threads, maximum difference = %g' \
+    % ( np.max ( np.abs ( p - p2 ) ) ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_TEST2:' )
+  print ( '  Normal end of execution.' )
+  return
+
 if ( __name__ == '__main__' ):
   from timestamp import timestamp
   timestamp ( )
   bernstein_poly_ab_test ( )
+  bernstein_poly_ab_test2 ( )
   timestamp ( )
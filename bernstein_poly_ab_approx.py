@@ -1,6 +1,7 @@
 #! /usr/bin/env python
 #
-def bernstein_poly_ab_approx ( n, a, b, ydata, nval, xval ):
+def bernstein_poly_ab_approx ( n, a, b, ydata, nval, xval, out = None, \
+  dtype = None, block = 65536, cache = False ):
 
 #*****************************************************************************80
 #
@@ -27,13 +28,32 @@ def bernstein_poly_ab_approx ( n, a, b, ydata, nval, xval ):
 #    the convergence is quite slow compared to other interpolation
 #    and approximation schemes.
 #
+#    The basis polynomials are evaluated at all the points XVAL at once,
+#    giving an NVAL by N+1 matrix, and the approximant is formed by a single
+#    matrix product with the data.  Several sets of data on the same grid
+#    may be handled in one call, by stacking them as the rows of YDATA;
+#    the basis matrix is then computed only once for all of them.
+#
+#    If CACHE is true, the basis matrix is obtained from
+#    BERNSTEIN_POLY_AB_CACHED, so that repeated calls with the same degree,
+#    interval and points, such as approximations of different functions on
+#    a fixed grid, reuse it instead of computing it again.  Callers which
+#    evaluate on a grid only once should leave CACHE false, so that the
+#    matrix is not kept.
+#
+#    If an output target OUT is given, such as an np.memmap or the name of
+#    a .npy file to be created, the points are instead processed in blocks
+#    of BLOCK points, and the result of each block is written directly into
+#    OUT, so that neither the result nor the basis matrix is ever held in
+#    memory in full.
+#
 #  Licensing:
 #
 #    This code is distributed under the GNU LGPL license.
 #
 #  Modified:
 #
-#    03 December 2015
+#    17 October 2026
 #
 #  Author:
 #
@@ -59,6 +79,8 @@ def bernstein_poly_ab_approx ( n, a, b, ydata, nval, xval ):
 #    spaced points in [A,B].  If N = 0, then the evaluation point should
 #    be 0.5 * ( A + B).  Otherwise, evaluation point I should be
 #    ( (N-I)*A + I*B ) / N ).
+#    YDATA may also be an array of shape (K,N+1), each row of which
+#    holds the data for a separate function.
 #
 #    Input, integer NVAL, the number of points at which the
 #    approximant is to be evaluated.
@@ -67,23 +89,60 @@ def bernstein_poly_ab_approx ( n, a, b, ydata, nval, xval ):
 #    polynomial approximant is to be evaluated.  The entries of XVAL do not 
 #    have to lie in the interval [A,B].
 #
+#    Input, OUT, an optional output target: an array of the shape of YVAL,
+#    such as an np.memmap, or the name of a .npy file to be created.
+#
+#    Input, dtype DTYPE, the type of the result, if OUT is a file name.
+#    The default is float64.
+#
+#    Input, integer BLOCK, the number of points processed at once when
+#    OUT is given.
+#
+#    Input, logical CACHE, is true if the basis matrix is to be kept in,
+#    or taken from, the cache of BERNSTEIN_POLY_AB_CACHED.  It is not used
+#    when OUT is given.
+#
 #    Output, real YVAL(NVAL), the values of the Bernstein 
 #    polynomial approximant for F, based in [A,B], evaluated at XVAL.
+#    If YDATA has shape (K,N+1), then YVAL has shape (K,NVAL), and
+#    row I of YVAL is the approximant for row I of YDATA.
+#    If OUT was given, YVAL is the array, or memory mapped file, holding
+#    the result.
 #
   import numpy as np
   from bernstein_poly_ab import bernstein_poly_ab
+  from bernstein_poly_ab_cache import bernstein_poly_ab_cached
+  from output_array import output_array
 
-  yval = np.zeros ( nval )
+  xval = np.asarray ( xval, dtype = np.float64 )[0:nval]
 
-  for i in range ( 0, nval ):
+  if ( out is None ):
 #
 #  Evaluate the Bernstein basis polynomials at XVAL.
 #
-    bvec = bernstein_poly_ab ( n, a, b, xval[i] )
+    if ( cache ):
+      bvec = bernstein_poly_ab_cached ( n, a, b, xval )
+    else:
+      bvec = bernstein_poly_ab ( n, a, b, xval )
 #
 #  Now compute the sum of YDATA(I) * BVEC(I).
 #
-    yval[i] = np.dot ( ydata, bvec )
+    yval = np.dot ( ydata, bvec.T )
+
+  else:
+
+    ydata = np.asarray ( ydata, dtype = np.float64 )
+    yval = output_array ( out, ydata.shape[0:-1] + ( nval, ), dtype, \
+      'BERNSTEIN_POLY_AB_APPROX' )
+    block = max ( 1, block )
+
+    for lo in range ( 0, nval, block ):
+      hi = min ( lo + block, nval )
+      bvec = bernstein_poly_ab ( n, a, b, xval[lo:hi] )
+      yval[...,lo:hi] = np.dot ( ydata, bvec.T )
+
+    if ( isinstance ( yval, np.memmap ) ):
+      yval.flush ( )
 
   return yval
 
@@ -158,9 +217,139 @@ def bernstein_poly_ab_approx_test ( ):
   print ( '  Normal end of execution.' )
   return
 
+def bernstein_poly_ab_approx_test2 ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_APPROX_TEST2 approximates several functions at once.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  from bernstein_poly_ab_cache import bernstein_poly_ab_cache_clear
+  from bernstein_poly_ab_cache import bernstein_poly_ab_cache_info
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_TEST2:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_AB_APPROX can evaluate the approximants to' )
+  print ( '  K functions F(X) = sin(K*X) over [A,B] in a single call.' )
+
+  bernstein_poly_ab_cache_clear ( )
+
+  a = 1.0
+  b = 3.0
+  degree = 20
+  k = 4
+
+  xdata = np.linspace ( a, b, degree + 1 )
+  ydata = np.zeros ( [ k, degree + 1 ] )
+  for i in range ( 0, k ):
+    ydata[i,:] = np.sin ( ( i + 1 ) * xdata )
+
+  nval = 501
+  xval = np.linspace ( a, b, nval )
+
+  yval = bernstein_poly_ab_approx ( degree, a, b, ydata, nval, xval, \
+    cache = True )
+
+  print ( '' )
+  print ( '     K      Max Error      Max Difference' )
+  print ( '                           from single call' )
+  print ( '' )
+
+  for i in range ( 0, k ):
+    error_max = max ( abs ( yval[i,:] - np.sin ( ( i + 1 ) * xval ) ) )
+    yval1 = bernstein_poly_ab_approx ( degree, a, b, ydata[i,:], nval, xval, \
+      cache = True )
+    diff_max = max ( abs ( yval[i,:] - yval1 ) )
+    print ( '  %4d  %14.6g  %14.6g' % ( i + 1, error_max, diff_max ) )
+#
+#  After the first call, the basis matrix came from the cache.
+#
+  info = bernstein_poly_ab_cache_info ( )
+  print ( '' )
+  print ( '  Basis cache: %d hits, %d misses.' % ( info['hits'], info['misses'] ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_TEST2' )
+  print ( '  Normal end of execution.' )
+  return
+
+def bernstein_poly_ab_approx_test3 ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_APPROX_TEST3 writes the approximant to a file.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    16 October 2026
+#
+  import numpy as np
+  import os
+  import platform
+  import tempfile
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_TEST3:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_AB_APPROX can write its result, block by block,' )
+  print ( '  into a memory mapped .npy file.' )
+
+  a = 1.0
+  b = 3.0
+  degree = 10
+  xdata = np.linspace ( a, b, degree + 1 )
+  ydata = np.sin ( xdata )
+
+  nval = 100001
+  xval = np.linspace ( a, b, nval )
+
+  dirname = tempfile.mkdtemp ( )
+  filename = os.path.join ( dirname, 'bernstein_poly_ab_approx_test3.npy' )
+
+  yval = bernstein_poly_ab_approx ( degree, a, b, ydata, nval, xval, \
+    out = filename, block = 4096 )
+  del yval
+
+  yfile = np.load ( filename, mmap_mode = 'r' )
+  yval = bernstein_poly_ab_approx ( degree, a, b, ydata, nval, xval )
+
+  print ( '' )
+  print ( '  File shape = %s' % ( str ( yfile.shape ) ) )
+  print ( '  Maximum difference from in-memory result = %g' \
+    % ( np.max ( np.abs ( yfile - yval ) ) ) )
+
+  del yfile
+  os.remove ( filename )
+  os.rmdir ( dirname )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_TEST3' )
+  print ( '  Normal end of execution.' )
+  return
+
 if ( __name__ == '__main__' ):
   from timestamp import timestamp
   timestamp ( )
   bernstein_poly_ab_approx_test ( )
+  bernstein_poly_ab_approx_test2 ( )
+  bernstein_poly_ab_approx_test3 ( )
   timestamp ( )
  
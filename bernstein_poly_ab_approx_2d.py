@@ -0,0 +1,298 @@
+#! /usr/bin/env python
+#
+def bernstein_poly_ab_approx_2d ( nx, ny, a, b, c, d, zdata, nxval, xval, \
+  nyval, yval, out = None, dtype = None, block = None, cache = False ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_APPROX_2D: Bernstein approximant to F(X,Y) on [A,B]x[C,D].
+#
+#  Formula:
+#
+#    BP(F)(X,Y) = sum ( 0 <= I <= NX ) sum ( 0 <= J <= NY )
+#      F(X(I),Y(J)) * BX(I,X) * BY(J,Y)
+#
+#    where
+#
+#      X(I) = ( ( NX - I ) * A + I * B ) / NX
+#      Y(J) = ( ( NY - J ) * C + J * D ) / NY
+#      BX(I,X) is the value of the I-th Bernstein basis polynomial of
+#      degree NX on [A,B] at X, and BY(J,Y) is the value of the J-th
+#      Bernstein basis polynomial of degree NY on [C,D] at Y.
+#
+#  Discussion:
+#
+#    The approximant is a tensor product, so its values on the grid
+#    XVAL x YVAL can be written as the matrix product
+#
+#      ZVAL = BX * ZDATA * BY'
+#
+#    where BX is the NXVAL by NX+1 matrix of X basis values, and BY is the
+#    NYVAL by NY+1 matrix of Y basis values.  Each basis matrix is computed
+#    once, and the two products are carried out in whichever order needs
+#    fewer operations.  If CACHE is true, the basis matrices are obtained
+#    from BERNSTEIN_POLY_AB_CACHED, so repeated evaluations on the same grid
+#    reuse them.
+#
+#    If an output target OUT is given, such as an np.memmap or the name of
+#    a .npy file to be created, ZDATA * BY' is formed once, and the rows of
+#    the result are computed in blocks of BLOCK rows, each written directly
+#    into OUT.  Only one block of the result is ever held in memory.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer NX, NY, the degrees of the Bernstein polynomials
+#    in the X and Y directions.  NX and NY must be at least 0.
+#
+#    Input, real A, B, the endpoints of the X interval.
+#    A and B should not be equal.
+#
+#    Input, real C, D, the endpoints of the Y interval.
+#    C and D should not be equal.
+#
+#    Input, real ZDATA(NX+1,NY+1), the data values at the
+#    points (X(I),Y(J)) of the equally spaced grid on [A,B]x[C,D].
+#    If NX = 0, then X(0) should be 0.5 * ( A + B ), and similarly for Y.
+#
+#    Input, integer NXVAL, the number of X evaluation points.
+#
+#    Input, real XVAL(NXVAL), the X evaluation points.
+#
+#    Input, integer NYVAL, the number of Y evaluation points.
+#
+#    Input, real YVAL(NYVAL), the Y evaluation points.
+#
+#    Input, OUT, an optional output target: an array of shape (NXVAL,NYVAL),
+#    such as an np.memmap, or the name of a .npy file to be created.
+#
+#    Input, dtype DTYPE, the type of the result, if OUT is a file name.
+#    The default is float64.
+#
+#    Input, integer BLOCK, the number of rows computed at once when OUT
+#    is given.  By default, a block holds about a million values.
+#
+#    Input, logical CACHE, is true if the basis matrices are to be kept in,
+#    or taken from, the cache of BERNSTEIN_POLY_AB_CACHED.  When OUT is
+#    given, only the Y basis matrix is cached.
+#
+#    Output, real ZVAL(NXVAL,NYVAL), the values of the approximant,
+#    with ZVAL(I,J) the value at (XVAL(I),YVAL(J)).  If OUT was given,
+#    ZVAL is the array, or memory mapped file, holding the result.
+#
+  import numpy as np
+  from bernstein_poly_ab import bernstein_poly_ab
+  from bernstein_poly_ab_cache import bernstein_poly_ab_cached
+  from output_array import output_array
+
+  xval = np.asarray ( xval, dtype = np.float64 )[0:nxval]
+  yval = np.asarray ( yval, dtype = np.float64 )[0:nyval]
+  zdata = np.asarray ( zdata, dtype = np.float64 )
+
+  if ( cache ):
+    by = bernstein_poly_ab_cached ( ny, c, d, yval )
+  else:
+    by = bernstein_poly_ab ( ny, c, d, yval )
+
+  if ( out is None ):
+
+    if ( cache ):
+      bx = bernstein_poly_ab_cached ( nx, a, b, xval )
+    else:
+      bx = bernstein_poly_ab ( nx, a, b, xval )
+#
+#  Choose the cheaper association of BX * ZDATA * BY'.
+#
+    cost_left = nxval * ( nx + 1 ) * ( ny + 1 ) + nxval * ( ny + 1 ) * nyval
+    cost_right = ( nx + 1 ) * ( ny + 1 ) * nyval + nxval * ( nx + 1 ) * nyval
+
+    if ( cost_left <= cost_right ):
+      zval = np.dot ( np.dot ( bx, zdata ), by.T )
+    else:
+      zval = np.dot ( bx, np.dot ( zdata, by.T ) )
+
+  else:
+
+    zval = output_array ( out, ( nxval, nyval ), dtype, \
+      'BERNSTEIN_POLY_AB_APPROX_2D' )
+
+    if ( block is None ):
+      block = 1048576 // max ( 1, nyval )
+    block = max ( 1, block )
+
+    zby = np.dot ( zdata, by.T )
+
+    for lo in range ( 0, nxval, block ):
+      hi = min ( lo + block, nxval )
+      bx = bernstein_poly_ab ( nx, a, b, xval[lo:hi] )
+      zval[lo:hi,:] = np.dot ( bx, zby )
+
+    if ( isinstance ( zval, np.memmap ) ):
+      zval.flush ( )
+
+  return zval
+
+def bernstein_poly_ab_approx_2d_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_APPROX_2D_TEST tests BERNSTEIN_POLY_AB_APPROX_2D.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    16 October 2026
+#
+  import numpy as np
+  import platform
+  from bernstein_poly_ab import bernstein_poly_ab
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_2D_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_AB_APPROX_2D evaluates the Bernstein polynomial' )
+  print ( '  approximant to a function F(X,Y) defined over [A,B]x[C,D].' )
+
+  a = 1.0
+  b = 3.0
+  c = 0.0
+  d = 1.0
+
+  print ( '' )
+  print ( '    NX    NY      Max Error    Max Difference' )
+  print ( '                               from direct sum' )
+  print ( '' )
+
+  for nx, ny in [ ( 0, 0 ), ( 2, 4 ), ( 5, 5 ), ( 10, 20 ), ( 20, 10 ), \
+    ( 40, 40 ) ]:
+#
+#  Generate data values.
+#
+    if ( nx == 0 ):
+      xdata = np.array ( [ 0.5 * ( a + b ) ] )
+    else:
+      xdata = np.linspace ( a, b, nx + 1 )
+
+    if ( ny == 0 ):
+      ydata = np.array ( [ 0.5 * ( c + d ) ] )
+    else:
+      ydata = np.linspace ( c, d, ny + 1 )
+
+    zdata = np.sin ( np.outer ( xdata, np.ones ( ny + 1 ) ) ) \
+      * np.exp ( np.outer ( np.ones ( nx + 1 ), ydata ) )
+#
+#  Compare the true function and the approximant.
+#
+    nxval = 41
+    nyval = 31
+    xval = np.linspace ( a, b, nxval )
+    yval = np.linspace ( c, d, nyval )
+
+    zval = bernstein_poly_ab_approx_2d ( nx, ny, a, b, c, d, zdata, \
+      nxval, xval, nyval, yval )
+
+    ztrue = np.outer ( np.sin ( xval ), np.exp ( yval ) )
+    error_max = np.max ( np.abs ( zval - ztrue ) )
+#
+#  Compare with a direct sum at a few points.
+#
+    diff_max = 0.0
+    for i in range ( 0, nxval, 10 ):
+      bx = bernstein_poly_ab ( nx, a, b, xval[i] )
+      for j in range ( 0, nyval, 10 ):
+        by = bernstein_poly_ab ( ny, c, d, yval[j] )
+        z = np.sum ( zdata * np.outer ( bx, by ) )
+        diff_max = max ( diff_max, abs ( z - zval[i,j] ) )
+
+    print ( '  %4d  %4d  %14.6g  %14.6g' % ( nx, ny, error_max, diff_max ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_2D_TEST' )
+  print ( '  Normal end of execution.' )
+  return
+
+def bernstein_poly_ab_approx_2d_test2 ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_APPROX_2D_TEST2 writes the grid values to a file.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    16 October 2026
+#
+  import numpy as np
+  import os
+  import platform
+  import tempfile
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_2D_TEST2:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_AB_APPROX_2D can write the grid values, a block' )
+  print ( '  of rows at a time, into a memory mapped .npy file.' )
+
+  a = 0.0
+  b = 1.0
+  c = -1.0
+  d = 1.0
+  nx = 8
+  ny = 5
+  xdata = np.linspace ( a, b, nx + 1 )
+  ydata = np.linspace ( c, d, ny + 1 )
+  zdata = np.cos ( np.add.outer ( xdata, ydata ) )
+
+  nxval = 1001
+  nyval = 301
+  xval = np.linspace ( a, b, nxval )
+  yval = np.linspace ( c, d, nyval )
+
+  dirname = tempfile.mkdtemp ( )
+  filename = os.path.join ( dirname, 'bernstein_poly_ab_approx_2d_test2.npy' )
+
+  zval = bernstein_poly_ab_approx_2d ( nx, ny, a, b, c, d, zdata, \
+    nxval, xval, nyval, yval, out = filename, dtype = np.float32, block = 100 )
+  del zval
+
+  zfile = np.load ( filename, mmap_mode = 'r' )
+  zval = bernstein_poly_ab_approx_2d ( nx, ny, a, b, c, d, zdata, \
+    nxval, xval, nyval, yval )
+
+  print ( '' )
+  print ( '  File shape = %s, type = %s' % ( str ( zfile.shape ), zfile.dtype ) )
+  print ( '  Maximum difference from in-memory result = %g' \
+    % ( np.max ( np.abs ( zfile - zval ) ) ) )
+
+  del zfile
+  os.remove ( filename )
+  os.rmdir ( dirname )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_2D_TEST2' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_poly_ab_approx_2d_test ( )
+  bernstein_poly_ab_approx_2d_test2 ( )
+  timestamp ( )
@@ -0,0 +1,167 @@
+#! /usr/bin/env python
+#
+def bernstein_poly_ab_approx_2d_scattered ( nx, ny, a, b, c, d, zdata, \
+  nval, xval, yval, chunk = 65536 ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_APPROX_2D_SCATTERED: 2D Bernstein approximant at scattered points.
+#
+#  Formula:
+#
+#    ZVAL(K) = sum ( 0 <= I <= NX ) sum ( 0 <= J <= NY )
+#      ZDATA(I,J) * BX(I,XVAL(K)) * BY(J,YVAL(K))
+#
+#    where BX(I,X) is the I-th Bernstein basis polynomial of degree NX on
+#    [A,B], and BY(J,Y) is the J-th Bernstein basis polynomial of degree
+#    NY on [C,D].
+#
+#  Discussion:
+#
+#    BERNSTEIN_POLY_AB_APPROX_2D evaluates the approximant on a grid.
+#    This function instead evaluates it at NVAL unrelated points
+#    (XVAL(K),YVAL(K)), that is, ZVAL(K) = BX(XVAL(K))' * ZDATA * BY(YVAL(K)).
+#
+#    The points are processed in chunks of at most CHUNK points.  For each
+#    chunk, the two basis matrices are computed, the X basis matrix is
+#    multiplied by ZDATA, and the result is contracted row by row with the
+#    Y basis matrix.  The temporary storage is therefore proportional to
+#    CHUNK * ( NX + NY + 2 ), however large NVAL may be.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    16 October 2026
+#
+#  Parameters:
+#
+#    Input, integer NX, NY, the degrees of the Bernstein polynomials
+#    in the X and Y directions.  NX and NY must be at least 0.
+#
+#    Input, real A, B, the endpoints of the X interval.
+#    A and B should not be equal.
+#
+#    Input, real C, D, the endpoints of the Y interval.
+#    C and D should not be equal.
+#
+#    Input, real ZDATA(NX+1,NY+1), the data values at the
+#    points of the equally spaced grid on [A,B]x[C,D].
+#
+#    Input, integer NVAL, the number of evaluation points.
+#
+#    Input, real XVAL(NVAL), YVAL(NVAL), the coordinates of the
+#    evaluation points.
+#
+#    Input, integer CHUNK, the number of points to be processed at once.
+#
+#    Output, real ZVAL(NVAL), the values of the approximant at the
+#    evaluation points.
+#
+  import numpy as np
+  from bernstein_poly_ab import bernstein_poly_ab
+
+  xval = np.asarray ( xval, dtype = np.float64 )[0:nval]
+  yval = np.asarray ( yval, dtype = np.float64 )[0:nval]
+  zdata = np.asarray ( zdata, dtype = np.float64 )
+
+  chunk = max ( 1, chunk )
+
+  zval = np.zeros ( nval )
+
+  for lo in range ( 0, nval, chunk ):
+
+    hi = min ( lo + chunk, nval )
+
+    bx = bernstein_poly_ab ( nx, a, b, xval[lo:hi] )
+    by = bernstein_poly_ab ( ny, c, d, yval[lo:hi] )
+
+    zval[lo:hi] = np.einsum ( 'ij,ij->i', np.dot ( bx, zdata ), by )
+
+  return zval
+
+def bernstein_poly_ab_approx_2d_scattered_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_APPROX_2D_SCATTERED_TEST tests BERNSTEIN_POLY_AB_APPROX_2D_SCATTERED.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    16 October 2026
+#
+  import numpy as np
+  import platform
+  from bernstein_poly_ab_approx_2d import bernstein_poly_ab_approx_2d
+  from r8_uniform_01 import r8_uniform_01
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_2D_SCATTERED_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_AB_APPROX_2D_SCATTERED evaluates the Bernstein' )
+  print ( '  approximant to F(X,Y) over [A,B]x[C,D] at scattered points.' )
+
+  a = 1.0
+  b = 3.0
+  c = 0.0
+  d = 1.0
+  nx = 12
+  ny = 7
+
+  xdata = np.linspace ( a, b, nx + 1 )
+  ydata = np.linspace ( c, d, ny + 1 )
+  zdata = np.outer ( np.sin ( xdata ), np.exp ( ydata ) )
+#
+#  Random points in the rectangle.
+#
+  nval = 1000
+  xval = np.zeros ( nval )
+  yval = np.zeros ( nval )
+  seed = 123456789
+  for k in range ( 0, nval ):
+    r, seed = r8_uniform_01 ( seed )
+    xval[k] = a + ( b - a ) * r
+    r, seed = r8_uniform_01 ( seed )
+    yval[k] = c + ( d - c ) * r
+
+  print ( '' )
+  print ( '     CHUNK     Max Difference' )
+  print ( '               from grid values' )
+  print ( '' )
+
+  for chunk in [ 1, 7, 100, 65536 ]:
+
+    zval = bernstein_poly_ab_approx_2d_scattered ( nx, ny, a, b, c, d, \
+      zdata, nval, xval, yval, chunk )
+#
+#  The diagonal of the grid evaluation on XVAL x YVAL gives the same values.
+#
+    zgrid = bernstein_poly_ab_approx_2d ( nx, ny, a, b, c, d, zdata, \
+      nval, xval, nval, yval )
+
+    diff_max = np.max ( np.abs ( zval - np.diag ( zgrid ) ) )
+
+    print ( '  %8d  %14.6g' % ( chunk, diff_max ) )
+
+  error_max = np.max ( np.abs ( zval - np.sin ( xval ) * np.exp ( yval ) ) )
+  print ( '' )
+  print ( '  Maximum error in approximating sin(X)*exp(Y) = %g' % ( error_max ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_2D_SCATTERED_TEST' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_poly_ab_approx_2d_scattered_test ( )
+  timestamp ( )
@@ -0,0 +1,149 @@
+#! /usr/bin/env python
+#
+def bernstein_poly_ab_approx_band ( n, a, b, ydata, nval, xval, \
+  tol = 1.0E-15, block = 65536 ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_APPROX_BAND: banded Bernstein approximant to F(X) on [A,B].
+#
+#  Discussion:
+#
+#    This function computes the same values as BERNSTEIN_POLY_AB_APPROX,
+#    for points in [A,B], but uses only the basis polynomials whose values
+#    exceed TOL, as found by BERNSTEIN_POLY_01_BAND.  Each point is then
+#    handled in O(sqrt(N)) operations, instead of O(N).
+#
+#    The sum of the basis values left out is at most TOL, so the result
+#    differs from the full sum by at most TOL * max ( abs ( YDATA ) ).
+#
+#    The points are processed in blocks of BLOCK points.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the Bernstein polynomial
+#    to be used.  N must be at least 0.
+#
+#    Input, real A, B, the endpoints of the interval on which the
+#    approximant is based.  A and B should not be equal.
+#
+#    Input, real YDATA(N+1), the data values at N+1 equally
+#    spaced points in [A,B], or an array of shape (K,N+1), each row of
+#    which holds the data for a separate function.
+#
+#    Input, integer NVAL, the number of points at which the
+#    approximant is to be evaluated.
+#
+#    Input, real XVAL(NVAL), the evaluation points, which must lie in [A,B].
+#
+#    Input, real TOL, the size below which basis values may be left out.
+#
+#    Input, integer BLOCK, the number of points processed at once.
+#
+#    Output, real YVAL(NVAL), or YVAL(K,NVAL), the values of the
+#    approximant at XVAL.
+#
+  import numpy as np
+  from sys import exit
+  from bernstein_poly_01_band import bernstein_poly_01_band
+
+  if ( b == a ):
+    print ( '' )
+    print ( 'BERNSTEIN_POLY_AB_APPROX_BAND - Fatal error!' )
+    print ( '  A = B = %g' % ( a ) )
+    exit ( 'BERNSTEIN_POLY_AB_APPROX_BAND - Fatal error!' )
+
+  xval = np.asarray ( xval, dtype = np.float64 )[0:nval]
+  ydata = np.asarray ( ydata, dtype = np.float64 )
+
+  if ( np.any ( xval < min ( a, b ) ) or np.any ( max ( a, b ) < xval ) ):
+    print ( '' )
+    print ( 'BERNSTEIN_POLY_AB_APPROX_BAND - Fatal error!' )
+    print ( '  Every XVAL must lie in [A,B].' )
+    exit ( 'BERNSTEIN_POLY_AB_APPROX_BAND - Fatal error!' )
+
+  yval = np.zeros ( ydata.shape[0:-1] + ( nval, ) )
+  block = max ( 1, block )
+
+  for lo in range ( 0, nval, block ):
+    hi = min ( lo + block, nval )
+    t = np.clip ( ( xval[lo:hi] - a ) / ( b - a ), 0.0, 1.0 )
+    start, band = bernstein_poly_01_band ( n, t, tol )
+    index = start[:,np.newaxis] + np.arange ( band.shape[-1] )
+    yval[...,lo:hi] = np.einsum ( '...ij,ij->...i', ydata[...,index], band )
+
+  return yval
+
+def bernstein_poly_ab_approx_band_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_APPROX_BAND_TEST tests BERNSTEIN_POLY_AB_APPROX_BAND.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  import time
+  from bernstein_poly_ab_ratio import bernstein_poly_ab_ratio
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_BAND_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_AB_APPROX_BAND evaluates a Bernstein approximant' )
+  print ( '  using only the significant basis polynomials.' )
+
+  a = 1.0
+  b = 3.0
+  nval = 2001
+  xval = np.linspace ( a, b, nval )
+
+  print ( '' )
+  print ( '      N       TOL    Max Difference   Time       Time' )
+  print ( '                     from full sum    full       band' )
+  print ( '' )
+
+  for n in [ 10, 100, 1000, 10000 ]:
+
+    xdata = np.linspace ( a, b, n + 1 )
+    ydata = np.vstack ( ( np.sin ( xdata ), np.abs ( xdata - 2.0 ) ) )
+
+    t = time.time ( )
+    yval1 = np.dot ( ydata, bernstein_poly_ab_ratio ( n, a, b, xval ).T )
+    t1 = time.time ( ) - t
+
+    for tol in [ 1.0E-06, 1.0E-15 ]:
+
+      t = time.time ( )
+      yval2 = bernstein_poly_ab_approx_band ( n, a, b, ydata, nval, xval, tol )
+      t2 = time.time ( ) - t
+
+      print ( '  %5d  %8.1e  %14.6g  %9.4f  %9.4f' % ( n, tol, \
+        np.max ( np.abs ( yval1 - yval2 ) ), t1, t2 ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_BAND_TEST:' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_poly_ab_approx_band_test ( )
+  timestamp ( )
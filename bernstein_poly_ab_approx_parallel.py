@@ -0,0 +1,343 @@
+#! /usr/bin/env python
+#
+def bernstein_poly_ab_approx_parallel ( n, a, b, ydata, nval, xval, \
+  workers = None, out = None, dtype = None, block = 65536 ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_APPROX_PARALLEL evaluates a Bernstein approximant using processes.
+#
+#  Discussion:
+#
+#    This function computes the same values as BERNSTEIN_POLY_AB_APPROX,
+#    but divides the work among a pool of WORKERS processes.
+#
+#    XVAL is split into contiguous shards, a few per worker.  The points
+#    are copied once into a shared memory block, and the result is written
+#    into another, or, if OUT is a memory mapped file, directly into the
+#    file.  The degree, interval and data YDATA, and the names of the shared
+#    arrays, are sent to each worker process once, when it starts, and the
+#    worker attaches to the arrays.  Each task then carries only the
+#    boundaries LO and HI of its shard, and the worker writes the values
+#    for XVAL(LO:HI) into its own part of the result, so that no points or
+#    values pass through the pipes between the processes.
+#
+#    Within a worker, a shard is evaluated in blocks of BLOCK points by
+#    BERNSTEIN_POLY_AB_APPROX.
+#
+#    Starting the processes costs some time, so this is only worthwhile
+#    for large NVAL.  If WORKERS is 1, or there are too few points to
+#    share out, the values are computed directly in the calling process.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the Bernstein polynomial
+#    to be used.  N must be at least 0.
+#
+#    Input, real A, B, the endpoints of the interval on which the
+#    approximant is based.  A and B should not be equal.
+#
+#    Input, real YDATA(N+1), the data values at N+1 equally
+#    spaced points in [A,B], or an array of shape (K,N+1), each row of
+#    which holds the data for a separate function.
+#
+#    Input, integer NVAL, the number of points at which the
+#    approximant is to be evaluated.
+#
+#    Input, real XVAL(NVAL), the evaluation points.
+#
+#    Input, integer WORKERS, the number of processes to use.
+#    The default is the number of processors.
+#
+#    Input, OUT, an optional output target: an array of the shape of YVAL,
+#    such as an np.memmap, or the name of a .npy file to be created.
+#
+#    Input, dtype DTYPE, the type of the result, if OUT is a file name.
+#    The default is float64.
+#
+#    Input, integer BLOCK, the number of points each worker evaluates
+#    at once.
+#
+#    Output, real YVAL(NVAL), or YVAL(K,NVAL), the values of the
+#    approximant at XVAL.  If OUT was given, YVAL is the array, or memory
+#    mapped file, holding the result.
+#
+  import mmap
+  import numpy as np
+  import os
+  from concurrent.futures import ProcessPoolExecutor
+  from multiprocessing import shared_memory
+  from bernstein_poly_ab_approx import bernstein_poly_ab_approx
+  from output_array import output_array
+#
+#  Import the worker functions by module name, so that they can be found
+#  by the worker processes even when this file is run as a script.
+#
+  from bernstein_poly_ab_approx_parallel import \
+    bernstein_poly_ab_approx_parallel_init, \
+    bernstein_poly_ab_approx_parallel_shard
+
+  xval = np.asarray ( xval, dtype = np.float64 )[0:nval]
+  ydata = np.asarray ( ydata, dtype = np.float64 )
+
+  if ( workers is None ):
+    workers = os.cpu_count ( ) or 1
+  workers = max ( 1, workers )
+
+  yval = output_array ( out, ydata.shape[0:-1] + ( nval, ), dtype, \
+    'BERNSTEIN_POLY_AB_APPROX_PARALLEL' )
+
+  nshard = min ( 4 * workers, nval // max ( 1, block ) )
+
+  if ( workers == 1 or nshard < 2 ):
+    return bernstein_poly_ab_approx ( n, a, b, ydata, nval, xval, \
+      out = yval, block = block )
+
+  bounds = np.linspace ( 0, nval, nshard + 1 ).astype ( int )
+#
+#  Copy the points into shared memory.
+#
+  xshm = shared_memory.SharedMemory ( create = True, \
+    size = max ( 1, xval.nbytes ) )
+  xshared = np.ndarray ( xval.shape, dtype = np.float64, buffer = xshm.buf )
+  xshared[...] = xval
+#
+#  A memory mapped file which is not a view of another one is opened by the
+#  workers themselves.  Any other result is written into shared memory, and
+#  copied to YVAL at the end.
+#
+  yshm = None
+  yshared = None
+
+  if ( isinstance ( yval, np.memmap ) and isinstance ( yval.base, mmap.mmap ) \
+    and yval.filename is not None and yval.flags.c_contiguous ):
+    target = ( 'file', yval.filename, yval.offset, yval.shape, yval.dtype )
+  else:
+    yshm = shared_memory.SharedMemory ( create = True, \
+      size = max ( 1, yval.nbytes ) )
+    yshared = np.ndarray ( yval.shape, dtype = yval.dtype, buffer = yshm.buf )
+    target = ( 'shared', yshm.name, 0, yval.shape, yval.dtype )
+
+  try:
+
+    with ProcessPoolExecutor ( max_workers = workers, \
+      initializer = bernstein_poly_ab_approx_parallel_init, \
+      initargs = ( n, a, b, ydata, block, xshm.name, nval, target ) ) \
+      as executor:
+
+      tasks = [ executor.submit ( bernstein_poly_ab_approx_parallel_shard, \
+        bounds[i], bounds[i+1] ) for i in range ( 0, nshard ) ]
+
+      for task in tasks:
+        task.result ( )
+
+    if ( yshared is not None ):
+      yval[...] = yshared
+
+  finally:
+
+    del xshared
+    xshm.close ( )
+    xshm.unlink ( )
+    if ( yshm is not None ):
+      del yshared
+      yshm.close ( )
+      yshm.unlink ( )
+
+  if ( isinstance ( yval, np.memmap ) ):
+    yval.flush ( )
+
+  return yval
+
+#
+#  Data set once in each worker process by BERNSTEIN_POLY_AB_APPROX_PARALLEL_INIT.
+#
+bernstein_poly_ab_approx_parallel_data = { }
+
+def bernstein_poly_ab_approx_parallel_init ( n, a, b, ydata, block, xname, \
+  nval, target ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_APPROX_PARALLEL_INIT attaches a worker process to the shared data.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, real A, B, real YDATA(N+1) or YDATA(K,N+1),
+#    integer BLOCK, the arguments of BERNSTEIN_POLY_AB_APPROX_PARALLEL.
+#
+#    Input, string XNAME, the name of the shared memory block holding
+#    XVAL(NVAL).
+#
+#    Input, integer NVAL, the number of points.
+#
+#    Input, tuple TARGET, ( KIND, NAME, OFFSET, SHAPE, DTYPE ), where KIND
+#    is 'shared', for a shared memory block called NAME, or 'file', for a
+#    file called NAME, holding the result from byte OFFSET on.
+#
+  import numpy as np
+  from multiprocessing import shared_memory
+
+  kind, name, offset, shape, dtype = target
+
+  xshm = shared_memory.SharedMemory ( name = xname )
+  xval = np.ndarray ( ( nval, ), dtype = np.float64, buffer = xshm.buf )
+
+  if ( kind == 'file' ):
+    yshm = None
+    yval = np.memmap ( name, dtype = dtype, mode = 'r+', offset = offset, \
+      shape = shape )
+  else:
+    yshm = shared_memory.SharedMemory ( name = name )
+    yval = np.ndarray ( shape, dtype = dtype, buffer = yshm.buf )
+
+  bernstein_poly_ab_approx_parallel_data['n'] = n
+  bernstein_poly_ab_approx_parallel_data['a'] = a
+  bernstein_poly_ab_approx_parallel_data['b'] = b
+  bernstein_poly_ab_approx_parallel_data['ydata'] = ydata
+  bernstein_poly_ab_approx_parallel_data['block'] = block
+  bernstein_poly_ab_approx_parallel_data['xval'] = xval
+  bernstein_poly_ab_approx_parallel_data['yval'] = yval
+#
+#  Keep the shared memory blocks open for the life of the worker.
+#
+  bernstein_poly_ab_approx_parallel_data['shm'] = ( xshm, yshm )
+
+  return
+
+def bernstein_poly_ab_approx_parallel_shard ( lo, hi ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_APPROX_PARALLEL_SHARD evaluates one shard in a worker process.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer LO, HI, the shard is XVAL(LO:HI).  The values are
+#    written into YVAL(...,LO:HI).
+#
+  from bernstein_poly_ab_approx import bernstein_poly_ab_approx
+
+  data = bernstein_poly_ab_approx_parallel_data
+
+  bernstein_poly_ab_approx ( data['n'], data['a'], data['b'], data['ydata'], \
+    hi - lo, data['xval'][lo:hi], out = data['yval'][...,lo:hi], \
+    block = data['block'] )
+
+  return
+
+def bernstein_poly_ab_approx_parallel_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_APPROX_PARALLEL_TEST tests BERNSTEIN_POLY_AB_APPROX_PARALLEL.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    16 October 2026
+#
+  import numpy as np
+  import os
+  import platform
+  import tempfile
+  import time
+  from bernstein_poly_ab_approx import bernstein_poly_ab_approx
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_PARALLEL_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_AB_APPROX_PARALLEL evaluates a Bernstein' )
+  print ( '  approximant using a pool of processes.' )
+
+  a = 1.0
+  b = 3.0
+  degree = 20
+  xdata = np.linspace ( a, b, degree + 1 )
+  ydata = np.sin ( xdata )
+
+  nval = 2000000
+  xval = np.linspace ( a, b, nval )
+
+  t = time.time ( )
+  yval1 = bernstein_poly_ab_approx ( degree, a, b, ydata, nval, xval, \
+    out = np.zeros ( nval ) )
+  t1 = time.time ( ) - t
+
+  print ( '' )
+  print ( '  Workers        Time    Max Difference' )
+  print ( '' )
+  print ( '   serial  %10.4f' % ( t1 ) )
+
+  for workers in [ 1, 2, 4 ]:
+
+    t = time.time ( )
+    yval = bernstein_poly_ab_approx_parallel ( degree, a, b, ydata, nval, \
+      xval, workers = workers )
+    t2 = time.time ( ) - t
+
+    print ( '  %7d  %10.4f  %14.6g' \
+      % ( workers, t2, np.max ( np.abs ( yval - yval1 ) ) ) )
+#
+#  Several functions at once, written by the workers straight into a
+#  memory mapped .npy file.
+#
+  ydata2 = np.array ( [ np.sin ( xdata ), np.cos ( xdata ) ] )
+
+  dirname = tempfile.mkdtemp ( )
+  filename = os.path.join ( dirname, 'bernstein_poly_ab_approx_parallel.npy' )
+
+  yval = bernstein_poly_ab_approx_parallel ( degree, a, b, ydata2, nval, \
+    xval, workers = 2, out = filename )
+  del yval
+
+  yfile = np.load ( filename, mmap_mode = 'r' )
+
+  print ( '' )
+  print ( '  File shape = %s' % ( str ( yfile.shape ) ) )
+  print ( '  Maximum difference from serial result = %g' \
+    % ( np.max ( np.abs ( yfile[0] - yval1 ) ) ) )
+
+  del yfile
+  os.remove ( filename )
+  os.rmdir ( dirname )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_PARALLEL_TEST' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_poly_ab_approx_parallel_test ( )
+  timestamp ( )
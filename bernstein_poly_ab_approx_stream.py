@@ -0,0 +1,147 @@
+#! /usr/bin/env python
+#
+def bernstein_poly_ab_approx_stream ( n, a, b, ydata, xchunks, block = 65536 ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_APPROX_STREAM evaluates a Bernstein approximant on a stream.
+#
+#  Discussion:
+#
+#    This is a generator version of BERNSTEIN_POLY_AB_APPROX.  Instead of
+#    a vector XVAL held in memory, it takes any iterable XCHUNKS which
+#    produces the evaluation points a piece at a time, such as a function
+#    reading a file or a socket, and for each piece it yields the values
+#    of the approximant at those points.
+#
+#    Each piece is evaluated in blocks of at most BLOCK points, so that the
+#    working storage is about BLOCK * ( N + 1 ) values, in addition to the
+#    piece itself and its result.  Nothing is kept from one piece to the
+#    next, so the sequence of points may be arbitrarily long.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    16 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the Bernstein polynomial
+#    to be used.  N must be at least 0.
+#
+#    Input, real A, B, the endpoints of the interval on which the
+#    approximant is based.  A and B should not be equal.
+#
+#    Input, real YDATA(N+1), the data values at N+1 equally
+#    spaced points in [A,B], or an array of shape (K,N+1), each row of
+#    which holds the data for a separate function.
+#
+#    Input, iterable XCHUNKS, produces vectors of evaluation points.
+#
+#    Input, integer BLOCK, the largest number of points to be
+#    evaluated at once.
+#
+#    Output (yielded), real YCHUNK(M), the values of the approximant at
+#    the M points of the corresponding piece of XCHUNKS, or an array of
+#    shape (K,M) if YDATA has K rows.
+#
+  import numpy as np
+  from bernstein_poly_ab_approx import bernstein_poly_ab_approx
+
+  ydata = np.asarray ( ydata, dtype = np.float64 )
+  block = max ( 1, block )
+
+  for xchunk in xchunks:
+
+    xchunk = np.ravel ( np.asarray ( xchunk, dtype = np.float64 ) )
+    m = xchunk.size
+
+    if ( m <= block ):
+      yield bernstein_poly_ab_approx ( n, a, b, ydata, m, xchunk )
+      continue
+
+    ychunk = np.zeros ( ydata.shape[0:-1] + ( m, ) )
+
+    for lo in range ( 0, m, block ):
+      hi = min ( lo + block, m )
+      ychunk[...,lo:hi] = bernstein_poly_ab_approx ( n, a, b, ydata, \
+        hi - lo, xchunk[lo:hi] )
+
+    yield ychunk
+
+def bernstein_poly_ab_approx_stream_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_APPROX_STREAM_TEST tests BERNSTEIN_POLY_AB_APPROX_STREAM.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    16 October 2026
+#
+  import numpy as np
+  import platform
+  from bernstein_poly_ab_approx import bernstein_poly_ab_approx
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_STREAM_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_AB_APPROX_STREAM evaluates a Bernstein' )
+  print ( '  approximant on a sequence of pieces of the X axis.' )
+
+  a = 1.0
+  b = 3.0
+  degree = 15
+  xdata = np.linspace ( a, b, degree + 1 )
+  ydata = np.sin ( xdata )
+#
+#  A generator producing NCHUNK pieces of M points each, never all at once.
+#
+  nchunk = 50
+  m = 1000
+
+  def pieces ( ):
+    for i in range ( 0, nchunk ):
+      lo = a + ( b - a ) * i / nchunk
+      hi = a + ( b - a ) * ( i + 1 ) / nchunk
+      yield np.linspace ( lo, hi, m, endpoint = False )
+
+  print ( '' )
+  print ( '     BLOCK   Pieces      Points  Max Difference' )
+  print ( '' )
+
+  for block in [ 100, 1000, 65536 ]:
+
+    npiece = 0
+    npoint = 0
+    error_max = 0.0
+
+    for xchunk, ychunk in zip ( pieces ( ), \
+      bernstein_poly_ab_approx_stream ( degree, a, b, ydata, pieces ( ), \
+      block ) ):
+      npiece = npiece + 1
+      npoint = npoint + ychunk.size
+      error_max = max ( error_max, np.max ( np.abs ( ychunk \
+        - bernstein_poly_ab_approx ( degree, a, b, ydata, m, xchunk ) ) ) )
+
+    print ( '  %8d  %7d  %10d  %14.6g' % ( block, npiece, npoint, error_max ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_APPROX_STREAM_TEST' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_poly_ab_approx_stream_test ( )
+  timestamp ( )
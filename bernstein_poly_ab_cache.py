@@ -0,0 +1,278 @@
+#! /usr/bin/env python
+#
+#  The cache shared by the functions in this file.
+#
+#  ENTRIES maps a key ( N, A, B, shape, digest of X ) to a basis matrix,
+#  with the most recently used entry last.
+#
+import collections
+import threading
+
+bernstein_poly_ab_cache_state = {
+  'entries': collections.OrderedDict ( ),
+  'nbytes': 0,
+  'budget': 64 * 1024 * 1024,
+  'hits': 0,
+  'misses': 0,
+  'lock': threading.Lock ( ) }
+
+def bernstein_poly_ab_cached ( n, a, b, x ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_CACHED evaluates the Bernstein polynomials on [A,B], with caching.
+#
+#  Discussion:
+#
+#    This function returns the same values as BERNSTEIN_POLY_AB ( N, A, B, X ),
+#    but keeps the results in a cache shared by the whole process.  When
+#    the same degree, interval and points are requested again, the stored
+#    matrix is returned, and no basis values are computed.
+#
+#    Entries are identified by N, A, B, the shape of X, and a hash of the
+#    bytes of X.  When the total size of the stored matrices would exceed
+#    the budget set by BERNSTEIN_POLY_AB_CACHE_BUDGET, the least recently
+#    used entries are discarded.  A result larger than the whole budget is
+#    returned but not stored.
+#
+#    The returned array is shared with the cache, and is marked read-only.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the Bernstein polynomials to be used.
+#
+#    Input, real A, B, the endpoints of the interval on which the
+#    polynomials are to be based.  A and B should not be equal.
+#
+#    Input, real X, the evaluation point, or an array of points.
+#
+#    Output, real P(N+1), the values of the N+1 Bernstein polynomials at X.
+#    If X is an array of shape S, then P has shape S+(N+1).
+#
+  import hashlib
+  import numpy as np
+  from bernstein_poly_ab import bernstein_poly_ab
+
+  state = bernstein_poly_ab_cache_state
+
+  x = np.ascontiguousarray ( x, dtype = np.float64 )
+  digest = hashlib.blake2b ( x.data, digest_size = 16 ).digest ( )
+  key = ( n, float ( a ), float ( b ), x.shape, digest )
+
+  with state['lock']:
+    p = state['entries'].get ( key )
+    if ( p is not None ):
+      state['entries'].move_to_end ( key )
+      state['hits'] = state['hits'] + 1
+      return p
+    state['misses'] = state['misses'] + 1
+
+  p = bernstein_poly_ab ( n, a, b, x )
+  p.flags.writeable = False
+
+  with state['lock']:
+    if ( p.nbytes <= state['budget'] and key not in state['entries'] ):
+      state['entries'][key] = p
+      state['nbytes'] = state['nbytes'] + p.nbytes
+      bernstein_poly_ab_cache_trim ( state['budget'] )
+
+  return p
+
+def bernstein_poly_ab_cache_trim ( budget ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_CACHE_TRIM discards cache entries until they fit a budget.
+#
+#  Discussion:
+#
+#    The caller must hold the cache lock.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer BUDGET, the number of bytes which may be kept.
+#
+  state = bernstein_poly_ab_cache_state
+
+  while ( budget < state['nbytes'] ):
+    key, p = state['entries'].popitem ( last = False )
+    state['nbytes'] = state['nbytes'] - p.nbytes
+
+  return
+
+def bernstein_poly_ab_cache_budget ( budget ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_CACHE_BUDGET sets the size limit of the basis cache.
+#
+#  Discussion:
+#
+#    The default budget is 64 megabytes.  If the new budget is smaller than
+#    the entries already stored, the least recently used ones are discarded.
+#    A budget of 0 disables the cache.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer BUDGET, the number of bytes of basis values which
+#    may be kept.
+#
+  state = bernstein_poly_ab_cache_state
+
+  with state['lock']:
+    state['budget'] = max ( 0, int ( budget ) )
+    bernstein_poly_ab_cache_trim ( state['budget'] )
+
+  return
+
+def bernstein_poly_ab_cache_clear ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_CACHE_CLEAR empties the basis cache and resets its counters.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  state = bernstein_poly_ab_cache_state
+
+  with state['lock']:
+    state['entries'].clear ( )
+    state['nbytes'] = 0
+    state['hits'] = 0
+    state['misses'] = 0
+
+  return
+
+def bernstein_poly_ab_cache_info ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_CACHE_INFO reports the state of the basis cache.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Output, dict INFO, with the number of cache 'hits' and 'misses',
+#    the number of 'entries' stored, their total size 'nbytes', and
+#    the 'budget'.
+#
+  state = bernstein_poly_ab_cache_state
+
+  with state['lock']:
+    info = { 'hits': state['hits'], 'misses': state['misses'], \
+      'entries': len ( state['entries'] ), 'nbytes': state['nbytes'], \
+      'budget': state['budget'] }
+
+  return info
+
+def bernstein_poly_ab_cache_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_CACHE_TEST tests BERNSTEIN_POLY_AB_CACHED.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  from bernstein_poly_ab import bernstein_poly_ab
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_CACHE_TEST' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_AB_CACHED keeps recently computed basis' )
+  print ( '  matrices, and returns them when they are requested again.' )
+
+  bernstein_poly_ab_cache_clear ( )
+
+  a = 0.0
+  b = 1.0
+  x = np.linspace ( a, b, 501 )
+  y = np.linspace ( a, b, 1001 )
+
+  print ( '' )
+  print ( '  Request                       Hits  Misses  Entries     Bytes' )
+  print ( '' )
+
+  requests = [ ( 10, x, 'N=10, 501 points' ), \
+               ( 10, x, 'N=10, 501 points again' ), \
+               ( 20, x, 'N=20, 501 points' ), \
+               ( 10, y, 'N=10, 1001 points' ), \
+               ( 10, x.copy ( ), 'N=10, copy of 501 points' ) ]
+
+  for n, xval, label in requests:
+    p = bernstein_poly_ab_cached ( n, a, b, xval )
+    info = bernstein_poly_ab_cache_info ( )
+    print ( '  %-28s  %4d  %6d  %7d  %8d' % ( label, info['hits'], \
+      info['misses'], info['entries'], info['nbytes'] ) )
+
+  diff = np.max ( np.abs ( p - bernstein_poly_ab ( 10, a, b, x ) ) )
+  print ( '' )
+  print ( '  Maximum difference from BERNSTEIN_POLY_AB = %g' % ( diff ) )
+#
+#  A smaller budget discards the least recently used entries.
+#
+  bernstein_poly_ab_cache_budget ( 100000 )
+  info = bernstein_poly_ab_cache_info ( )
+  print ( '' )
+  print ( '  With a budget of %d bytes, %d entries of %d bytes remain.' \
+    % ( info['budget'], info['entries'], info['nbytes'] ) )
+
+  bernstein_poly_ab_cache_budget ( 64 * 1024 * 1024 )
+  bernstein_poly_ab_cache_clear ( )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_CACHE_TEST' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_poly_ab_cache_test ( )
+  timestamp ( )
@@ -0,0 +1,238 @@
+#! /usr/bin/env python
+#
+def bernstein_poly_ab_derivative ( n, a, b, ydata, nval, xval, order = 1 ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_DERIVATIVE: derivative of a Bernstein approximant on [A,B].
+#
+#  Discussion:
+#
+#    The derivative of a polynomial in Bernstein form is again a polynomial
+#    in Bernstein form, of one lower degree:
+#
+#      d/dX sum ( 0 <= I <= N ) Y(I) * B(N,I)(X)
+#        = N / ( B - A ) * sum ( 0 <= I <= N-1 ) ( Y(I+1) - Y(I) ) * B(N-1,I)(X)
+#
+#    Applying this R times, the R-th derivative has the coefficients
+#
+#      N! / (N-R)! / ( B - A )^R * DELTA^R Y(I),  0 <= I <= N-R
+#
+#    where DELTA^R is the R-th forward difference.  These are formed once,
+#    in O(N*R) operations, and evaluated by BERNSTEIN_POLY_AB_APPROX at
+#    degree N-R.  If R exceeds N, the derivative is zero.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the Bernstein polynomial
+#    to be used.  N must be at least 0.
+#
+#    Input, real A, B, the endpoints of the interval on which the
+#    approximant is based.  A and B should not be equal.
+#
+#    Input, real YDATA(N+1), the data values at N+1 equally
+#    spaced points in [A,B], or an array of shape (K,N+1), each row of
+#    which holds the data for a separate function.
+#
+#    Input, integer NVAL, the number of points at which the
+#    derivative is to be evaluated.
+#
+#    Input, real XVAL(NVAL), the evaluation points.
+#
+#    Input, integer ORDER, the order R of the derivative.  R must be
+#    at least 0.
+#
+#    Output, real YVAL(NVAL), or YVAL(K,NVAL), the values of the R-th
+#    derivative of the approximant at XVAL.
+#
+  import numpy as np
+  from sys import exit
+  from bernstein_poly_ab_approx import bernstein_poly_ab_approx
+
+  if ( order < 0 ):
+    print ( '' )
+    print ( 'BERNSTEIN_POLY_AB_DERIVATIVE - Fatal error!' )
+    print ( '  ORDER = %d < 0.' % ( order ) )
+    exit ( 'BERNSTEIN_POLY_AB_DERIVATIVE - Fatal error!' )
+
+  ydata = np.asarray ( ydata, dtype = np.float64 )
+
+  if ( n < order ):
+    return np.zeros ( ydata.shape[0:-1] + ( nval, ) )
+
+  scale = 1.0
+  for i in range ( 0, order ):
+    scale = scale * ( n - i ) / ( b - a )
+
+  ddata = scale * np.diff ( ydata, order, axis = -1 )
+
+  yval = bernstein_poly_ab_approx ( n - order, a, b, ddata, nval, xval )
+
+  return yval
+
+def bernstein_poly_ab_value_derivative ( n, a, b, ydata, nval, xval ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_VALUE_DERIVATIVE: value and derivative of a Bernstein approximant.
+#
+#  Discussion:
+#
+#    The value and the first derivative are both computed from the basis
+#    polynomials of degree N-1, which are evaluated only once.  With
+#    S = ( X - A ) / ( B - A ), and Z(I) = sum over J of the degree N-1
+#    basis values times Y(I+J), for I = 0 and 1:
+#
+#      value      = ( 1 - S ) * Z(0) + S * Z(1)
+#      derivative = N / ( B - A ) * ( Z(1) - Z(0) )
+#
+#    which is one step of de Casteljau's algorithm.  This suits Newton-type
+#    iterations, which need both at each step.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the Bernstein polynomial
+#    to be used.  N must be at least 0.
+#
+#    Input, real A, B, the endpoints of the interval on which the
+#    approximant is based.  A and B should not be equal.
+#
+#    Input, real YDATA(N+1), or YDATA(K,N+1), the data values.
+#
+#    Input, integer NVAL, the number of evaluation points.
+#
+#    Input, real XVAL(NVAL), the evaluation points.
+#
+#    Output, real YVAL(NVAL), or YVAL(K,NVAL), the values of the
+#    approximant at XVAL.
+#
+#    Output, real DVAL(NVAL), or DVAL(K,NVAL), the values of its
+#    first derivative at XVAL.
+#
+  import numpy as np
+  from bernstein_poly_ab import bernstein_poly_ab
+
+  xval = np.asarray ( xval, dtype = np.float64 )[0:nval]
+  ydata = np.asarray ( ydata, dtype = np.float64 )
+
+  if ( n == 0 ):
+    yval = np.multiply.outer ( ydata[...,0], np.ones ( nval ) )
+    dval = np.zeros ( yval.shape )
+    return yval, dval
+
+  bvec = bernstein_poly_ab ( n - 1, a, b, xval )
+
+  z0 = np.dot ( ydata[...,0:n], bvec.T )
+  z1 = np.dot ( ydata[...,1:n+1], bvec.T )
+
+  yval = ( ( b - xval ) * z0 + ( xval - a ) * z1 ) / ( b - a )
+  dval = n * ( z1 - z0 ) / ( b - a )
+
+  return yval, dval
+
+def bernstein_poly_ab_derivative_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_DERIVATIVE_TEST tests BERNSTEIN_POLY_AB_DERIVATIVE.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  from bernstein_poly_ab_approx import bernstein_poly_ab_approx
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_DERIVATIVE_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_AB_DERIVATIVE evaluates derivatives of a' )
+  print ( '  Bernstein approximant.' )
+#
+#  Use the Bernstein coefficients of a cubic directly:
+#  P(X) = X^3 on [0,2] has Bernstein coefficients 0, 0, 0, 8.
+#
+  a = 0.0
+  b = 2.0
+  n = 3
+  ydata = np.array ( [ 0.0, 0.0, 0.0, 8.0 ] )
+  nval = 5
+  xval = np.linspace ( a, b, nval )
+
+  print ( '' )
+  print ( '  P(X) = X^3 on [0,2], as a Bernstein polynomial of degree 3:' )
+  print ( '' )
+  print ( '         X         P          P\'         P\'\'        P\'\'\'       P\'\'\'\'' )
+  print ( '' )
+
+  d = [ bernstein_poly_ab_derivative ( n, a, b, ydata, nval, xval, order ) \
+    for order in range ( 0, 5 ) ]
+
+  for j in range ( 0, nval ):
+    print ( '  %8.4f  %10.4f  %10.4f  %10.4f  %10.4f  %10.4f' % ( xval[j], \
+      d[0][j], d[1][j], d[2][j], d[3][j], d[4][j] ) )
+#
+#  Compare with a centered difference, for several functions at once.
+#
+  a = 1.0
+  b = 3.0
+  n = 20
+  xdata = np.linspace ( a, b, n + 1 )
+  ydata = np.vstack ( ( np.sin ( xdata ), np.exp ( xdata ) ) )
+  nval = 101
+  xval = np.linspace ( a, b, nval )
+  h = 1.0E-05
+
+  dval = bernstein_poly_ab_derivative ( n, a, b, ydata, nval, xval )
+  fp = bernstein_poly_ab_approx ( n, a, b, ydata, nval, xval + h )
+  fm = bernstein_poly_ab_approx ( n, a, b, ydata, nval, xval - h )
+
+  print ( '' )
+  print ( '  Degree 20 approximants to sin(x) and exp(x) on [1,3]:' )
+  print ( '  Maximum difference from centered differences = %g' \
+    % ( np.max ( np.abs ( dval - ( fp - fm ) / 2.0 / h ) ) ) )
+#
+#  The combined function.
+#
+  yval, dval2 = bernstein_poly_ab_value_derivative ( n, a, b, ydata, nval, \
+    xval )
+
+  print ( '  BERNSTEIN_POLY_AB_VALUE_DERIVATIVE:' )
+  print ( '    Maximum difference in values =      %g' % ( np.max ( np.abs ( \
+    yval - bernstein_poly_ab_approx ( n, a, b, ydata, nval, xval ) ) ) ) )
+  print ( '    Maximum difference in derivatives = %g' \
+    % ( np.max ( np.abs ( dval2 - dval ) ) ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_DERIVATIVE_TEST:' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_poly_ab_derivative_test ( )
+  timestamp ( )
@@ -0,0 +1,223 @@
+#! /usr/bin/env python
+#
+def bernstein_poly_ab_antiderivative ( n, a, b, ydata ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_ANTIDERIVATIVE: antiderivative of a Bernstein polynomial on [A,B].
+#
+#  Discussion:
+#
+#    Each Bernstein basis polynomial of degree N on [A,B] has the integral
+#    ( B - A ) / ( N + 1 ) over [A,B], and its antiderivative which
+#    vanishes at A is
+#
+#      ( B - A ) / ( N + 1 ) * sum ( I < J <= N+1 ) B(N+1,J)(X)
+#
+#    Hence the antiderivative of sum ( 0 <= I <= N ) Y(I) * B(N,I)(X),
+#    which is zero at A, has the Bernstein coefficients of degree N+1
+#
+#      F(0) = 0
+#      F(J) = ( B - A ) / ( N + 1 ) * ( Y(0) + ... + Y(J-1) ),  1 <= J <= N+1
+#
+#    which are formed by a single cumulative sum.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the Bernstein polynomial.
+#    N must be at least 0.
+#
+#    Input, real A, B, the endpoints of the interval.
+#
+#    Input, real YDATA(N+1), the Bernstein coefficients, or an array of
+#    shape (K,N+1), each row of which holds a separate polynomial.
+#
+#    Output, real FDATA(N+2), or FDATA(K,N+2), the Bernstein coefficients
+#    of degree N+1 of the antiderivative.
+#
+  import numpy as np
+
+  ydata = np.asarray ( ydata, dtype = np.float64 )
+
+  fdata = np.zeros ( ydata.shape[0:-1] + ( n + 2, ) )
+  fdata[...,1:n+2] = ( b - a ) / ( n + 1 ) * np.cumsum ( ydata, axis = -1 )
+
+  return fdata
+
+def bernstein_poly_ab_integral ( n, a, b, ydata, c = None, d = None ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_INTEGRAL integrates a Bernstein polynomial on [A,B].
+#
+#  Discussion:
+#
+#    Since each basis polynomial has the integral ( B - A ) / ( N + 1 )
+#    over [A,B], the integral of sum ( 0 <= I <= N ) Y(I) * B(N,I)(X)
+#    over [A,B] is
+#
+#      ( B - A ) / ( N + 1 ) * sum ( 0 <= I <= N ) Y(I)
+#
+#    If C and D are given, the integral over [C,D] is computed instead, as
+#    F(D) - F(C), where F is the antiderivative from
+#    BERNSTEIN_POLY_AB_ANTIDERIVATIVE.  The basis polynomials of degree N+1
+#    are evaluated at C and D by BERNSTEIN_POLY_AB_RATIO, so each integral
+#    costs O(N) operations.  C and D may be arrays of limits, in which case
+#    an integral is returned for each pair.
+#
+#    The integrals are exact, apart from rounding.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the Bernstein polynomial.
+#    N must be at least 0.
+#
+#    Input, real A, B, the endpoints of the interval on which the
+#    polynomial is based.  A and B should not be equal.
+#
+#    Input, real YDATA(N+1), the Bernstein coefficients, or an array of
+#    shape (K,N+1), each row of which holds a separate polynomial.
+#
+#    Input, real C, D, optional limits of integration.  C and D may
+#    be scalars, or arrays of the same shape S.  They need not lie in [A,B].
+#
+#    Output, real VALUE, the integral over [A,B], or over [C,D].
+#    If YDATA has shape (K,N+1), VALUE has shape (K), or (K)+S.
+#
+  import numpy as np
+  from bernstein_poly_ab_ratio import bernstein_poly_ab_ratio
+
+  ydata = np.asarray ( ydata, dtype = np.float64 )
+
+  if ( c is None and d is None ):
+    value = ( b - a ) / ( n + 1 ) * np.sum ( ydata, axis = -1 )
+    return value
+
+  if ( c is None ):
+    c = a
+  if ( d is None ):
+    d = b
+
+  c, d = np.broadcast_arrays ( np.asarray ( c, dtype = np.float64 ), \
+    np.asarray ( d, dtype = np.float64 ) )
+
+  fdata = bernstein_poly_ab_antiderivative ( n, a, b, ydata )
+
+  pc = bernstein_poly_ab_ratio ( n + 1, a, b, c )
+  pd = bernstein_poly_ab_ratio ( n + 1, a, b, d )
+
+  value = np.tensordot ( fdata, pd - pc, axes = ( [ -1 ], [ -1 ] ) )
+
+  return value
+
+def bernstein_poly_ab_integral_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_INTEGRAL_TEST tests BERNSTEIN_POLY_AB_INTEGRAL.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  from bernstein_poly_ab_approx import bernstein_poly_ab_approx
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_INTEGRAL_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_AB_INTEGRAL integrates a Bernstein polynomial.' )
+  print ( '  BERNSTEIN_POLY_AB_ANTIDERIVATIVE returns its antiderivative.' )
+#
+#  P(X) = X^3 on [0,2] has Bernstein coefficients 0, 0, 0, 8.
+#
+  a = 0.0
+  b = 2.0
+  n = 3
+  ydata = np.array ( [ 0.0, 0.0, 0.0, 8.0 ] )
+
+  print ( '' )
+  print ( '  P(X) = X^3 on [0,2]:' )
+  print ( '' )
+  print ( '         C         D     Integral       Exact' )
+  print ( '' )
+
+  c = np.array ( [ 0.0, 0.0, 1.0, 0.5, -1.0 ] )
+  d = np.array ( [ 2.0, 1.0, 2.0, 1.5, 1.0 ] )
+  value = bernstein_poly_ab_integral ( n, a, b, ydata, c, d )
+
+  for i in range ( 0, c.size ):
+    print ( '  %8.4f  %8.4f  %10.6f  %10.6f' % ( c[i], d[i], value[i], \
+      ( d[i] ** 4 - c[i] ** 4 ) / 4.0 ) )
+
+  print ( '' )
+  print ( '  Integral over [A,B] = %g' \
+    % ( bernstein_poly_ab_integral ( n, a, b, ydata ) ) )
+#
+#  Compare with the trapezoid rule, for several approximants at once.
+#
+  a = 1.0
+  b = 3.0
+  n = 20
+  xdata = np.linspace ( a, b, n + 1 )
+  ydata = np.vstack ( ( np.sin ( xdata ), np.exp ( xdata ), xdata ** 2 ) )
+
+  value = bernstein_poly_ab_integral ( n, a, b, ydata )
+
+  nval = 100001
+  xval = np.linspace ( a, b, nval )
+  yval = bernstein_poly_ab_approx ( n, a, b, ydata, nval, xval )
+  h = ( b - a ) / ( nval - 1 )
+  trap = h * ( np.sum ( yval, axis = -1 ) \
+    - 0.5 * ( yval[:,0] + yval[:,-1] ) )
+
+  print ( '' )
+  print ( '  Degree 20 approximants on [1,3]:' )
+  print ( '' )
+  print ( '    Function        Integral           Trapezoid rule' )
+  print ( '' )
+  for i, name in enumerate ( [ 'sin(x)', 'exp(x)', 'x^2' ] ):
+    print ( '    %-8s  %18.12f  %18.12f' % ( name, value[i], trap[i] ) )
+#
+#  The antiderivative differentiates back to the polynomial.
+#
+  fdata = bernstein_poly_ab_antiderivative ( n, a, b, ydata )
+  back = ( n + 1 ) / ( b - a ) * np.diff ( fdata, axis = -1 )
+  print ( '' )
+  print ( '  Maximum difference of the derivative of the antiderivative' )
+  print ( '  from the original coefficients = %g' \
+    % ( np.max ( np.abs ( back - ydata ) ) ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_INTEGRAL_TEST:' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_poly_ab_integral_test ( )
+  timestamp ( )
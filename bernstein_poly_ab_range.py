@@ -0,0 +1,229 @@
+#! /usr/bin/env python
+#
+def bernstein_poly_ab_range ( n, a, b, ydata, tol = 1.0E-10 ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_RANGE encloses the minimum and maximum of a Bernstein polynomial.
+#
+#  Discussion:
+#
+#    On any subinterval, the values of a polynomial lie between the least
+#    and greatest of its Bernstein coefficients on that subinterval, and
+#    the first and last coefficients are its values at the ends.  So, for
+#    the minimum:
+#
+#    * the least first or last coefficient over all the subintervals is
+#      an upper bound, since it is an actual value of the polynomial;
+#
+#    * the least coefficient over all the subintervals is a lower bound.
+#
+#    Starting from [A,B], the subintervals whose least coefficient is below
+#    the current upper bound, which are the only ones which can still hold
+#    the minimum, are bisected by BERNSTEIN_SUBDIVIDE, and the others
+#    are discarded.  This stops when the bounds are closer than TOL.  The
+#    maximum is found in the same way, as the minimum of -P.
+#
+#    The gap between the bounds shrinks like the square of the width of
+#    the subintervals, so few subdivisions are needed, and only near the
+#    points where the extremes are attained.  When several polynomials are
+#    given, their subintervals are processed together.
+#
+#    The bounds are widened by an estimate of the rounding error in the
+#    subdivisions, so that they enclose the exact minimum and maximum.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the Bernstein polynomial.
+#    N must be at least 0.
+#
+#    Input, real A, B, the endpoints of the interval on which the
+#    polynomial is based.  A and B should not be equal.
+#
+#    Input, real YDATA(N+1), the Bernstein coefficients, or an array of
+#    shape (K,N+1), each row of which holds a separate polynomial.
+#
+#    Input, real TOL, the desired width of the enclosures.
+#
+#    Output, real YMIN(2), YMAX(2), lower and upper bounds for the minimum
+#    and for the maximum of the polynomial over [A,B].  If YDATA has shape
+#    (K,N+1), then YMIN and YMAX have shape (K,2).
+#
+  import numpy as np
+  from sys import exit
+  from bernstein_subdivide import bernstein_subdivide
+
+  if ( b == a ):
+    print ( '' )
+    print ( 'BERNSTEIN_POLY_AB_RANGE - Fatal error!' )
+    print ( '  A = B = %g' % ( a ) )
+    exit ( 'BERNSTEIN_POLY_AB_RANGE - Fatal error!' )
+
+  ydata = np.asarray ( ydata, dtype = np.float64 )
+  shape = ydata.shape[0:-1]
+  ydata = np.reshape ( ydata, ( -1, n + 1 ) )
+  k = ydata.shape[0]
+#
+#  Minimize both P and -P.
+#
+  y2 = np.concatenate ( ( ydata, - ydata ) )
+  k2 = 2 * k
+
+  upper = np.minimum ( y2[:,0], y2[:,n] )
+  lower = np.min ( y2, axis = 1 )
+#
+#  The current subintervals, the polynomial each belongs to, and the
+#  coefficients on each.
+#
+  poly = np.arange ( k2 )
+  c = y2.copy ( )
+
+  it = 0
+
+  while ( 0 < poly.size and it < 100 ):
+
+    it = it + 1
+#
+#  Subdivide, and update the upper bounds from the new end values.
+#
+    cl, cr = bernstein_subdivide ( c, 0.5 )
+    poly = np.concatenate ( ( poly, poly ) )
+    c = np.concatenate ( ( cl, cr ) )
+
+    np.minimum.at ( upper, poly, np.minimum ( c[:,0], c[:,n] ) )
+
+    active = np.zeros ( k2, dtype = bool )
+    active[poly] = True
+#
+#  Discard subintervals which cannot hold a smaller value.
+#
+    cmin = np.min ( c, axis = 1 )
+    keep = ( cmin < upper[poly] )
+    poly = poly[keep]
+    c = c[keep]
+    cmin = cmin[keep]
+#
+#  For the polynomials still being worked on, the new lower bound is the
+#  least coefficient of any remaining subinterval.
+#
+    lower[active] = upper[active]
+    np.minimum.at ( lower, poly, cmin )
+#
+#  Stop work on polynomials whose bounds are close enough.
+#
+    keep = ( tol < upper[poly] - lower[poly] )
+    poly = poly[keep]
+    c = c[keep]
+#
+#  Widen the bounds by the rounding error.
+#
+  err = it * ( n + 1 ) * np.finfo ( float ).eps \
+    * np.max ( np.abs ( y2 ), axis = 1 )
+  lower = lower - err
+  upper = upper + err
+
+  ymin = np.stack ( ( lower[0:k], upper[0:k] ), axis = -1 )
+  ymax = np.stack ( ( - upper[k:k2], - lower[k:k2] ), axis = -1 )
+
+  ymin = np.reshape ( ymin, shape + ( 2, ) )
+  ymax = np.reshape ( ymax, shape + ( 2, ) )
+
+  return ymin, ymax
+
+def bernstein_poly_ab_range_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_RANGE_TEST tests BERNSTEIN_POLY_AB_RANGE.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  import time
+  from bernstein_poly_ab_approx import bernstein_poly_ab_approx
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_RANGE_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_AB_RANGE encloses the minimum and maximum' )
+  print ( '  of Bernstein polynomials.' )
+#
+#  A cubic whose extremes lie inside the interval.
+#
+  n = 3
+  a = 0.0
+  b = 1.0
+  ydata = np.array ( [ 0.0, -3.0, 3.0, 0.0 ] )
+
+  ymin, ymax = bernstein_poly_ab_range ( n, a, b, ydata )
+  xval = np.linspace ( a, b, 1000001 )
+  yval = bernstein_poly_ab_approx ( n, a, b, ydata, xval.size, xval )
+
+  print ( '' )
+  print ( '  Coefficients 0, -3, 3, 0 on [0,1]:' )
+  print ( '' )
+  print ( '                 Lower bound             Upper bound             Sampled' )
+  print ( '' )
+  print ( '  Minimum  %22.16f  %22.16f  %22.16f' % ( ymin[0], ymin[1], \
+    np.min ( yval ) ) )
+  print ( '  Maximum  %22.16f  %22.16f  %22.16f' % ( ymax[0], ymax[1], \
+    np.max ( yval ) ) )
+#
+#  Many approximants at once.
+#
+  a = 1.0
+  b = 3.0
+  n = 40
+  xdata = np.linspace ( a, b, n + 1 )
+  ydata = np.array ( [ np.sin ( k * xdata ) for k in range ( 1, 101 ) ] )
+
+  t = time.time ( )
+  ymin, ymax = bernstein_poly_ab_range ( n, a, b, ydata )
+  t1 = time.time ( ) - t
+
+  nval = 10001
+  xval = np.linspace ( a, b, nval )
+  t = time.time ( )
+  yval = bernstein_poly_ab_approx ( n, a, b, ydata, nval, xval )
+  smin = np.min ( yval, axis = 1 )
+  smax = np.max ( yval, axis = 1 )
+  t2 = time.time ( ) - t
+
+  print ( '' )
+  print ( '  100 approximants of degree 40 to sin(K*X) on [1,3]:' )
+  print ( '' )
+  print ( '  Maximum width of the enclosures:       %g' \
+    % ( max ( np.max ( ymin[:,1] - ymin[:,0] ), \
+              np.max ( ymax[:,1] - ymax[:,0] ) ) ) )
+  print ( '  Sampled values all inside the bounds:  %s' \
+    % ( np.all ( ( ymin[:,0] <= smin ) & ( smax <= ymax[:,1] ) ) ) )
+  print ( '  Time for the enclosures:               %g' % ( t1 ) )
+  print ( '  Time for sampling at %d points:     %g' % ( nval, t2 ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_RANGE_TEST:' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_poly_ab_range_test ( )
+  timestamp ( )
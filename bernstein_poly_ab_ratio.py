@@ -0,0 +1,103 @@
+#! /usr/bin/env python
+#
+def bernstein_poly_ab_ratio ( n, a, b, x, workers = None ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_RATIO evaluates the Bernstein polynomials on [A,B] in O(N).
+#
+#  Discussion:
+#
+#    This function returns the same values as BERNSTEIN_POLY_AB, at a cost
+#    of O(N) rather than O(N^2) per point.  The points are mapped to [0,1],
+#    and the values are computed by BERNSTEIN_POLY_01_RATIO.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the Bernstein polynomials to be used.
+#
+#    Input, real A, B, the endpoints of the interval on which the
+#    polynomials are to be based.  A and B should not be equal.
+#
+#    Input, real X, the evaluation point, or an array of points.
+#
+#    Input, integer WORKERS, the number of threads to use.
+#    By default, the calling thread does all the work.
+#
+#    Output, real P(N+1), the values of the N+1 Bernstein polynomials at X.
+#    If X is an array of shape S, then P has shape S+(N+1).
+#
+  import numpy as np
+  from sys import exit
+  from bernstein_poly_01_ratio import bernstein_poly_01_ratio
+
+  if ( b == a ):
+    print ( '' )
+    print ( 'BERNSTEIN_POLY_AB_RATIO - Fatal error!' )
+    print ( '  A = B = %g' % ( a ) )
+    exit ( 'BERNSTEIN_POLY_AB_RATIO - Fatal error!' )
+
+  x = np.asarray ( x, dtype = np.float64 )
+
+  p = bernstein_poly_01_ratio ( n, ( x - a ) / ( b - a ), workers = workers )
+
+  return p
+
+def bernstein_poly_ab_ratio_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_RATIO_TEST tests BERNSTEIN_POLY_AB_RATIO.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  from bernstein_poly_ab import bernstein_poly_ab
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_RATIO_TEST' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_AB_RATIO evaluates Bernstein polynomials over an' )
+  print ( '  arbitrary interval [A,B], using the ratio recurrence.' )
+  print ( '' )
+  print ( '     N       A        B     Max Difference' )
+  print ( '                            from BERNSTEIN_POLY_AB' )
+  print ( '' )
+
+  for n, a, b in [ ( 0, 0.0, 1.0 ), ( 10, 1.0, 2.0 ), ( 10, 2.0, 4.0 ), \
+    ( 40, -1.0, 1.0 ), ( 200, 0.0, 10.0 ) ]:
+
+    x = np.linspace ( a, b, 1001 )
+    p1 = bernstein_poly_ab ( n, a, b, x )
+    p2 = bernstein_poly_ab_ratio ( n, a, b, x )
+
+    print ( '  %4d  %7.4f  %7.4f  %14.6g' % ( n, a, b, \
+      np.max ( np.abs ( p1 - p2 ) ) ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_RATIO_TEST' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_poly_ab_ratio_test ( )
+  timestamp ( )
@@ -0,0 +1,296 @@
+#! /usr/bin/env python
+#
+def bernstein_poly_ab_roots ( n, a, b, ydata, tol = 1.0E-10 ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_ROOTS finds the roots in [A,B] of a Bernstein polynomial.
+#
+#  Discussion:
+#
+#    The roots are found from the Bernstein coefficients directly, without
+#    sampling the polynomial.  The method keeps a list of subintervals of
+#    [A,B] which may contain roots, together with the Bernstein coefficients
+#    of the polynomial restricted to each, and repeats the following steps.
+#
+#    * Descartes' rule of signs: the number of roots in a subinterval is
+#      at most the number of sign changes in its coefficients.  A
+#      subinterval whose coefficients have no sign changes, and do not
+#      vanish at either end, is discarded.
+#
+#    * Convex hull clipping: the graph of the polynomial lies in the convex
+#      hull of its control points (I/N,Y(I)), so any root lies where that
+#      hull meets the axis.  The subinterval is reduced to that part.
+#
+#    * If clipping removes less than a fifth of a subinterval, which
+#      happens when it holds several roots, it is bisected instead.
+#
+#    Subintervals are split and restricted by BERNSTEIN_SUBDIVIDE and
+#    BERNSTEIN_RESTRICT.  Coefficients smaller than the rounding level,
+#    about N*EPS times the largest coefficient, are treated as zero.  A subinterval narrower than
+#    TOL, or on which all the coefficients are treated as zero, is reported
+#    as a root at its midpoint, and roots closer together than TOL are
+#    merged.  In this way roots of even multiplicity, where the polynomial
+#    touches zero without changing sign, are also found, although, as
+#    always, only to about the square root of the rounding level.
+#
+#    The work depends on the number of roots and the accuracy, not on any
+#    sampling density.  When several polynomials are given, the
+#    subintervals of all of them are processed together.
+#
+#    A polynomial whose coefficients are all zero is reported as having
+#    no roots.
+#
+#    If the subintervals are not all resolved after 200 steps, a warning is
+#    printed, and the midpoints of those left are reported as roots, so
+#    that no root is lost, although some reported roots may be spurious
+#    or inaccurate.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Reference:
+#
+#    Michael Bartoň, Bert Jüttler,
+#    Computing roots of polynomials by quadratic clipping,
+#    Computer Aided Geometric Design,
+#    Volume 24, Number 3, 2007, pages 125-141.
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the Bernstein polynomial.
+#    N must be at least 0.
+#
+#    Input, real A, B, the endpoints of the interval on which the
+#    polynomial is based.  A and B should not be equal.
+#
+#    Input, real YDATA(N+1), the Bernstein coefficients, or an array of
+#    shape (K,N+1), each row of which holds a separate polynomial.
+#
+#    Input, real TOL, the accuracy to which the roots are wanted.
+#
+#    Output, real ROOTS(*), the roots in [A,B], in increasing order.
+#    If YDATA has shape (K,N+1), ROOTS is a list of K such arrays.
+#
+  import numpy as np
+  from sys import exit
+  from bernstein_subdivide import bernstein_restrict
+  from bernstein_subdivide import bernstein_subdivide
+
+  if ( b == a ):
+    print ( '' )
+    print ( 'BERNSTEIN_POLY_AB_ROOTS - Fatal error!' )
+    print ( '  A = B = %g' % ( a ) )
+    exit ( 'BERNSTEIN_POLY_AB_ROOTS - Fatal error!' )
+
+  ydata = np.asarray ( ydata, dtype = np.float64 )
+  single = ( ydata.ndim == 1 )
+  ydata = np.reshape ( ydata, ( -1, n + 1 ) )
+  k = ydata.shape[0]
+
+  ttol = tol / abs ( b - a )
+  found = [ [ ] for p in range ( 0, k ) ]
+#
+#  Coefficients smaller than ZTOL are treated as zero.
+#
+  ztol = 8.0 * ( n + 1 ) * np.finfo ( float ).eps \
+    * np.max ( np.abs ( ydata ), axis = 1 )
+#
+#  The current subintervals [LO,HI] of [0,1], the polynomial each belongs
+#  to, and the coefficients on each.
+#
+  keep = np.any ( ydata != 0.0, axis = 1 ) & ( 0 < n )
+  poly = np.arange ( k )[keep]
+  lo = np.zeros ( poly.size )
+  hi = np.ones ( poly.size )
+  c = ydata[keep].copy ( )
+
+  pad = 16.0 * ( n + 1 ) * np.finfo ( float ).eps
+  it = 0
+
+  while ( 0 < poly.size ):
+
+    it = it + 1
+    if ( 200 < it ):
+      print ( '' )
+      print ( 'BERNSTEIN_POLY_AB_ROOTS - Warning!' )
+      print ( '  Iteration limit reached; %d subintervals remain.' \
+        % ( poly.size ) )
+      print ( '  Their midpoints are reported as roots.' )
+      for p, t in zip ( poly, 0.5 * ( lo + hi ) ):
+        found[p].append ( ( t, t ) )
+      break
+
+    zero = ( np.abs ( c ) <= ztol[poly,np.newaxis] )
+    s = np.where ( zero, 0.0, np.sign ( c ) )
+#
+#  Subintervals which are narrow enough, or on which the polynomial cannot
+#  be told apart from zero, give roots.
+#
+    done = ( hi - lo < ttol ) | np.all ( zero, axis = 1 )
+    for p, l, h in zip ( poly[done], lo[done], hi[done] ):
+      found[p].append ( ( l, h ) )
+#
+#  Descartes' rule of signs.
+#
+    changes = np.any ( zero, axis = 1 )
+    last = s[:,0].copy ( )
+    for i in range ( 1, n + 1 ):
+      changes = changes | ( last * s[:,i] < 0.0 )
+      last = np.where ( s[:,i] == 0.0, last, s[:,i] )
+
+    keep = changes & ~done
+    poly = poly[keep]
+    lo = lo[keep]
+    hi = hi[keep]
+    c = c[keep]
+    s = s[keep]
+
+    if ( poly.size == 0 ):
+      break
+#
+#  Convex hull clipping.  Where the hull meets the axis is bounded by the
+#  points where the segments between control points of opposite sign
+#  cross it, and by control points on the axis.
+#
+    tmin = np.full ( poly.size, np.inf )
+    tmax = np.full ( poly.size, - np.inf )
+    j = np.arange ( n + 1 )
+
+    with np.errstate ( divide = 'ignore', invalid = 'ignore' ):
+      for i in range ( 0, n + 1 ):
+        ci = c[:,i:i+1]
+        t = ( i + ( j - i ) * ci / ( ci - c ) ) / n
+        cross = ( s[:,i:i+1] * s < 0.0 )
+        cross[:,i] = ( s[:,i] == 0.0 )
+        t[:,i] = i / n
+        tmin = np.minimum ( tmin, np.min ( np.where ( cross, t, np.inf ), \
+          axis = 1 ) )
+        tmax = np.maximum ( tmax, np.max ( np.where ( cross, t, - np.inf ), \
+          axis = 1 ) )
+
+    tmin = np.clip ( tmin - pad, 0.0, 1.0 )
+    tmax = np.clip ( tmax + pad, 0.0, 1.0 )
+#
+#  Bisect where clipping did not help much, and restrict elsewhere.
+#
+    bisect = ( 0.8 < tmax - tmin )
+
+    cl, cr = bernstein_subdivide ( c[bisect], 0.5 )
+    mid = 0.5 * ( lo[bisect] + hi[bisect] )
+
+    restrict = ~bisect
+    t0 = tmin[restrict]
+    t1 = tmax[restrict]
+    cc = bernstein_restrict ( c[restrict], t0, t1 )
+    w = hi[restrict] - lo[restrict]
+    lo0 = lo[restrict] + t0 * w
+    hi0 = lo[restrict] + t1 * w
+
+    poly = np.concatenate ( ( poly[bisect], poly[bisect], poly[restrict] ) )
+    lo = np.concatenate ( ( lo[bisect], mid, lo0 ) )
+    hi = np.concatenate ( ( mid, hi[bisect], hi0 ) )
+    c = np.concatenate ( ( cl, cr, cc ) )
+#
+#  Merge the subintervals of each polynomial which touch, or are closer
+#  than TOL, and take the midpoint of each group as a root.
+#
+  roots = [ ]
+
+  for p in range ( 0, k ):
+    merged = [ ]
+    for l, h in sorted ( found[p] ):
+      if ( 0 < len ( merged ) and l - merged[-1][1] <= ttol ):
+        merged[-1][1] = max ( merged[-1][1], h )
+      else:
+        merged.append ( [ l, h ] )
+    t = np.array ( [ 0.5 * ( l + h ) for l, h in merged ] )
+    roots.append ( a + ( b - a ) * t )
+
+  if ( single ):
+    return roots[0]
+
+  return roots
+
+def bernstein_poly_ab_roots_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_AB_ROOTS_TEST tests BERNSTEIN_POLY_AB_ROOTS.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  from bernstein_poly_ab_approx import bernstein_poly_ab_approx
+  from bernstein_to_power import power_to_bernstein
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_ROOTS_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_AB_ROOTS finds the roots of Bernstein polynomials.' )
+#
+#  Polynomials with known roots, on [0,1].
+#
+  cases = [ [ 0.5 ], [ 0.2, 0.7 ], [ 0.1, 0.3, 0.3, 0.8 ], [ 0.0, 1.0 ], \
+    [ 0.25, 0.5, 0.75, 0.9, 1.5 ] ]
+
+  print ( '' )
+  print ( '  Polynomials with known roots, on [0,1]:' )
+
+  for exact in cases:
+
+    p = np.poly ( exact )[::-1]
+    n = len ( exact )
+    y = np.dot ( power_to_bernstein ( n ), p )
+
+    roots = bernstein_poly_ab_roots ( n, 0.0, 1.0, y )
+
+    print ( '' )
+    print ( '  Exact roots:', exact )
+    print ( '  Computed:   ', roots )
+#
+#  Many polynomials at once: approximants to sin(K*X) on [0,2*pi].
+#
+  a = 0.0
+  b = 2.0 * np.pi
+  n = 60
+  xdata = np.linspace ( a, b, n + 1 )
+  ydata = np.array ( [ np.sin ( k * xdata + 0.1 ) for k in range ( 1, 6 ) ] )
+
+  roots = bernstein_poly_ab_roots ( n, a, b, ydata )
+
+  print ( '' )
+  print ( '  Degree 60 approximants to sin(K*X+0.1) on [0,2*pi]:' )
+  print ( '' )
+  print ( '     K  Roots  Max |P(root)|' )
+  print ( '' )
+
+  for k in range ( 0, 5 ):
+    r = roots[k]
+    y = bernstein_poly_ab_approx ( n, a, b, ydata[k], r.size, r )
+    print ( '  %4d  %5d  %14.6g' % ( k + 1, r.size, np.max ( np.abs ( y ) ) ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_AB_ROOTS_TEST:' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_poly_ab_roots_test ( )
+  timestamp ( )
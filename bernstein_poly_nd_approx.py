@@ -0,0 +1,181 @@
+#! /usr/bin/env python
+#
+def bernstein_poly_nd_approx ( n, a, b, cdata, xval ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_ND_APPROX: tensor product Bernstein approximant in D dimensions.
+#
+#  Formula:
+#
+#    BP(F)(X1,...,XD) = sum ( 0 <= I1 <= N1 ) ... sum ( 0 <= ID <= ND )
+#      C(I1,...,ID) * B1(I1,X1) * ... * BD(ID,XD)
+#
+#    where BK(I,X) is the value of the I-th Bernstein basis polynomial
+#    of degree NK on [AK,BK] at X.  If the coefficients C are data values
+#    of F at the equally spaced grid points, this is the Bernstein
+#    approximant to F.
+#
+#  Discussion:
+#
+#    The approximant is evaluated on the grid XVAL(1) x ... x XVAL(D).
+#
+#    For each axis K, the MK by NK+1 matrix of basis values at XVAL(K) is
+#    computed, and the coefficient array is contracted with it along that
+#    axis, replacing a dimension of size NK+1 by one of size MK.  The full
+#    product of the D basis matrices is never formed, so the work is the
+#    sum of the costs of the D contractions, and the largest array is the
+#    largest intermediate result.  Axes whose contraction shrinks the array
+#    the most are contracted first.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    16 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N(D), the degree in each direction.
+#
+#    Input, real A(D), B(D), the endpoints of the interval in each
+#    direction.  A(K) and B(K) should not be equal.
+#
+#    Input, real CDATA(N(1)+1,...,N(D)+1), the coefficients, which are
+#    usually the values of F at the equally spaced grid points.
+#
+#    Input, real XVAL(D), a list of D vectors, the evaluation points in
+#    each direction.  XVAL(K) has length M(K).
+#
+#    Output, real YVAL(M(1),...,M(D)), the values of the approximant
+#    at the grid points.
+#
+  import numpy as np
+  from sys import exit
+  from bernstein_poly_ab import bernstein_poly_ab
+
+  cdata = np.asarray ( cdata, dtype = np.float64 )
+  d = cdata.ndim
+
+  if ( len ( n ) != d or len ( a ) != d or len ( b ) != d \
+    or len ( xval ) != d ):
+    print ( '' )
+    print ( 'BERNSTEIN_POLY_ND_APPROX - Fatal error!' )
+    print ( '  CDATA has %d dimensions, but N, A, B, XVAL' % ( d ) )
+    print ( '  have lengths %d, %d, %d, %d.' \
+      % ( len ( n ), len ( a ), len ( b ), len ( xval ) ) )
+    exit ( 'BERNSTEIN_POLY_ND_APPROX - Fatal error!' )
+
+  for k in range ( 0, d ):
+    if ( cdata.shape[k] != n[k] + 1 ):
+      print ( '' )
+      print ( 'BERNSTEIN_POLY_ND_APPROX - Fatal error!' )
+      print ( '  Dimension %d of CDATA is %d, but N(%d)+1 = %d.' \
+        % ( k, cdata.shape[k], k, n[k] + 1 ) )
+      exit ( 'BERNSTEIN_POLY_ND_APPROX - Fatal error!' )
+
+  x = [ np.ravel ( np.asarray ( xval[k], dtype = np.float64 ) ) \
+    for k in range ( 0, d ) ]
+#
+#  Contract the axes in order of increasing ratio M(K) / (N(K)+1).
+#
+  order = sorted ( range ( 0, d ), \
+    key = lambda k: float ( x[k].size ) / float ( n[k] + 1 ) )
+
+  yval = cdata
+
+  for k in order:
+    bk = bernstein_poly_ab ( n[k], a[k], b[k], x[k] )
+    yval = np.tensordot ( yval, bk, axes = ( [ k ], [ 1 ] ) )
+    yval = np.moveaxis ( yval, -1, k )
+
+  yval = np.ascontiguousarray ( yval )
+
+  return yval
+
+def bernstein_poly_nd_approx_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POLY_ND_APPROX_TEST tests BERNSTEIN_POLY_ND_APPROX.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    16 October 2026
+#
+  import numpy as np
+  import platform
+  from bernstein_poly_ab_approx_2d import bernstein_poly_ab_approx_2d
+
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_ND_APPROX_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_POLY_ND_APPROX evaluates the tensor product' )
+  print ( '  Bernstein approximant to a function of D variables.' )
+#
+#  In 2D, compare with BERNSTEIN_POLY_AB_APPROX_2D.
+#
+  n = [ 6, 9 ]
+  a = [ 0.0, -1.0 ]
+  b = [ 1.0, 2.0 ]
+  xdata = np.linspace ( a[0], b[0], n[0] + 1 )
+  ydata = np.linspace ( a[1], b[1], n[1] + 1 )
+  cdata = np.cos ( np.add.outer ( xdata, ydata ) )
+  xval = np.linspace ( a[0], b[0], 17 )
+  yval = np.linspace ( a[1], b[1], 13 )
+
+  z1 = bernstein_poly_nd_approx ( n, a, b, cdata, [ xval, yval ] )
+  z2 = bernstein_poly_ab_approx_2d ( n[0], n[1], a[0], b[0], a[1], b[1], \
+    cdata, 17, xval, 13, yval )
+
+  print ( '' )
+  print ( '  2D: maximum difference from BERNSTEIN_POLY_AB_APPROX_2D = %g' \
+    % ( np.max ( np.abs ( z1 - z2 ) ) ) )
+#
+#  Approximate F(X,Y,Z,W) = exp(X+Y+Z+W) on the unit hypercube.
+#
+  print ( '' )
+  print ( '  4D approximant to exp(X+Y+Z+W) on [0,1]^4:' )
+  print ( '' )
+  print ( '     N    Shape              Max Error' )
+  print ( '' )
+
+  for degree in [ 2, 4, 8, 16 ]:
+
+    d = 4
+    n = [ degree ] * d
+    a = [ 0.0 ] * d
+    b = [ 1.0 ] * d
+    xdata = np.linspace ( 0.0, 1.0, degree + 1 )
+    cdata = np.exp ( np.add.outer ( np.add.outer ( xdata, xdata ), \
+      np.add.outer ( xdata, xdata ) ) )
+
+    xval = [ np.linspace ( 0.0, 1.0, 11 ), np.linspace ( 0.0, 1.0, 7 ), \
+      np.linspace ( 0.0, 1.0, 5 ), np.linspace ( 0.0, 1.0, 3 ) ]
+
+    yval = bernstein_poly_nd_approx ( n, a, b, cdata, xval )
+
+    ytrue = np.exp ( np.add.outer ( np.add.outer ( xval[0], xval[1] ), \
+      np.add.outer ( xval[2], xval[3] ) ) )
+
+    print ( '  %4d    %-16s  %14.6g' \
+      % ( degree, str ( yval.shape ), np.max ( np.abs ( yval - ytrue ) ) ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_POLY_ND_APPROX_TEST' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_poly_nd_approx_test ( )
+  timestamp ( )
@@ -0,0 +1,161 @@
+#! /usr/bin/env python
+#
+def bernstein_reduce ( ydata, m = None, tol = None ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_REDUCE lowers the degree of a Bernstein polynomial, optimally in L2.
+#
+#  Discussion:
+#
+#    The polynomial of degree M which is closest in the L2 norm to a given
+#    polynomial of degree N > M is its orthogonal projection, obtained by
+#    dropping the Legendre coefficients of degree above M.  So the
+#    Bernstein coefficients are converted to Legendre coefficients by
+#    BERNSTEIN_TO_LEGENDRE, truncated, and converted back to Bernstein
+#    coefficients of degree M by LEGENDRE_TO_BERNSTEIN.
+#
+#    Since the shifted Legendre polynomial of degree I has the squared
+#    norm 1/(2I+1) on [0,1], the error of the reduction is
+#
+#      E = sqrt ( sum ( M < I <= N ) L(I)^2 / ( 2 * I + 1 ) )
+#
+#    measured as the root mean square difference over the interval.
+#
+#    Either the new degree M is given, or else a tolerance TOL, in which
+#    case M is the smallest degree for which E <= TOL.  When several
+#    polynomials are given, they are all reduced to the same degree, the
+#    smallest one for which every error is within TOL.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, real YDATA(N+1), the Bernstein coefficients, or an array of
+#    shape (K,N+1), each row of which holds a separate polynomial.
+#
+#    Input, integer M, the new degree, between 0 and N.
+#
+#    Input, real TOL, the error allowed, if M is not given.
+#
+#    Output, real ZDATA(M+1), or ZDATA(K,M+1), the Bernstein coefficients
+#    of degree M of the reduced polynomial.
+#
+#    Output, real E, or E(K), the root mean square error of the reduction.
+#
+  import numpy as np
+  from sys import exit
+  from bernstein_to_legendre import bernstein_to_legendre
+  from bernstein_to_legendre import legendre_to_bernstein
+
+  ydata = np.asarray ( ydata, dtype = np.float64 )
+  n = ydata.shape[-1] - 1
+
+  if ( ( m is None ) == ( tol is None ) ):
+    print ( '' )
+    print ( 'BERNSTEIN_REDUCE - Fatal error!' )
+    print ( '  Exactly one of M and TOL must be given.' )
+    exit ( 'BERNSTEIN_REDUCE - Fatal error!' )
+
+  ldata = np.dot ( ydata, bernstein_to_legendre ( n ).T )
+#
+#  TAIL(...,I) is the squared error of the reduction to degree I.
+#
+  w = ldata ** 2 / ( 2 * np.arange ( n + 1 ) + 1 )
+  tail = np.zeros ( ydata.shape[0:-1] + ( n + 1, ) )
+  tail[...,0:n] = np.cumsum ( w[...,:0:-1], axis = -1 )[...,::-1]
+
+  if ( m is None ):
+    worst = np.reshape ( tail, ( -1, n + 1 ) ).max ( axis = 0 )
+    m = int ( np.argmax ( worst <= tol ** 2 ) )
+
+  if ( m < 0 or n < m ):
+    print ( '' )
+    print ( 'BERNSTEIN_REDUCE - Fatal error!' )
+    print ( '  M = %d is not between 0 and N = %d.' % ( m, n ) )
+    exit ( 'BERNSTEIN_REDUCE - Fatal error!' )
+
+  if ( m == n ):
+    zdata = ydata.copy ( )
+  else:
+    zdata = np.dot ( ldata[...,0:m+1], legendre_to_bernstein ( m ).T )
+
+  e = np.sqrt ( tail[...,m] )
+
+  return zdata, e
+
+def bernstein_reduce_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_REDUCE_TEST tests BERNSTEIN_REDUCE.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  from bernstein_elevate import bernstein_elevate
+  from bernstein_poly_ab_approx import bernstein_poly_ab_approx
+
+  print ( '' )
+  print ( 'BERNSTEIN_REDUCE_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_REDUCE lowers the degree of a Bernstein polynomial.' )
+#
+#  Elevating and then reducing gives back the original polynomial.
+#
+  ydata = np.array ( [ 1.0, -2.0, 0.5, 3.0 ] )
+  zdata, e = bernstein_reduce ( bernstein_elevate ( ydata, 5 ), 3 )
+
+  print ( '' )
+  print ( '  Original coefficients:             ', ydata )
+  print ( '  After elevation to 8 and reduction:', zdata )
+  print ( '  Error estimate = %g' % ( e ) )
+#
+#  Reduce approximants to exp(X) and sin(5X) on [0,1] to given accuracy.
+#
+  n = 30
+  xdata = np.linspace ( 0.0, 1.0, n + 1 )
+  ydata = np.vstack ( ( np.exp ( xdata ), np.sin ( 5.0 * xdata ) ) )
+  nval = 100001
+  xval = np.linspace ( 0.0, 1.0, nval )
+  yval = bernstein_poly_ab_approx ( n, 0.0, 1.0, ydata, nval, xval )
+
+  print ( '' )
+  print ( '  Degree 30 approximants to exp(X) and sin(5X):' )
+  print ( '' )
+  print ( '       TOL     M      E(1)          E(2)        RMS difference' )
+  print ( '' )
+
+  for tol in [ 1.0E-02, 1.0E-04, 1.0E-08, 1.0E-12 ]:
+    zdata, e = bernstein_reduce ( ydata, tol = tol )
+    m = zdata.shape[-1] - 1
+    zval = bernstein_poly_ab_approx ( m, 0.0, 1.0, zdata, nval, xval )
+    rms = np.sqrt ( np.mean ( ( zval - yval ) ** 2, axis = -1 ) )
+    print ( '  %8.1e  %4d  %12.4e  %12.4e  %12.4e' \
+      % ( tol, m, e[0], e[1], np.max ( rms ) ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_REDUCE_TEST:' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_reduce_test ( )
+  timestamp ( )
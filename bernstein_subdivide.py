@@ -0,0 +1,265 @@
+#! /usr/bin/env python
+#
+def bernstein_subdivide ( ydata, t, a = 0.0, b = 1.0 ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_SUBDIVIDE splits a Bernstein polynomial at a point.
+#
+#  Discussion:
+#
+#    A polynomial with the Bernstein coefficients Y(0:N) on [A,B] is
+#    split at T into two pieces, and the Bernstein coefficients of the
+#    polynomial on [A,T] and on [T,B] are returned.
+#
+#    This uses de Casteljau's algorithm, which carries out the triangular
+#    recurrence of BERNSTEIN_POLY_01 on the coefficients, in place:
+#
+#      W(0:N-J) = ( 1 - S ) * W(0:N-J) + S * W(1:N-J+1),  1 <= J <= N
+#
+#    with S = ( T - A ) / ( B - A ).  The first entry at each level is a
+#    coefficient of the left piece, and the last is one of the right piece.
+#    The last step gives the value of the polynomial at T.
+#
+#    YDATA may hold a stack of polynomials, and T may be an array of split
+#    points, and the two are broadcast against each other.  For instance,
+#    with YDATA of shape (K,N+1) and T of shape (M,1), the result has
+#    shape (M,K,N+1), holding every polynomial split at every point.
+#    A and B may also be arrays.
+#
+#    T may lie outside [A,B], although the computation is then less stable.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Reference:
+#
+#    Gerald Farin,
+#    Curves and Surfaces for Computer Aided Geometric Design,
+#    Academic Press, 1997,
+#    ISBN: 0-12-249054-1.
+#
+#  Parameters:
+#
+#    Input, real YDATA(N+1), the Bernstein coefficients, or an array of
+#    shape S+(N+1) holding several polynomials.
+#
+#    Input, real T, the split point, or an array of split points.
+#
+#    Input, real A, B, the interval on which the polynomial is based.
+#    A and B should not be equal.
+#
+#    Output, real YLEFT(N+1), YRIGHT(N+1), the Bernstein coefficients of the
+#    polynomial on [A,T] and on [T,B].  Each has the broadcast shape of
+#    the leading dimensions of YDATA and T, followed by N+1.
+#
+  import numpy as np
+
+  ydata = np.asarray ( ydata, dtype = np.float64 )
+  n = ydata.shape[-1] - 1
+
+  s = ( np.asarray ( t, dtype = np.float64 ) - a ) / ( np.asarray ( b ) - a )
+  shape = np.broadcast_shapes ( ydata.shape[0:-1], s.shape )
+
+  w = np.broadcast_to ( ydata, shape + ( n + 1, ) ).copy ( )
+  s = np.broadcast_to ( s, shape )[...,np.newaxis]
+
+  yleft = np.empty ( w.shape )
+  yright = np.empty ( w.shape )
+  yleft[...,0] = w[...,0]
+  yright[...,n] = w[...,n]
+
+  for j in range ( 1, n + 1 ):
+    w[...,0:n+1-j] = ( 1.0 - s ) * w[...,0:n+1-j] + s * w[...,1:n+2-j]
+    yleft[...,j] = w[...,0]
+    yright[...,n-j] = w[...,n-j]
+
+  return yleft, yright
+
+def bernstein_restrict ( ydata, c, d, a = 0.0, b = 1.0 ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_RESTRICT restricts a Bernstein polynomial to a subinterval.
+#
+#  Discussion:
+#
+#    A polynomial with the Bernstein coefficients Y(0:N) on [A,B] is given
+#    the Bernstein coefficients of the same polynomial on [C,D].
+#
+#    This takes two subdivisions: either at D, keeping [A,D], and then at C,
+#    keeping [C,D], or at C, keeping [C,B], and then at D.  The order is
+#    chosen, for each polynomial, to keep the larger of the two
+#    intermediate intervals, and the polynomials are divided into two
+#    groups, so that each one is only subdivided in its own order.  If
+#    [C,D] runs in the opposite direction to [A,B], the coefficients for
+#    [D,C] are found, and reversed.
+#
+#    As in BERNSTEIN_SUBDIVIDE, YDATA, C and D are broadcast against each
+#    other.  C and D should not be equal.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, real YDATA(N+1), the Bernstein coefficients, or an array of
+#    shape S+(N+1) holding several polynomials.
+#
+#    Input, real C, D, the new interval, or arrays of intervals.
+#
+#    Input, real A, B, the interval on which the polynomial is based.
+#    A and B should not be equal.
+#
+#    Output, real ZDATA(N+1), the Bernstein coefficients on [C,D].
+#
+  import numpy as np
+
+  ydata = np.asarray ( ydata, dtype = np.float64 )
+  n = ydata.shape[-1] - 1
+#
+#  Work with the parameters S and U of C and D, in the order of [A,B].
+#
+  sc = ( np.asarray ( c, dtype = np.float64 ) - a ) / ( np.asarray ( b ) - a )
+  sd = ( np.asarray ( d, dtype = np.float64 ) - a ) / ( np.asarray ( b ) - a )
+  shape = np.broadcast_shapes ( ydata.shape[0:-1], sc.shape, sd.shape )
+#
+#  Flatten the polynomials and intervals into one list.
+#
+  ydata = np.reshape ( np.broadcast_to ( ydata, shape + ( n + 1, ) ), \
+    ( -1, n + 1 ) )
+  sc = np.broadcast_to ( sc, shape ).ravel ( )
+  sd = np.broadcast_to ( sd, shape ).ravel ( )
+  s = np.minimum ( sc, sd )
+  u = np.maximum ( sc, sd )
+
+  first = ( 1.0 - s <= u )
+  second = ~ first
+
+  zdata = np.empty ( ydata.shape )
+
+  with np.errstate ( divide = 'ignore', invalid = 'ignore' ):
+#
+#  Split at U, keeping [0,U], then at S.
+#
+    if ( np.any ( first ) ):
+      ya, dummy = bernstein_subdivide ( ydata[first], u[first] )
+      dummy, zdata[first] = bernstein_subdivide ( ya, s[first], 0.0, u[first] )
+#
+#  Split at S, keeping [S,1], then at U.
+#
+    if ( np.any ( second ) ):
+      dummy, yb = bernstein_subdivide ( ydata[second], s[second] )
+      zdata[second], dummy = bernstein_subdivide ( yb, u[second], s[second], \
+        1.0 )
+
+  flip = ( sd < sc )
+  zdata[flip] = zdata[flip,::-1]
+
+  zdata = np.reshape ( zdata, shape + ( n + 1, ) )
+
+  return zdata
+
+def bernstein_subdivide_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_SUBDIVIDE_TEST tests BERNSTEIN_SUBDIVIDE and BERNSTEIN_RESTRICT.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  from bernstein_poly_ab_approx import bernstein_poly_ab_approx
+
+  print ( '' )
+  print ( 'BERNSTEIN_SUBDIVIDE_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_SUBDIVIDE splits Bernstein polynomials at a point.' )
+  print ( '  BERNSTEIN_RESTRICT restricts them to a subinterval.' )
+#
+#  X^2 on [0,1], split at 1/2.
+#
+  yleft, yright = bernstein_subdivide ( [ 0.0, 0.0, 1.0 ], 0.5 )
+
+  print ( '' )
+  print ( '  X^2 on [0,1], coefficients 0, 0, 1, split at 1/2:' )
+  print ( '    on [0,1/2]:', yleft )
+  print ( '    on [1/2,1]:', yright )
+#
+#  Three polynomials on [1,3], each split at four points.
+#
+  a = 1.0
+  b = 3.0
+  n = 8
+  ydata = np.random.default_rng ( 123456789 ).standard_normal ( ( 3, n + 1 ) )
+  t = np.array ( [ 1.2, 2.0, 2.5, 2.9 ] )[:,np.newaxis]
+
+  yleft, yright = bernstein_subdivide ( ydata, t, a, b )
+
+  print ( '' )
+  print ( '  Three polynomials of degree 8 on [1,3], split at four points.' )
+  print ( '  Result shape = %s' % ( str ( yleft.shape ) ) )
+  print ( '' )
+  print ( '         T    Max Difference   Max Difference' )
+  print ( '              on [A,T]         on [T,B]' )
+  print ( '' )
+
+  nval = 101
+  for i in range ( 0, t.shape[0] ):
+    ti = t[i,0]
+    xl = np.linspace ( a, ti, nval )
+    xr = np.linspace ( ti, b, nval )
+    dl = np.max ( np.abs ( \
+      bernstein_poly_ab_approx ( n, a, ti, yleft[i], nval, xl ) \
+      - bernstein_poly_ab_approx ( n, a, b, ydata, nval, xl ) ) )
+    dr = np.max ( np.abs ( \
+      bernstein_poly_ab_approx ( n, ti, b, yright[i], nval, xr ) \
+      - bernstein_poly_ab_approx ( n, a, b, ydata, nval, xr ) ) )
+    print ( '  %8.4f  %14.6g  %14.6g' % ( ti, dl, dr ) )
+#
+#  Restriction to several subintervals.
+#
+  print ( '' )
+  print ( '         C         D    Max Difference' )
+  print ( '' )
+
+  c = np.array ( [ 1.0, 1.5, 2.9, 3.0, 0.0 ] )
+  d = np.array ( [ 3.0, 2.5, 1.1, 1.0, 4.0 ] )
+
+  for i in range ( 0, c.size ):
+    zdata = bernstein_restrict ( ydata, c[i], d[i], a, b )
+    x = np.linspace ( min ( c[i], d[i] ), max ( c[i], d[i] ), nval )
+    diff = np.max ( np.abs ( \
+      bernstein_poly_ab_approx ( n, c[i], d[i], zdata, nval, x ) \
+      - bernstein_poly_ab_approx ( n, a, b, ydata, nval, x ) ) )
+    print ( '  %8.4f  %8.4f  %14.6g' % ( c[i], d[i], diff ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_SUBDIVIDE_TEST:' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_subdivide_test ( )
+  timestamp ( )
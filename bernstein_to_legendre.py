@@ -1,5 +1,119 @@
 #! /usr/bin/env python
 #
+#  The cache shared by the functions in this file.
+#
+#  ENTRIES maps a key ( FORWARD, N ) to a matrix, with the most recently
+#  used entry last.  At most SIZE matrices are kept.
+#
+import collections
+import threading
+
+bernstein_to_legendre_state = {
+  'entries': collections.OrderedDict ( ),
+  'size': 8,
+  'lock': threading.Lock ( ) }
+
+def bernstein_legendre_table ( n, forward ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_LEGENDRE_TABLE returns a Bernstein/Legendre matrix, with caching.
+#
+#  Discussion:
+#
+#    Column I of the Legendre-to-Bernstein matrix holds the Bernstein
+#    coefficients of the shifted Legendre polynomial of degree I.  As a
+#    function of the row index J, it is a discrete Chebyshev polynomial,
+#    that is, a Hahn polynomial with parameters 0 and 0, and so it satisfies
+#    the three-term recurrence, in J,
+#
+#      (J+1)*(J-N) * Y(J+1)
+#        = ( (J+1)*(J-N) + J*(J-N-1) + I*(I+1) ) * Y(J) - J*(J-N-1) * Y(J-1)
+#
+#    with Y(0) = (-1)^I, and the symmetry Y(N-J) = (-1)^I * Y(J).  So the
+#    matrix is built a row at a time, for all I at once, up to the middle
+#    row, and the remaining rows are copied, in O(N^2) operations.  The
+#    rows grow from the first to the middle, so that the recurrence is
+#    stable in that direction.
+#
+#    The Bernstein-to-Legendre matrix is its inverse, which is
+#
+#      A(I,J) = (2*I+1)/(N+1) * R(I) * B(J,I)
+#
+#    with R(I) = N! * (N+1)! / ( (N-I)! * (N+I+1)! ).  Its rows are built by
+#    the same recurrence, started from the scaled first row, so that the
+#    large entries of B are never formed.
+#
+#    The matrices are kept in a cache of the last 8 requested, and shared,
+#    so they are marked read-only.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the maximum degree of the polynomials.
+#
+#    Input, logical FORWARD, is true for the Bernstein-to-Legendre matrix,
+#    and false for the Legendre-to-Bernstein matrix.
+#
+#    Output, real A(N+1,N+1), the matrix.
+#
+  import numpy as np
+
+  state = bernstein_to_legendre_state
+  key = ( bool ( forward ), n )
+
+  with state['lock']:
+    a = state['entries'].get ( key )
+    if ( a is not None ):
+      state['entries'].move_to_end ( key )
+      return a
+
+  i = np.arange ( n + 1 )
+  sign = 1.0 - 2.0 * ( i % 2 )
+  lam = i * ( i + 1.0 )
+
+  y = np.zeros ( ( n + 1, n + 1 ) )
+
+  if ( forward ):
+    l = np.arange ( 1, n + 1 )
+    r = np.concatenate ( ( [ 1.0 ], np.cumprod ( ( n + 1 - l ) / ( n + 1 + l ) ) ) )
+    y[0] = sign * ( 2 * i + 1 ) / ( n + 1 ) * r
+  else:
+    y[0] = sign
+
+  half = n // 2
+  for j in range ( 0, half ):
+    b = ( j + 1.0 ) * ( j - n )
+    d = j * ( j - n - 1.0 )
+    if ( j == 0 ):
+      y[1] = ( b + lam ) * y[0] / b
+    else:
+      y[j+1] = ( ( b + d + lam ) * y[j] - d * y[j-1] ) / b
+
+  y[n-half:n+1] = y[half::-1] * sign
+
+  if ( forward ):
+    a = y.T.copy ( )
+  else:
+    a = y
+
+  a.flags.writeable = False
+
+  with state['lock']:
+    state['entries'][key] = a
+    state['entries'].move_to_end ( key )
+    while ( state['size'] < len ( state['entries'] ) ):
+      state['entries'].popitem ( last = False )
+
+  return a
+
 def bernstein_to_legendre ( n ):
 
 #*****************************************************************************80
@@ -13,13 +127,16 @@ def bernstein_to_legendre ( n ):
 #    the Legendre polynomials have been shifted to share the [0,1]
 #    interval of definition.
 #
+#    The matrix is built by a recurrence, in O(N^2) operations, and cached,
+#    by BERNSTEIN_LEGENDRE_TABLE.
+#
 #  Licensing:
 #
 #    This code is distributed under the GNU LGPL license.
 #
 #  Modified:
 #
-#    09 March 2016
+#    17 October 2026
 #
 #  Author:
 #
@@ -31,20 +148,7 @@ def bernstein_to_legendre ( n ):
 #
 #    Output, real A(N+1,N+1), the Bernstein-to-Legendre matrix.
 #
-  import numpy as np
-  from r8_choose import r8_choose
-  from r8_mop import r8_mop
-
-  a = np.zeros ( [ n + 1, n + 1 ] )
-
-  for i in range ( 0, n + 1 ):
-    for j in range ( 0, n + 1 ):
-      for k in range ( 0, i + 1 ):
-        a[i,j] = a[i,j] \
-          + r8_mop ( i + k ) * r8_choose ( i, k ) ** 2 \
-          / r8_choose ( n + i, j + k )
-      a[i,j] = a[i,j] * r8_choose ( n, j ) \
-        * ( 2 * i + 1 ) / ( n + i + 1 )
+  a = bernstein_legendre_table ( n, True ).copy ( )
 
   return a
 
@@ -109,13 +213,16 @@ def legendre_to_bernstein ( n ):
 #    the Legendre polynomials have been shifted to share the [0,1]
 #    interval of definition.
 #
+#    The matrix is built by a recurrence, in O(N^2) operations, and cached,
+#    by BERNSTEIN_LEGENDRE_TABLE.
+#
 #  Licensing:
 #
 #    This code is distributed under the GNU LGPL license.
 #
 #  Modified:
 #
-#    09 March 2016
+#    17 October 2026
 #
 #  Author:
 #
@@ -127,19 +234,7 @@ def legendre_to_bernstein ( n ):
 #
 #    Output, real A(N+1,N+1), the Legendre-to-Bernstein matrix.
 #
-  import numpy as np
-  from r8_choose import r8_choose
-  from r8_mop import r8_mop
-
-  a = np.zeros ( [ n + 1, n + 1 ] )
-
-  for i in range ( 0, n + 1 ):
-    for j in range ( 0, n + 1 ):
-      for k in range ( max ( 0, i + j - n ), min ( i, j ) + 1 ):
-        a[i,j] = a[i,j] \
-          + r8_mop ( j + k ) * r8_choose ( j, k ) ** 2 \
-          * r8_choose ( n - j, i - k )
-      a[i,j] = a[i,j] / r8_choose ( n, i )
+  a = bernstein_legendre_table ( n, False ).copy ( )
 
   return a
 
@@ -28,13 +28,20 @@ def bernstein_to_power ( n ):
 #   will have the Bernstein basis coefficients 
 #     P = A * B = ( 0, 3, -6, 3, 0 ).
 #
+#    The entries are A(I,J) = (-1)^(I-J) * C(I,J) * C(N,I), for J <= I,
+#    and are assembled all at once from the table of binomial coefficients
+#    returned by R8_CHOOSE_TABLE.
+#
+#    Some entries exceed the real range for N >= 653.  They are then returned
+#    as infinite or NaN, and a warning is printed.
+#
 #  Licensing:
 #
 #    This code is distributed under the GNU LGPL license.
 #
 #  Modified:
 #
-#    16 March 2016
+#    17 October 2026
 #
 #  Author:
 #
@@ -47,15 +54,21 @@ def bernstein_to_power ( n ):
 #    Output, real A(N+1,N+1), the Bernstein-to-Power matrix.
 #
   import numpy as np
-  from r8_choose import r8_choose
-  from r8_mop import r8_mop
+  from r8_choose_table import r8_choose_table
 
-  a = np.zeros ( [ n + 1, n + 1 ] )
+  c = r8_choose_table ( n )
+  i = np.arange ( n + 1 )[:,np.newaxis]
+  j = np.arange ( n + 1 )[np.newaxis,:]
 
-  for j in range ( 0, n + 1 ):
-    for i in range ( 0, j + 1 ):
-      a[n-i,n-j] = r8_mop ( j - i ) * r8_choose ( n - i, j - i ) \
-        * r8_choose ( n, i )
+  with np.errstate ( over = 'ignore', invalid = 'ignore' ):
+    a = np.where ( j <= i, \
+      ( 1 - 2 * ( ( i - j ) % 2 ) ) * c * c[n,:,np.newaxis], 0.0 )
+
+  if ( not np.all ( np.isfinite ( a ) ) ):
+    print ( '' )
+    print ( 'BERNSTEIN_TO_POWER - Warning!' )
+    print ( '  Some entries of the matrix exceed the real range for N = %d.' \
+      % ( n ) )
 
   return a
 
@@ -135,13 +148,17 @@ def power_to_bernstein ( n ):
 #   will have the Bernstein basis coefficients 
 #     B = A * P = ( 0, 3/4, 1/2, 0, 0 ).
 #
+#    The entries are A(I,J) = C(N-J,N-I) / C(N,N-I), for J <= I, which lie
+#    between 0 and 1.  They are assembled all at once by R8_CHOOSE_QUOTIENT,
+#    without forming the binomial coefficients, which overflow for N > 1029.
+#
 #  Licensing:
 #
 #    This code is distributed under the GNU LGPL license.
 #
 #  Modified:
 #
-#    16 March 2016
+#    17 October 2026
 #
 #  Author:
 #
@@ -154,13 +171,11 @@ def power_to_bernstein ( n ):
 #    Output, real A[0:N,0:N], the Power-to-Bernstein matrix.
 #
   import numpy as np
-  from r8_choose import r8_choose
+  from r8_choose_table import r8_choose_quotient
 
-  a = np.zeros ( [ n + 1, n + 1 ] )
+  q = r8_choose_quotient ( n )
 
-  for j in range ( 0, n + 1 ):
-    for i in range ( 0, j + 1 ):
-      a[n-i,n-j] = r8_choose ( j, i ) / r8_choose ( n, i )
+  a = np.ascontiguousarray ( q[::-1,::-1] )
 
   return a
 
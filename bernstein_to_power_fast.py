@@ -0,0 +1,433 @@
+#! /usr/bin/env python
+#
+def bernstein_power_shift ( n, xdata, forward, stable, tol ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POWER_SHIFT converts between Bernstein and power form by an FFT.
+#
+#  Discussion:
+#
+#    This is the common part of BERNSTEIN_TO_POWER_FAST and
+#    POWER_TO_BERNSTEIN_FAST.
+#
+#    If the power coefficients P(0:N) are reversed, to Q(M) = P(N-M), and
+#    shifted by 1,
+#
+#      D(K) = sum ( K <= M <= N ) C(M,K) * Q(M)
+#
+#    then the Bernstein coefficients are B(N-K) = D(K) / C(N,K).  The
+#    Taylor shift is a convolution, after scaling by factorials, so that
+#
+#      B(C) = C! / N! * sum ( R <= C ) P(R) * (N-R)! * 1 / (C-R)!
+#
+#    and, undoing the shift,
+#
+#      P(R) = N! / (N-R)! * sum ( C <= R ) B(C) / C! * (-1)^(R-C) / (R-C)!
+#
+#    Each convolution is formed by the FFT, in O(N*log(N)) operations.  The
+#    factorials are handled by their logarithms, and the sequences U and V
+#    are scaled by T^I, for the value of T which minimizes
+#
+#      EPS * log2(NFFT) * ||U|| * ||V|| * max S(K)
+#
+#    where S(K) undoes the scaling.  Each coefficient is then in error by
+#    at most about this much, plus the effect of the rounding of the
+#    logarithms in the exponential scaling factors.  E, the sum of these
+#    first order terms divided by a lower bound for the largest exact
+#    coefficient, bounds the relative error of the result.  It is infinite
+#    when the error may be as large as the result.
+#
+#    Only the conversion to power form is fast in practice.  There E stays
+#    below 1.0E-10 up to N = 400 or so, and the result is then much more
+#    accurate than that of the O(N^2) sweep, whose error grows like 2^N.
+#    Beyond N = 500 or so, neither method gives a useful result.  For the
+#    conversion to Bernstein form, the factorials vary so widely that E
+#    exceeds 1.0E-10 from about N = 25, and is infinite from about N = 80,
+#    while the O(N^2) sweep is accurate at any degree.
+#
+#    If STABLE is true, every polynomial for which E exceeds TOL is
+#    converted again by the O(N^2) sweep of BERNSTEIN_TO_POWER_OPERATOR,
+#    and the result with the smaller error bound is kept.  So, with the
+#    default TOL, the conversion to Bernstein form costs O(N^2) operations
+#    from about N = 25.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the polynomials.
+#
+#    Input, real XDATA(...,N+1), the coefficients to convert.
+#
+#    Input, logical FORWARD, is true for Bernstein to power, and false for
+#    power to Bernstein.
+#
+#    Input, logical STABLE, is true if inaccurate results are to be
+#    recomputed by the O(N^2) method.
+#
+#    Input, real TOL, the relative error bound allowed.
+#
+#    Output, real YDATA(...,N+1), the converted coefficients.
+#
+#    Output, real E(...), the bound on the relative error of each result,
+#    by whichever method was used.
+#
+  import numpy as np
+  from math import lgamma
+  from bernstein_to_power_operator import BernsteinPowerOperator
+
+  xdata = np.asarray ( xdata, dtype = np.float64 )
+
+  i = np.arange ( n + 1 )
+  lf = np.array ( [ lgamma ( k + 1.0 ) for k in range ( 0, n + 1 ) ] )
+#
+#  The sequences are XDATA * exp ( AL ) and SG * exp ( BE ), and the
+#  convolution is multiplied by exp ( GA ).
+#
+  if ( forward ):
+    al = - lf
+    be = - lf
+    sg = 1.0 - 2.0 * ( i % 2 )
+    ga = lf[n] - lf[::-1]
+  else:
+    al = lf[::-1]
+    be = - lf
+    sg = np.ones ( n + 1 )
+    ga = lf - lf[n]
+
+  nfft = 1
+  while ( nfft < 2 * n + 1 ):
+    nfft = 2 * nfft
+  eps = np.finfo ( float ).eps
+  c = 3.0 * eps * max ( 1.0, np.log2 ( nfft ) )
+#
+#  Choose the tilt.
+#
+  best = np.inf
+
+  for s in np.log ( np.geomspace ( 0.5, 2.0 * n + 1.0, 33 ) ):
+    a = al + i * s
+    b = be + i * s
+    sa = np.max ( a )
+    sb = np.max ( b )
+    g = np.max ( ga - i * s ) + sa + sb
+    g = g + np.log ( np.sqrt ( np.sum ( np.exp ( 2.0 * ( a - sa ) ) ) ) ) \
+      + np.log ( np.sqrt ( np.sum ( np.exp ( 2.0 * ( b - sb ) ) ) ) )
+    if ( g < best ):
+      best = g
+      tilt = ( s, sa, sb )
+
+  s, sa, sb = tilt
+
+  ua = al + i * s - sa
+  vb = be + i * s - sb
+  yg = ga - i * s + sa + sb
+
+  u = xdata * np.exp ( ua )
+  v = sg * np.exp ( vb )
+
+  w = np.fft.irfft ( np.fft.rfft ( u, nfft, axis = -1 ) \
+    * np.fft.rfft ( v, nfft ), nfft, axis = -1 )[...,0:n+1]
+#
+#  The error of each entry of W is at most C * ||U|| * ||V||, and is
+#  multiplied by the same factor as the entry.  The exponents are sums of
+#  logarithms of factorials, each in error by about EPS times its size,
+#  and EXP passes these errors on as relative ones.
+#
+  unorm = np.sqrt ( np.sum ( u ** 2, axis = -1 ) )
+  vnorm = np.sqrt ( np.sum ( v ** 2 ) )
+  ix = np.abs ( i * s )
+  ea = np.max ( np.abs ( al ) + ix ) + abs ( sa )
+  eb = np.max ( np.abs ( be ) + ix ) + abs ( sb )
+  eg = 2.0 * lf[n] + ix + abs ( sa ) + abs ( sb )
+  c = c + 2.0 * eps * ( ea + eb )
+
+  with np.errstate ( over = 'ignore', invalid = 'ignore' ):
+    scale = np.exp ( yg )
+    ydata = w * scale
+    emax = np.max ( c * unorm[...,np.newaxis] * vnorm * scale \
+      + 2.0 * eps * ( 1.0 + eg ) * np.abs ( ydata ), axis = -1 )
+
+  e = bernstein_power_relative ( ydata, emax )
+
+  if ( stable ):
+    bad = ~ ( e <= tol )
+    if ( np.any ( bad ) ):
+      xbad = xdata[bad]
+      with np.errstate ( over = 'ignore', invalid = 'ignore' ):
+        ybad = BernsteinPowerOperator ( n, forward ).apply ( xbad )
+#
+#  For power to Bernstein, each step of the sweep adds multiples, by
+#  weights in [0,1], of sums of at most sum |P|.  For Bernstein to power,
+#  the differences of the sweep may grow far beyond the result, and the
+#  bound is carried along with them, step by step.
+#
+      if ( forward ):
+        w = xbad.copy ( )
+        a = np.zeros ( xbad.shape )
+        emax = np.zeros ( xbad.shape[0:-1] )
+        with np.errstate ( over = 'ignore', invalid = 'ignore' ):
+          for r in range ( 0, n + 1 ):
+            d = n - r
+            emax = np.maximum ( emax, a[...,0] )
+            t = d / np.arange ( 1, d + 1 )
+            a = ( a[...,1:] + a[...,0:1] \
+              + eps * ( np.abs ( w[...,1:] ) + np.abs ( w[...,0:1] ) ) ) * t
+            w = ( w[...,1:] - w[...,0:1] ) * t
+            a = a + 2.0 * eps * np.abs ( w )
+      else:
+        emax = 3.0 * ( n + 1 ) * eps * np.sum ( np.abs ( xbad ), axis = -1 )
+      ebad = bernstein_power_relative ( ybad, emax )
+#
+#  Keep whichever result has the smaller bound.
+#
+      better = ebad < e[bad]
+      ydata[bad] = np.where ( better[...,np.newaxis], ybad, ydata[bad] )
+      e[bad] = np.where ( better, ebad, e[bad] )
+
+  return ydata, e
+
+def bernstein_power_relative ( ydata, emax ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_POWER_RELATIVE turns an absolute error bound into a relative one.
+#
+#  Discussion:
+#
+#    If every coefficient of a result Y is in error by at most EMAX, then
+#    the largest exact coefficient is at least max |Y| - EMAX, and the
+#    error relative to it is at most EMAX / ( max |Y| - EMAX ).  This is
+#    infinite if max |Y| <= EMAX, when nothing is known of the result.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, real YDATA(...,N+1), the computed results.
+#
+#    Input, real EMAX(...), the bound on the error of each coefficient.
+#
+#    Output, real E(...), the bound on the relative error.
+#
+  import numpy as np
+
+  with np.errstate ( over = 'ignore', invalid = 'ignore', divide = 'ignore' ):
+    ymax = np.max ( np.abs ( ydata ), axis = -1 )
+    e = np.where ( emax < ymax, emax / ( ymax - emax ), np.inf )
+  e = np.where ( emax == 0.0, 0.0, e )
+
+  return e
+
+def bernstein_to_power_fast ( n, bdata, stable = True, tol = 1.0E-10 ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_TO_POWER_FAST converts Bernstein coefficients to power form by an FFT.
+#
+#  Discussion:
+#
+#    The result is BERNSTEIN_TO_POWER ( N ) @ B, for a vector B, with the
+#    same conventions: B(0:N) are the coefficients of the Bernstein
+#    polynomials of degree N on [0,1], and P(0:N) those of 1, X, ..., X^N.
+#    The reversed ordering which appears in the code of BERNSTEIN_TO_POWER
+#    only concerns the way its loops fill the matrix.
+#
+#    The conversion is a Taylor shift by -1, carried out by an FFT, in
+#    O(N*log(N)) operations.  See BERNSTEIN_POWER_SHIFT for the error bound,
+#    and the fallback to the O(N^2) method when STABLE is true.
+#
+#    The result is accurate, to within the default TOL, up to N = 400 or so.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the polynomials.
+#
+#    Input, real BDATA(N+1), the Bernstein coefficients, or an array of
+#    shape S+(N+1) holding several polynomials.
+#
+#    Input, logical STABLE, is true if inaccurate results are to be
+#    recomputed by the O(N^2) method.
+#
+#    Input, real TOL, the relative error bound allowed.
+#
+#    Output, real PDATA(N+1), the power coefficients, with the shape of BDATA.
+#
+#    Output, real E, the bound on the relative error of each result, with
+#    shape S.
+#
+  return bernstein_power_shift ( n, bdata, True, stable, tol )
+
+def power_to_bernstein_fast ( n, pdata, stable = True, tol = 1.0E-10 ):
+
+#*****************************************************************************80
+#
+## POWER_TO_BERNSTEIN_FAST converts power coefficients to Bernstein form by an FFT.
+#
+#  Discussion:
+#
+#    The result is POWER_TO_BERNSTEIN ( N ) @ P, for a vector P, with the
+#    conventions of BERNSTEIN_TO_POWER_FAST.
+#
+#    The conversion is a Taylor shift by 1, carried out by an FFT, in
+#    O(N*log(N)) operations.  See BERNSTEIN_POWER_SHIFT for the error bound,
+#    and the fallback to the O(N^2) method when STABLE is true.
+#
+#    Only low degrees gain from the FFT: from about N = 25, with the default
+#    TOL, every polynomial is converted by the O(N^2) sweep.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the polynomials.
+#
+#    Input, real PDATA(N+1), the power coefficients, or an array of
+#    shape S+(N+1) holding several polynomials.
+#
+#    Input, logical STABLE, is true if inaccurate results are to be
+#    recomputed by the O(N^2) method.
+#
+#    Input, real TOL, the relative error bound allowed.
+#
+#    Output, real BDATA(N+1), the Bernstein coefficients, with the shape
+#    of PDATA.
+#
+#    Output, real E, the bound on the relative error of each result, with
+#    shape S.
+#
+  return bernstein_power_shift ( n, pdata, False, stable, tol )
+
+def bernstein_to_power_fast_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_TO_POWER_FAST_TEST tests BERNSTEIN_TO_POWER_FAST and POWER_TO_BERNSTEIN_FAST.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  from fractions import Fraction
+  from math import comb
+  from bernstein_to_power_operator import power_to_bernstein_operator
+
+  print ( '' )
+  print ( 'BERNSTEIN_TO_POWER_FAST_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_TO_POWER_FAST and POWER_TO_BERNSTEIN_FAST convert' )
+  print ( '  between Bernstein and power coefficients by an FFT.' )
+#
+#  The example of BERNSTEIN_TO_POWER.
+#
+  b = np.array ( [ 0.0, 0.75, 0.5, 0.0, 0.0 ] )
+  p, e = bernstein_to_power_fast ( 4, b )
+
+  print ( '' )
+  print ( '  B =     ', b )
+  print ( '  P =     ', p, ' error bound %g' % ( e ) )
+  b, e = power_to_bernstein_fast ( 4, p )
+  print ( '  and back', b, ' error bound %g' % ( e ) )
+#
+#  Random polynomials, without the fallback.  The power coefficients are
+#  compared with exact ones, and the Bernstein coefficients with those of
+#  the O(N^2) sweep.
+#
+  rng = np.random.default_rng ( 123456789 )
+
+  print ( '' )
+  print ( '  Without the fallback, relative errors and bounds:' )
+  print ( '' )
+  print ( '     N       B to P         bound       P to B         bound' )
+  print ( '' )
+
+  for n in [ 4, 8, 16, 32, 48 ]:
+
+    x = rng.standard_normal ( n + 1 )
+
+    p1 = np.zeros ( n + 1 )
+    for r in range ( 0, n + 1 ):
+      p1[r] = float ( sum ( Fraction ( ( -1 ) ** ( r - c ) * comb ( r, c ) \
+        * comb ( n, r ) ) * Fraction ( x[c] ) for c in range ( 0, r + 1 ) ) )
+    p2, e1 = bernstein_to_power_fast ( n, x, False )
+    d1 = np.max ( np.abs ( p2 - p1 ) ) / np.max ( np.abs ( p1 ) )
+
+    b1 = power_to_bernstein_operator ( n ).apply ( x )
+    b2, e2 = power_to_bernstein_fast ( n, x, False )
+    d2 = np.max ( np.abs ( b2 - b1 ) ) / np.max ( np.abs ( b1 ) )
+
+    print ( '  %4d  %12.4g  %12.4g  %12.4g  %12.4g' % ( n, d1, e1, d2, e2 ) )
+#
+#  With the fallback, at larger degrees.  The power to Bernstein conversion
+#  is then done by the O(N^2) sweep.
+#
+  print ( '' )
+  print ( '  With the fallback, largest relative errors and bounds:' )
+  print ( '' )
+  print ( '     N       B to P         bound       P to B         bound' )
+  print ( '' )
+
+  for n in [ 100, 200 ]:
+
+    x = rng.standard_normal ( ( 10, n + 1 ) )
+
+    p1 = np.zeros ( ( 10, n + 1 ) )
+    for k in range ( 0, 10 ):
+      for r in range ( 0, n + 1 ):
+        p1[k,r] = float ( sum ( Fraction ( ( -1 ) ** ( r - c ) * comb ( r, c ) \
+          * comb ( n, r ) ) * Fraction ( x[k,c] ) for c in range ( 0, r + 1 ) ) )
+    p2, e1 = bernstein_to_power_fast ( n, x )
+    d1 = np.max ( np.abs ( p2 - p1 ), axis = -1 ) / np.max ( np.abs ( p1 ), axis = -1 )
+
+    b1 = power_to_bernstein_operator ( n ).apply ( x )
+    b2, e2 = power_to_bernstein_fast ( n, x )
+    d2 = np.max ( np.abs ( b2 - b1 ), axis = -1 ) / np.max ( np.abs ( b1 ), axis = -1 )
+
+    print ( '  %4d  %12.4g  %12.4g  %12.4g  %12.4g' \
+      % ( n, np.max ( d1 ), np.max ( e1 ), np.max ( d2 ), np.max ( e2 ) ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_TO_POWER_FAST_TEST:' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_to_power_fast_test ( )
+  timestamp ( )
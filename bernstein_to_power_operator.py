@@ -0,0 +1,274 @@
+#! /usr/bin/env python
+#
+class BernsteinPowerOperator:
+
+#*****************************************************************************80
+#
+## BERNSTEINPOWEROPERATOR applies a Bernstein/power conversion without a matrix.
+#
+#  Discussion:
+#
+#    An object of this class behaves like the (N+1)x(N+1) matrix returned
+#    by BERNSTEIN_TO_POWER ( N ) or POWER_TO_BERNSTEIN ( N ), under the
+#    methods MATVEC, MATMAT and the @ operator, but the matrix is never
+#    formed.  Instead, the conversion is carried out by a triangular sweep,
+#    in O(N^2) operations and O(N) memory per vector.
+#
+#    Objects are made by BERNSTEIN_TO_POWER_OPERATOR and
+#    POWER_TO_BERNSTEIN_OPERATOR.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  def __init__ ( self, n, forward ):
+    self.n = n
+    self.forward = forward
+    self.shape = ( n + 1, n + 1 )
+    self.dtype = float
+
+  def apply ( self, x ):
+
+#*****************************************************************************80
+#
+## APPLY converts coefficient vectors held along the last axis of X.
+#
+#  Discussion:
+#
+#    The power coefficients P(0:N) and the Bernstein coefficients B(0:N),
+#    on [0,1], of the same polynomial are related by Horner's rule.  If
+#    Q(0:D) are the Bernstein coefficients of degree D of a polynomial Q,
+#    then P(R) + X * Q(X) has the Bernstein coefficients of degree D+1
+#
+#      P(R),  P(R) + K/(D+1) * Q(K-1),  1 <= K <= D+1
+#
+#    So the Bernstein coefficients are formed by this step, for R = N-1
+#    down to 0, starting from Q = P(N).  The steps are undone, in reverse
+#    order, to get the power coefficients.  This is the factored form of
+#    the conversion matrices, a Pascal-type sweep of differences or sums
+#    between diagonal binomial scalings, with the scalings spread over the
+#    steps, so that no binomial coefficient is formed, and none overflows.
+#
+#  Parameters:
+#
+#    Input, real X(...,N+1), one or more coefficient vectors.
+#
+#    Output, real Y(...,N+1), the converted vectors.
+#
+    import numpy as np
+
+    x = np.asarray ( x, dtype = np.float64 )
+    n = self.n
+    y = np.empty ( x.shape )
+
+    if ( self.forward ):
+#
+#  Bernstein to power.
+#
+      w = x.copy ( )
+      for r in range ( 0, n + 1 ):
+        d = n - r
+        y[...,r] = w[...,0]
+        w = ( w[...,1:] - w[...,0:1] ) * d / np.arange ( 1, d + 1 )
+
+    else:
+#
+#  Power to Bernstein.
+#
+      w = x[...,n:n+1].copy ( )
+      for r in range ( n - 1, -1, -1 ):
+        d = n - r - 1
+        p = x[...,r:r+1]
+        w = np.concatenate ( ( p, p + w * np.arange ( 1, d + 2 ) / ( d + 1 ) ), \
+          axis = -1 )
+      y[...] = w
+
+    return y
+
+  def matvec ( self, x ):
+    return self.apply ( x )
+
+  def matmat ( self, x ):
+    import numpy as np
+    return np.swapaxes ( self.apply ( np.swapaxes ( x, 0, -1 ) ), 0, -1 )
+
+  def __matmul__ ( self, x ):
+    import numpy as np
+    if ( np.ndim ( x ) == 1 ):
+      return self.matvec ( x )
+    return self.matmat ( x )
+
+def bernstein_to_power_operator ( n ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_TO_POWER_OPERATOR returns the Bernstein-to-Power operator.
+#
+#  Discussion:
+#
+#    The result A satisfies A @ B = BERNSTEIN_TO_POWER ( N ) @ B, up to
+#    rounding, for a vector B, and A @ X for an array X of shape (N+1,K)
+#    converts each column.  A.MATVEC and A.APPLY convert vectors held along
+#    the last axis, so A.APPLY ( Y ) converts each row of Y(K,N+1).
+#
+#    This costs O(N^2) operations and O(N) memory per vector.
+#
+#    The conversion to power form is badly conditioned, whichever way it
+#    is done.  Rounding errors in B may be amplified by up to about 2^N,
+#    and the power coefficients may overflow, for large N, unless the
+#    differences of B are small or exact.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the polynomials.
+#
+#    Output, BernsteinPowerOperator A, the operator.
+#
+  return BernsteinPowerOperator ( n, True )
+
+def power_to_bernstein_operator ( n ):
+
+#*****************************************************************************80
+#
+## POWER_TO_BERNSTEIN_OPERATOR returns the Power-to-Bernstein operator.
+#
+#  Discussion:
+#
+#    The result A satisfies A @ P = POWER_TO_BERNSTEIN ( N ) @ P, up to
+#    rounding, as for BERNSTEIN_TO_POWER_OPERATOR.
+#
+#    This costs O(N^2) operations and O(N) memory per vector.  All the
+#    weights in the sweep are between 0 and 1, so the result is accurate
+#    to about N*EPS times the size of the terms.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the degree of the polynomials.
+#
+#    Output, BernsteinPowerOperator A, the operator.
+#
+  return BernsteinPowerOperator ( n, False )
+
+def bernstein_to_power_operator_test ( ):
+
+#*****************************************************************************80
+#
+## BERNSTEIN_TO_POWER_OPERATOR_TEST tests the conversion operators.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  import time
+  from math import comb
+  from bernstein_to_power import bernstein_to_power
+  from bernstein_to_power import power_to_bernstein
+
+  print ( '' )
+  print ( 'BERNSTEIN_TO_POWER_OPERATOR_TEST:' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  BERNSTEIN_TO_POWER_OPERATOR and POWER_TO_BERNSTEIN_OPERATOR' )
+  print ( '  convert coefficients without forming the matrices.' )
+#
+#  The example of BERNSTEIN_TO_POWER.
+#
+  b = np.array ( [ 0.0, 0.75, 0.5, 0.0, 0.0 ] )
+  a = bernstein_to_power_operator ( 4 )
+  p = a @ b
+
+  print ( '' )
+  print ( '  B =     ', b )
+  print ( '  A @ B = ', p )
+  print ( '  and back', power_to_bernstein_operator ( 4 ) @ p )
+#
+#  Compare with the matrices, for several columns at once.
+#
+  rng = np.random.default_rng ( 123456789 )
+
+  print ( '' )
+  print ( '     N  Max difference from the matrices' )
+  print ( '        B to P          P to B' )
+  print ( '' )
+
+  for n in [ 5, 10, 20, 40 ]:
+    x = rng.standard_normal ( ( n + 1, 3 ) )
+    d1 = np.max ( np.abs ( bernstein_to_power_operator ( n ) @ x \
+      - np.dot ( bernstein_to_power ( n ), x ) ) \
+      / np.max ( np.abs ( np.dot ( bernstein_to_power ( n ), x ) ) ) )
+    d2 = np.max ( np.abs ( power_to_bernstein_operator ( n ) @ x \
+      - np.dot ( power_to_bernstein ( n ), x ) ) )
+    print ( '  %4d  %14.6g  %14.6g' % ( n, d1, d2 ) )
+#
+#  A large degree, where the matrices would take 3.2 GB each.
+#  P(X) = sum ( 0 <= I <= 10 ) (X/2)^I has the Bernstein coefficients
+#  B(K) = sum ( I ) C(K,I) / C(N,I) / 2^I.
+#
+  n = 20000
+  p = np.zeros ( n + 1 )
+  p[0:11] = 0.5 ** np.arange ( 11 )
+
+  t = time.time ( )
+  b = power_to_bernstein_operator ( n ).matvec ( p )
+  t = time.time ( ) - t
+
+  k = [ 0, 1, 100, 5000, 19999, 20000 ]
+  exact = np.zeros ( len ( k ) )
+  for i in range ( 0, 11 ):
+    exact = exact + np.array ( [ comb ( kk, i ) / comb ( n, i ) for kk in k ] ) \
+      * p[i]
+
+  print ( '' )
+  print ( '  N = %d, power to Bernstein took %g seconds.' % ( n, t ) )
+  print ( '  Max error in B(K), K in', k, ': %g' \
+    % ( np.max ( np.abs ( b[k] - exact ) ) ) )
+#
+#  B(K) = K^2 are the Bernstein coefficients of N*X + N*(N-1)*X^2.
+#
+  b = np.arange ( n + 1 ) ** 2.0
+
+  t = time.time ( )
+  p = bernstein_to_power_operator ( n ).matvec ( b )
+  t = time.time ( ) - t
+
+  print ( '  Bernstein to power took %g seconds.' % ( t ) )
+  print ( '  P(0:4) =', p[0:4], ', N*(N-1) = %d' % ( n * ( n - 1 ) ) )
+  print ( '  Max |P(3:N)| = %g' % ( np.max ( np.abs ( p[3:] ) ) ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'BERNSTEIN_TO_POWER_OPERATOR_TEST:' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  bernstein_to_power_operator_test ( )
+  timestamp ( )
@@ -0,0 +1,131 @@
+#! /usr/bin/env python
+#
+def output_array ( out, shape, dtype, name ):
+
+#*****************************************************************************80
+#
+## OUTPUT_ARRAY returns the array into which a result is to be written.
+#
+#  Discussion:
+#
+#    Several functions accept an optional output target OUT.  It may be
+#
+#    * None, in which case a new array of zeros is returned;
+#
+#    * an array, such as an np.memmap, which must have the given shape,
+#      and is returned unchanged;
+#
+#    * a file name, in which case a new .npy file of the given shape
+#      and type is created, and is returned mapped into memory, so that
+#      the caller can fill it piece by piece without ever holding the
+#      whole result in memory.  The file can be opened later by
+#      np.load ( filename, mmap_mode = 'r' ).
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    16 October 2026
+#
+#  Parameters:
+#
+#    Input, OUT, None, an array, or a file name.
+#
+#    Input, tuple SHAPE, the shape of the result.
+#
+#    Input, dtype DTYPE, the type of a newly created result.
+#    If DTYPE is None, float64 is used.
+#
+#    Input, string NAME, the name of the calling function, for
+#    error messages.
+#
+#    Output, real Y(SHAPE), the array to be written.
+#
+  import numpy as np
+  from sys import exit
+
+  if ( dtype is None ):
+    dtype = np.float64
+
+  if ( out is None ):
+
+    y = np.zeros ( shape, dtype = dtype )
+
+  elif ( isinstance ( out, str ) ):
+
+    y = np.lib.format.open_memmap ( out, mode = 'w+', dtype = dtype, \
+      shape = shape )
+
+  else:
+
+    y = out
+
+    if ( tuple ( y.shape ) != tuple ( shape ) ):
+      print ( '' )
+      print ( '%s - Fatal error!' % ( name ) )
+      print ( '  OUT has shape %s, but %s is required.' \
+        % ( str ( tuple ( y.shape ) ), str ( tuple ( shape ) ) ) )
+      exit ( '%s - Fatal error!' % ( name ) )
+
+  return y
+
+def output_array_test ( ):
+
+#*****************************************************************************80
+#
+## OUTPUT_ARRAY_TEST tests OUTPUT_ARRAY.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    16 October 2026
+#
+  import numpy as np
+  import os
+  import platform
+  import tempfile
+
+  print ( '' )
+  print ( 'OUTPUT_ARRAY_TEST' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  OUTPUT_ARRAY returns an array, or a memory mapped file,' )
+  print ( '  to receive a result.' )
+
+  y = output_array ( None, ( 2, 3 ), None, 'OUTPUT_ARRAY_TEST' )
+  print ( '' )
+  print ( '  None:      %s, shape %s' % ( type ( y ).__name__, str ( y.shape ) ) )
+
+  z = np.ones ( ( 2, 3 ) )
+  y = output_array ( z, ( 2, 3 ), None, 'OUTPUT_ARRAY_TEST' )
+  print ( '  Array:     same object = %s' % ( y is z ) )
+
+  dirname = tempfile.mkdtemp ( )
+  filename = os.path.join ( dirname, 'output_array_test.npy' )
+  y = output_array ( filename, ( 2, 3 ), np.float32, 'OUTPUT_ARRAY_TEST' )
+  y[1,:] = 7.0
+  y.flush ( )
+  del y
+  y = np.load ( filename, mmap_mode = 'r' )
+  print ( '  File name: %s, shape %s, type %s, row 1 = %s' \
+    % ( type ( y ).__name__, str ( y.shape ), y.dtype, str ( y[1,:] ) ) )
+  del y
+  os.remove ( filename )
+  os.rmdir ( dirname )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'OUTPUT_ARRAY_TEST' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  output_array_test ( )
+  timestamp ( )
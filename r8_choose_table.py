@@ -0,0 +1,203 @@
+#! /usr/bin/env python
+#
+#  The table shared by the functions in this file.
+#
+#  TABLE holds the largest Pascal triangle built so far, or None.
+#
+import threading
+
+r8_choose_table_state = {
+  'table': None,
+  'lock': threading.Lock ( ) }
+
+def r8_choose_table ( n ):
+
+#*****************************************************************************80
+#
+## R8_CHOOSE_TABLE returns a table of the binomial coefficients C(0:N,0:N).
+#
+#  Discussion:
+#
+#    The table is Pascal's triangle, built a row at a time from
+#
+#      C(I,J) = C(I-1,J-1) + C(I-1,J)
+#
+#    so that every entry below 2^53 is the exact integer, and the larger
+#    ones are accurate to a few rounding errors.  Entries overflow to
+#    infinity for I > 1029.
+#
+#    The largest table built so far is kept, and smaller ones are returned
+#    as its leading part, so that repeated calls cost nothing.  The
+#    returned array is shared, and is marked read-only.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer N, the largest value of N in the table.
+#
+#    Output, real C(N+1,N+1), C(I,J) is the binomial coefficient for
+#    0 <= J <= I <= N, and 0 for J > I.
+#
+  import numpy as np
+
+  state = r8_choose_table_state
+
+  with state['lock']:
+
+    table = state['table']
+
+    if ( table is None or table.shape[0] <= n ):
+
+      c = np.zeros ( ( n + 1, n + 1 ) )
+      c[:,0] = 1.0
+      with np.errstate ( over = 'ignore' ):
+        for i in range ( 1, n + 1 ):
+          c[i,1:i+1] = c[i-1,0:i] + c[i-1,1:i+1]
+
+      c.flags.writeable = False
+      state['table'] = c
+      table = c
+
+  return table[0:n+1,0:n+1]
+
+def r8_choose_quotient ( m ):
+
+#*****************************************************************************80
+#
+## R8_CHOOSE_QUOTIENT returns the quotients C(J,I) / C(M,I) of binomial coefficients.
+#
+#  Discussion:
+#
+#    The quotients lie between 0 and 1, even where the binomial coefficients
+#    themselves overflow, as they do for M > 1029.  So they are not formed
+#    from R8_CHOOSE_TABLE, but as products, down each column, of the ratios
+#
+#      Q(I,J) = Q(I-1,J) * ( J - I + 1 ) / ( M - I + 1 )
+#
+#    starting from Q(0,J) = 1.  Entry Q(I,J) is accurate to about I rounding
+#    errors, and very small entries underflow harmlessly to zero.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer M, the common row of the denominators.
+#
+#    Output, real Q(M+1,M+1), Q(I,J) = C(J,I) / C(M,I) for 0 <= I <= J <= M,
+#    and 0 for I > J.
+#
+  import numpy as np
+
+  i = np.arange ( 1, m + 1 )[:,np.newaxis]
+  j = np.arange ( 0, m + 1 )[np.newaxis,:]
+
+  q = np.ones ( ( m + 1, m + 1 ) )
+
+  with np.errstate ( under = 'ignore' ):
+    np.cumprod ( np.maximum ( j - i + 1, 0 ) / ( m - i + 1 ), axis = 0, \
+      out = q[1:m+1,:] )
+
+  return q
+
+def r8_choose_table_test ( ):
+
+#*****************************************************************************80
+#
+## R8_CHOOSE_TABLE_TEST tests R8_CHOOSE_TABLE and R8_CHOOSE_QUOTIENT.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+  import time
+  from math import comb
+  from r8_choose import r8_choose
+
+  print ( '' )
+  print ( 'R8_CHOOSE_TABLE_TEST' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  R8_CHOOSE_TABLE returns a table of C(N,K).' )
+  print ( '  R8_CHOOSE_QUOTIENT returns the quotients C(J,I)/C(M,I).' )
+
+  c = r8_choose_table ( 5 )
+
+  print ( '' )
+  print ( '         N         K       CNK  R8_CHOOSE' )
+
+  for n in range ( 0, 6 ):
+    print ( '' )
+    for k in range ( 0, n + 1 ):
+      print ( '  %8d  %8d  %14.6g  %14.6g' % ( n, k, c[n,k], r8_choose ( n, k ) ) )
+#
+#  Compare with the exact values.
+#
+  print ( '' )
+  print ( '     N  Max relative error' )
+  print ( '' )
+
+  c = r8_choose_table ( 1000 )
+
+  for n in [ 10, 50, 100, 500, 1000 ]:
+    exact = np.array ( [ float ( comb ( n, k ) ) for k in range ( 0, n + 1 ) ] )
+    e = np.max ( np.abs ( c[n,0:n+1] - exact ) / exact )
+    print ( '  %4d  %14.6g' % ( n, e ) )
+#
+#  Repeated calls use the stored table.
+#
+  t = time.time ( )
+  c = r8_choose_table ( 800 )
+  t = time.time ( ) - t
+
+  print ( '' )
+  print ( '  Second call, for N = 800, took %g seconds.' % ( t ) )
+  print ( '  Writeable = %s' % ( c.flags.writeable ) )
+#
+#  The quotients stay finite where the binomial coefficients overflow.
+#
+  m = 2000
+
+  t = time.time ( )
+  q = r8_choose_quotient ( m )
+  t = time.time ( ) - t
+
+  e = 0.0
+  for i, j in [ ( 1, 1 ), ( 100, 1500 ), ( 700, 1999 ), ( 1000, 2000 ) ]:
+    exact = comb ( j, i ) / comb ( m, i )
+    e = max ( e, abs ( q[i,j] - exact ) / exact )
+
+  print ( '' )
+  print ( '  R8_CHOOSE_QUOTIENT ( %d ) took %g seconds.' % ( m, t ) )
+  print ( '  All entries finite = %s' % ( np.all ( np.isfinite ( q ) ) ) )
+  print ( '  Max relative error of sample entries = %g' % ( e ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'R8_CHOOSE_TABLE_TEST' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  r8_choose_table_test ( )
+  timestamp ( )
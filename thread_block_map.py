@@ -0,0 +1,112 @@
+#! /usr/bin/env python
+#
+def thread_block_map ( m, workers, func ):
+
+#*****************************************************************************80
+#
+## THREAD_BLOCK_MAP applies a function to contiguous blocks of a range, using threads.
+#
+#  Discussion:
+#
+#    The range 0 <= I < M is divided into WORKERS contiguous blocks of
+#    nearly equal size, and FUNC(LO,HI) is called once for each block,
+#    on a ThreadPoolExecutor with WORKERS threads.  The function returns
+#    when all the calls have finished.  An exception raised by any call
+#    is raised again here.
+#
+#    This only pays off if FUNC spends most of its time in operations
+#    which release the global interpreter lock, such as NumPy ufuncs
+#    acting on large arrays.  Each call should write its results into
+#    its own part of a shared output array.
+#
+#    If WORKERS is None or 1, FUNC(0,M) is simply called directly.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+#  Parameters:
+#
+#    Input, integer M, the size of the range.
+#
+#    Input, integer WORKERS, the number of threads.
+#
+#    Input, function FUNC(LO,HI), the function to be applied to the
+#    block LO <= I < HI.
+#
+  from concurrent.futures import ThreadPoolExecutor
+
+  if ( workers is None or workers <= 1 or m < 2 ):
+    func ( 0, m )
+    return
+
+  nblock = min ( workers, m )
+  bounds = [ ( i * m ) // nblock for i in range ( 0, nblock + 1 ) ]
+
+  with ThreadPoolExecutor ( max_workers = nblock ) as executor:
+
+    tasks = [ executor.submit ( func, bounds[i], bounds[i+1] ) \
+      for i in range ( 0, nblock ) ]
+
+    for task in tasks:
+      task.result ( )
+
+  return
+
+def thread_block_map_test ( ):
+
+#*****************************************************************************80
+#
+## THREAD_BLOCK_MAP_TEST tests THREAD_BLOCK_MAP.
+#
+#  Licensing:
+#
+#    This code is distributed under the GNU LGPL license.
+#
+#  Modified:
+#
+#    17 October 2026
+#
+  import numpy as np
+  import platform
+
+  print ( '' )
+  print ( 'THREAD_BLOCK_MAP_TEST' )
+  print ( '  Python version: %s' % ( platform.python_version ( ) ) )
+  print ( '  THREAD_BLOCK_MAP applies a function to blocks of a range.' )
+  print ( '' )
+  print ( '         M  Workers  Blocks    Max Error' )
+  print ( '' )
+
+  for m in [ 1, 10, 1000001 ]:
+    for workers in [ None, 1, 3, 8 ]:
+
+      x = np.linspace ( 0.0, 1.0, m )
+      y = np.zeros ( m )
+      blocks = [ ]
+
+      def func ( lo, hi ):
+        y[lo:hi] = np.sqrt ( x[lo:hi] )
+        blocks.append ( ( lo, hi ) )
+
+      thread_block_map ( m, workers, func )
+
+      print ( '  %8d  %7s  %6d  %11g' % ( m, str ( workers ), len ( blocks ), \
+        np.max ( np.abs ( y - np.sqrt ( x ) ) ) ) )
+#
+#  Terminate.
+#
+  print ( '' )
+  print ( 'THREAD_BLOCK_MAP_TEST' )
+  print ( '  Normal end of execution.' )
+  return
+
+if ( __name__ == '__main__' ):
+  from timestamp import timestamp
+  timestamp ( )
+  thread_block_map_test ( )
+  timestamp ( )